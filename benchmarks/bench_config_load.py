@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+配置加载基准 - 对比解析JSON并校验与读取二进制配置缓存的启动加载耗时
+
+生成包含大量快捷键的配置文件，分别测量关闭缓存（每次解析JSON、迁移并校验）
+和缓存命中（读取 marshal 缓存后直接创建配置模型）时 ConfigManager.load_config 的耗时。
+
+使用方法:
+    python benchmarks/bench_config_load.py [每组快捷键数]
+"""
+
+import contextlib
+import io
+import json
+import marshal
+import os
+import struct
+import sys
+import tempfile
+import time
+
+# 确保项目根目录在sys.path中
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.config import ConfigManager
+from utils.config_model import SCHEMA_VERSION, SHORTCUT_SECTIONS
+from utils.constants import DEFAULT_APPEARANCE, DEFAULT_EFFECTS
+
+DEFAULT_ITEMS_PER_GROUP = 5000
+REPEAT = 10
+
+
+def _build_config(items_per_group: int) -> dict:
+    """生成每组包含指定数量快捷键的配置"""
+    config = {"schema_version": SCHEMA_VERSION}
+    for section in SHORTCUT_SECTIONS:
+        config[section] = [
+            {"key": f"F{index % 12 + 1}+{index}", "action": f"{section} 动作 {index}"}
+            for index in range(items_per_group)
+        ]
+    config["appearance"] = dict(DEFAULT_APPEARANCE)
+    config["effects"] = dict(DEFAULT_EFFECTS)
+    return config
+
+
+def _best_load_ms(path: str, use_cache: bool) -> float:
+    """测量新建配置管理器并加载配置的最短耗时（毫秒），与启动时的流程一致"""
+    best = float("inf")
+    for _ in range(REPEAT):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            manager = ConfigManager(path, use_cache=use_cache)
+            manager.load_config()
+            elapsed = (time.perf_counter() - started) * 1000
+        best = min(best, elapsed)
+    return best
+
+
+def _best_parse_ms(func) -> float:
+    """测量只读取并反序列化文件的最短耗时（毫秒）"""
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        func()
+        best = min(best, (time.perf_counter() - started) * 1000)
+    return best
+
+
+def main():
+    """运行基准并打印结果"""
+    items_per_group = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITEMS_PER_GROUP
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(_build_config(items_per_group), f, ensure_ascii=False, indent=2)
+
+        # 第一次加载生成缓存
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager = ConfigManager(path)
+            manager.load_config()
+        cache_path = manager.cache.cache_path
+
+        def parse_json():
+            with open(path, "rb") as f:
+                json.loads(f.read())
+
+        def parse_cache():
+            with open(cache_path, "rb") as f:
+                data = memoryview(f.read())
+            (header_length,) = struct.unpack_from("<I", data)
+            marshal.loads(data[4 + header_length:])
+
+        json_size = os.path.getsize(path) / 1024
+        cache_size = os.path.getsize(cache_path) / 1024
+        print(f"快捷键: {items_per_group * len(SHORTCUT_SECTIONS)} 条  "
+              f"JSON {json_size:.0f} KB / 缓存 {cache_size:.0f} KB")
+
+        json_parse = _best_parse_ms(parse_json)
+        cache_parse = _best_parse_ms(parse_cache)
+        print(f"只解析 JSON:        {json_parse:8.2f} ms")
+        print(f"只读取缓存:         {cache_parse:8.2f} ms  (加速 {json_parse / cache_parse:.1f}x)")
+
+        json_load = _best_load_ms(path, use_cache=False)
+        cache_load = _best_load_ms(path, use_cache=True)
+        print(f"加载配置（JSON）:   {json_load:8.2f} ms")
+        print(f"加载配置（缓存）:   {cache_load:8.2f} ms  (加速 {json_load / cache_load:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+按键分类微基准 - 对比旧的逐次构建字典方式与预构建查找表的单键处理开销
+
+使用方法:
+    python benchmarks/bench_key_classification.py
+"""
+
+import os
+import sys
+import timeit
+
+# 确保项目根目录在sys.path中
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from pynput import keyboard
+from PySide6.QtCore import QCoreApplication
+
+from core.key_classifier import classify_key
+from core.keyboard_listener import KeyboardListener
+
+# 典型按键序列：修饰键、字母、控制字符、特殊键、无法识别的键
+SAMPLE_KEYS = [
+    keyboard.Key.ctrl_l,
+    keyboard.KeyCode.from_char("c"),
+    keyboard.KeyCode.from_char("\x16"),
+    keyboard.Key.tab,
+    keyboard.Key.f4,
+    keyboard.Key.left,
+    keyboard.Key.caps_lock,
+    keyboard.Key.alt_l,
+]
+
+
+def legacy_classify(key):
+    """旧实现：链式比较修饰键，并在每次调用时重建特殊键字典"""
+    if key == keyboard.Key.ctrl_l or key == keyboard.Key.ctrl_r or key == keyboard.Key.ctrl:
+        return "ctrl"
+    if key == keyboard.Key.alt_l or key == keyboard.Key.alt_r or key == keyboard.Key.alt:
+        return "alt"
+    if key == keyboard.Key.cmd or key == keyboard.Key.cmd_r:
+        return "win"
+
+    if hasattr(key, 'char') and key.char:
+        char_code = ord(key.char)
+        if 1 <= char_code <= 26:
+            return chr(char_code + ord('A') - 1)
+        elif key.char.isprintable() and len(key.char) == 1:
+            return key.char.upper()
+        return None
+
+    special_keys = {
+        keyboard.Key.tab: "Tab", keyboard.Key.enter: "Enter", keyboard.Key.space: "Space",
+        keyboard.Key.backspace: "Backspace", keyboard.Key.delete: "Del", keyboard.Key.esc: "Esc",
+        keyboard.Key.f1: "F1", keyboard.Key.f2: "F2", keyboard.Key.f3: "F3", keyboard.Key.f4: "F4",
+        keyboard.Key.f5: "F5", keyboard.Key.f6: "F6", keyboard.Key.f7: "F7", keyboard.Key.f8: "F8",
+        keyboard.Key.f9: "F9", keyboard.Key.f10: "F10", keyboard.Key.f11: "F11", keyboard.Key.f12: "F12",
+        keyboard.Key.left: "←", keyboard.Key.right: "→", keyboard.Key.up: "↑", keyboard.Key.down: "↓",
+        keyboard.Key.home: "Home", keyboard.Key.end: "End", keyboard.Key.page_up: "PgUp",
+        keyboard.Key.page_down: "PgDn", keyboard.Key.insert: "Ins",
+    }
+    return special_keys.get(key, None)
+
+
+def _per_key_ns(func, repeat: int) -> float:
+    """测量对SAMPLE_KEYS逐个调用func的平均单键耗时（纳秒）"""
+    keys = SAMPLE_KEYS
+
+    def run():
+        for key in keys:
+            func(key)
+
+    best = min(timeit.repeat(run, number=repeat, repeat=5))
+    return best / (repeat * len(keys)) * 1e9
+
+
+def _per_event_ns(listener: KeyboardListener, repeat: int) -> float:
+    """测量监听器在GUI线程处理一次 Ctrl按下 / C / Ctrl释放 的平均单事件耗时（纳秒）"""
+    ctrl = keyboard.Key.ctrl_l
+    key_c = keyboard.KeyCode.from_char("\x03")
+
+    def run():
+        listener._handle_key_press(ctrl)
+        listener._handle_key_press(key_c)
+        listener._handle_key_release(ctrl)
+
+    best = min(timeit.repeat(run, number=repeat, repeat=5))
+    return best / (repeat * 3) * 1e9
+
+
+def main():
+    """运行基准并打印结果"""
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    repeat = 20000
+
+    legacy_ns = _per_key_ns(legacy_classify, repeat)
+    table_ns = _per_key_ns(classify_key, repeat)
+    print(f"旧实现分类:   {legacy_ns:8.1f} ns/键")
+    print(f"查找表分类:   {table_ns:8.1f} ns/键  (加速 {legacy_ns / table_ns:.1f}x)")
+
+    listener = KeyboardListener()
+    event_ns = _per_event_ns(listener, repeat)
+    print(f"监听器处理:   {event_ns:8.1f} ns/事件")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+烟花粒子绘制基准 - 对比逐粒子径向渐变与预渲染精灵图集的单帧绘制耗时和帧率
+
+使用方法:
+    python benchmarks/bench_particles.py
+"""
+
+import os
+import sys
+import time
+from typing import List
+
+# 确保项目根目录在sys.path中
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import numpy as np
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QBrush, QColor, QGuiApplication, QImage, QPainter, QRadialGradient
+
+from ui.particle_system import ParticleSystem
+from ui.particle_layer import FIREWORK_COLORS
+from ui.particle_sprites import get_sprite_atlas
+
+CARD_SIZE = 90
+BURSTS = 4                 # 每张卡片的爆炸次数
+PARTICLES_PER_BURST = 100  # 每次爆炸的粒子数
+
+
+def _draw_gradients(painter: QPainter, particles: ParticleSystem, colors: List[QColor]):
+    """
+    逐粒子创建径向渐变绘制（未使用图集的绘制方式，作为对比基线）
+
+    Args:
+        painter: 绘制器
+        particles: 粒子系统
+        colors: 颜色表，按颜色序号索引
+    """
+    n = particles.count
+    if not n:
+        return
+
+    # 与 ParticleSystem.draw 相同的透明度和大小
+    life = particles.life[:n]
+    alpha = np.clip(255 * life, 0, 255).astype(np.int32)
+    current_size = np.maximum(0.1, particles.size[:n] * life)
+
+    painter.setPen(Qt.PenStyle.NoPen)
+    for x, y, size, a, color_index in zip(particles.x[:n].tolist(), particles.y[:n].tolist(),
+                                          current_size.tolist(), alpha.tolist(),
+                                          particles.color[:n].tolist()):
+        base_color = colors[color_index % len(colors)]
+        gradient = QRadialGradient(x, y, size)
+        color_with_alpha = QColor(base_color)
+        color_with_alpha.setAlpha(a)
+        gradient.setColorAt(0, color_with_alpha)
+
+        transparent = QColor(base_color)
+        transparent.setAlpha(0)
+        gradient.setColorAt(1, transparent)
+
+        painter.setBrush(QBrush(gradient))
+        painter.drawEllipse(int(x - size / 2), int(y - size / 2), int(size), int(size))
+
+
+def _run(draw_frame, label: str) -> float:
+    """
+    模拟一次完整的烟花动画（所有粒子消亡为止），统计绘制耗时
+
+    Args:
+        draw_frame: 绘制函数 (painter, particles)
+        label: 输出标签
+
+    Returns:
+        float: 平均单帧绘制耗时（毫秒）
+    """
+    particles = ParticleSystem()
+    center = CARD_SIZE // 2
+    for i, (x, y) in enumerate([(center, center), (center - 20, center - 15),
+                                (center + 20, center - 15), (center, center + 20)][:BURSTS]):
+        particles.emit_burst(x, y, i, PARTICLES_PER_BURST)
+
+    image = QImage(CARD_SIZE, CARD_SIZE, QImage.Format.Format_ARGB32_Premultiplied)
+    frames = 0
+    paint_time = 0.0
+    total_start = time.perf_counter()
+
+    while particles.step():
+        image.fill(0)
+        start = time.perf_counter()
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        draw_frame(painter, particles)
+        painter.end()
+        paint_time += time.perf_counter() - start
+        frames += 1
+
+    total_time = time.perf_counter() - total_start
+    paint_ms = paint_time / frames * 1000
+    print(f"{label}: {frames} 帧, 绘制 {paint_ms:.3f} ms/帧, 更新+绘制 {frames / total_time:.0f} fps")
+    return paint_ms
+
+
+def main():
+    """运行基准并打印结果"""
+    app = QGuiApplication.instance() or QGuiApplication(sys.argv)
+    atlas = get_sprite_atlas(FIREWORK_COLORS)
+
+    gradient_ms = _run(lambda painter, particles: _draw_gradients(painter, particles, FIREWORK_COLORS),
+                       "逐粒子径向渐变")
+    sprite_ms = _run(lambda painter, particles: particles.draw(painter, atlas),
+                     "精灵图集贴图  ")
+    print(f"绘制加速: {gradient_ms / sprite_ms:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,12 +3,16 @@
 """
 
 import sys
-from typing import Dict
+from typing import Dict, List
 from PySide6.QtWidgets import QApplication, QSystemTrayIcon
 from PySide6.QtCore import Qt, Slot
 
 from .keyboard_listener import KeyboardListener
+from .modifier_reconciler import ModifierReconciler
+from .hint_scheduler import HintScheduler
+from .modifier_state import combination_group, combination_name
 from .tray_manager import TrayManager
+from .config_watcher import ConfigWatcher
 
 # 使用绝对导入避免相对导入问题
 import sys
@@ -19,11 +23,22 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from ui.hint_widget import HintWidget
+from ui.hint_window_manager import HintWindowManager
 from utils.config import (
-    load_config, save_config, SHORTCUT_ITEMS, ALT_SHORTCUT_ITEMS,
-    CTRL_ALT_SHORTCUT_ITEMS, WIN_SHORTCUT_ITEMS, APPEARANCE, EFFECTS
+    load_config, save_config, flush_config, get_shortcut_items, get_alt_shortcut_items,
+    get_ctrl_alt_shortcut_items, get_win_shortcut_items, get_effects_model,
+    subscribe_config_changes, unsubscribe_config_changes
 )
+from utils.config_events import ConfigChange
+
+
+# 配置段名称 -> 组合键类型
+CONFIG_SECTION_GROUPS = {
+    "shortcuts": "ctrl",
+    "alt_shortcuts": "alt",
+    "ctrl_alt_shortcuts": "ctrl_alt",
+    "win_shortcuts": "win"
+}
 
 
 class CtrlHintApp:
@@ -55,15 +70,42 @@ class CtrlHintApp:
         # 创建键盘监听器
         self.keyboard_listener = KeyboardListener()
         
+        # 创建修饰键校正器，补发被钩子遗漏的释放事件
+        self.modifier_reconciler = ModifierReconciler(self.keyboard_listener)
+        
         # 创建系统托盘管理器
         self.tray_manager = TrayManager(self.app)
         
-        # 创建不同组合键的提示窗口
-        self.hint_windows = {
-            "ctrl": HintWidget(SHORTCUT_ITEMS),
-            "alt": HintWidget(ALT_SHORTCUT_ITEMS),
-            "ctrl_alt": HintWidget(CTRL_ALT_SHORTCUT_ITEMS),
-            "win": HintWidget(WIN_SHORTCUT_ITEMS)
+        # 不同组合键的提示窗口在第一次使用时才创建
+        effects = get_effects_model()
+        self.hint_windows = HintWindowManager(
+            self._get_shortcut_groups(),
+            idle_release=effects.window_idle_release,
+            prewarm=effects.prewarm_windows,
+            shared_window=effects.shared_window
+        )
+        
+        # 创建提示窗口调度器，修饰键单独按住一段时间后才显示
+        self.hint_scheduler = HintScheduler(
+            show_delay=effects.show_delay,
+            can_show=self.hint_windows.has_group
+        )
+        
+        # 监视配置文件，外部修改后自动重新加载
+        self.config_watcher = ConfigWatcher()
+
+    def _get_shortcut_groups(self) -> Dict[str, list]:
+        """
+        获取各组合键对应的快捷键列表
+        
+        Returns:
+            Dict: 组合键类型 -> 快捷键列表
+        """
+        return {
+            "ctrl": get_shortcut_items(),
+            "alt": get_alt_shortcut_items(),
+            "ctrl_alt": get_ctrl_alt_shortcut_items(),
+            "win": get_win_shortcut_items()
         }
 
     def _connect_signals(self):
@@ -73,15 +115,39 @@ class CtrlHintApp:
         self.keyboard_listener.key_released.connect(self._on_key_released)
         self.keyboard_listener.specific_key_pressed.connect(self._on_specific_key_pressed)
         
+        # 连接调度器信号
+        self.hint_scheduler.show_requested.connect(self._show_hint_window)
+        self.hint_scheduler.hide_requested.connect(self._hide_all_windows)
+        
         # 连接托盘管理器信号
         self.tray_manager.settings_requested.connect(self._show_settings)
         self.tray_manager.quit_requested.connect(self._quit_app)
+        
+        # 订阅快捷键组和效果配置的变化（保存设置和配置文件被外部修改都会通知），
+        # 外观变化由各提示窗口自行订阅
+        subscribe_config_changes(
+            self._on_config_changed, tuple(CONFIG_SECTION_GROUPS) + ("effects",)
+        )
 
     @Slot(str)
     def _on_key_pressed(self, key_type: str):
         """
         处理按键按下事件
         
+        Args:
+            key_type: 按键类型 ("ctrl", "alt", "ctrl_alt", "win")
+        """
+        try:
+            self.hint_scheduler.modifier_pressed(key_type)
+                
+        except Exception as e:
+            print(f"处理按键按下事件时出错: {e}")
+
+    @Slot(str)
+    def _show_hint_window(self, key_type: str):
+        """
+        显示指定组合键的提示窗口
+        
         Args:
             key_type: 按键类型 ("ctrl", "alt", "ctrl_alt", "win")
         """
@@ -90,12 +156,12 @@ class CtrlHintApp:
             self._hide_all_windows()
             
             # 显示对应的提示窗口
-            if key_type in self.hint_windows:
+            if self.hint_windows.has_group(key_type):
                 self.current_visible_window = key_type
-                self.hint_windows[key_type].show_above_taskbar()
+                self.hint_windows.show(key_type)
                 
         except Exception as e:
-            print(f"处理按键按下事件时出错: {e}")
+            print(f"显示提示窗口时出错: {e}")
 
     @Slot(str)
     def _on_key_released(self, key_type: str):
@@ -106,9 +172,8 @@ class CtrlHintApp:
             key_type: 按键类型 ("ctrl", "alt", "ctrl_alt", "win")
         """
         try:
-            # 如果当前显示的窗口与释放的按键相关，就隐藏
-            if self.current_visible_window and self._is_related_key(self.current_visible_window, key_type):
-                self._hide_all_windows()
+            # 由调度器决定取消等待中的显示或隐藏相关窗口
+            self.hint_scheduler.modifier_released(key_type)
                 
         except Exception as e:
             print(f"处理按键释放事件时出错: {e}")
@@ -123,43 +188,53 @@ class CtrlHintApp:
             key_char: 按键字符
         """
         try:
+            # 组合键已按下，取消等待中的显示
+            self.hint_scheduler.chord_key_pressed(modifier_type)
+            
             # 如果当前有对应的窗口显示，触发动画
-            if self.current_visible_window == modifier_type:
-                if modifier_type in self.hint_windows:
-                    self.hint_windows[modifier_type].trigger_key_animation(key_char)
-                    print(f"触发动画: {modifier_type} + {key_char}")
+            # 没有对应组合键文本的卡片时（如Ctrl窗口中按下Ctrl+Shift+T），退回到按键本身的卡片
+            visible_type = self.current_visible_window
+            if visible_type:
+                chord = self._get_chord_text(visible_type, modifier_type, key_char)
+                if chord:
+                    if not self.hint_windows.trigger_key_animation(visible_type, chord) and chord != key_char:
+                        chord = key_char
+                        self.hint_windows.trigger_key_animation(visible_type, chord)
+                    print(f"触发动画: {visible_type} + {chord}")
                     
         except Exception as e:
             print(f"处理具体按键事件时出错: {e}")
 
-    def _is_related_key(self, window_type: str, key_type: str) -> bool:
+    def _get_chord_text(self, window_type: str, modifier_type: str, key_char: str) -> str:
         """
-        检查窗口类型和按键类型是否相关
+        计算按键在指定窗口中对应的卡片文本
+        
+        窗口组合键之外额外按下的修饰键作为卡片文本的前缀，
+        例如Alt窗口显示时按下Alt+Shift+Tab，对应卡片 "Shift+Tab"
+        （按下Shift不会切换窗口，Alt窗口保持显示）
         
         Args:
-            window_type: 窗口类型
-            key_type: 按键类型
+            window_type: 当前显示窗口的组合键类型
+            modifier_type: 按键时按下的组合键类型
+            key_char: 按键字符
             
         Returns:
-            bool: 相关返回True，否则返回False
+            str: 卡片文本，按下的修饰键未包含窗口的全部修饰键时返回None
         """
-        # 定义相关性映射
-        relations = {
-            "ctrl": ["ctrl", "ctrl_alt"],
-            "alt": ["alt", "ctrl_alt"],
-            "ctrl_alt": ["ctrl", "alt", "ctrl_alt"],
-            "win": ["win"]
-        }
+        window_group = combination_group(window_type)
+        pressed_group = combination_group(modifier_type)
+        if window_group & ~pressed_group:
+            return None
         
-        return window_type in relations.get(key_type, [])
+        extra_group = pressed_group & ~window_group
+        if not extra_group:
+            return key_char
+        return "+".join(combination_name(extra_group).split("_") + [key_char])
 
     def _hide_all_windows(self):
         """隐藏所有提示窗口"""
         try:
-            for window in self.hint_windows.values():
-                if window.isVisible():
-                    window.hide_with_animation()
-            
+            self.hint_windows.hide_all()
             self.current_visible_window = None
             
         except Exception as e:
@@ -180,10 +255,8 @@ class CtrlHintApp:
                 new_config = dialog.get_all_settings()
                 
                 # 保存配置
+                # 保存后只有内容变化的快捷键组和外观字段通过变更通知更新
                 if save_config(**new_config):
-                    # 更新提示窗口
-                    self._update_hint_windows()
-                    
                     # 使用托盘消息而不是弹窗，避免事件循环问题
                     self.tray_manager.show_message(
                         "设置已保存", 
@@ -213,26 +286,49 @@ class CtrlHintApp:
                 timeout=3000
             )
 
-    def _update_hint_windows(self):
-        """更新所有提示窗口"""
+    def _on_config_changed(self, changes: List[ConfigChange]):
+        """
+        配置变化后只更新受影响的部分：只刷新内容变化的快捷键组的窗口
+        
+        Args:
+            changes: 快捷键组和效果配置段的变化
+        """
         try:
-            # 更新快捷键内容
-            self.hint_windows["ctrl"].update_shortcuts(SHORTCUT_ITEMS)
-            self.hint_windows["alt"].update_shortcuts(ALT_SHORTCUT_ITEMS)
-            self.hint_windows["ctrl_alt"].update_shortcuts(CTRL_ALT_SHORTCUT_ITEMS)
-            self.hint_windows["win"].update_shortcuts(WIN_SHORTCUT_ITEMS)
-            
-            # 更新外观
-            self.hint_windows["ctrl"].update_appearance()
-            self.hint_windows["alt"].update_appearance()
-            self.hint_windows["ctrl_alt"].update_appearance()
-            self.hint_windows["win"].update_appearance()
+            key_types = [CONFIG_SECTION_GROUPS[change.section] for change in changes
+                         if change.section in CONFIG_SECTION_GROUPS]
+            if key_types:
+                self.hint_windows.update_shortcuts(self._get_shortcut_groups(), key_types)
             
+            # 外观、分页和定位屏幕（paginate、max_rows、placement_screen）由各提示窗口自行订阅更新
+            for change in changes:
+                if change.section == "effects":
+                    self._apply_effects_change(change)
+                
         except Exception as e:
-            print(f"更新提示窗口时出错: {e}")
+            print(f"应用配置变化时出错: {e}")
             import traceback
             traceback.print_exc()
 
+    def _apply_effects_change(self, change: ConfigChange):
+        """
+        将效果配置的变化应用到调度器和窗口管理器
+        
+        Args:
+            change: 效果配置段的变化
+        """
+        effects = get_effects_model()
+        if change.touches(("show_delay",)):
+            self.hint_scheduler.set_show_delay(effects.show_delay)
+        if change.touches(("window_idle_release",)):
+            self.hint_windows.set_idle_release(effects.window_idle_release)
+        if change.touches(("shared_window",)):
+            # 切换窗口模式会释放已创建的窗口，先隐藏正在显示的窗口
+            self.hint_scheduler.hide_immediately()
+            self._hide_all_windows()
+            self.hint_windows.set_shared_window(effects.shared_window)
+        if change.touches(("prewarm_windows", "shared_window")):
+            self.hint_windows.set_prewarm(effects.prewarm_windows)
+
     def _quit_app(self):
         """退出应用程序"""
         try:
@@ -242,6 +338,7 @@ class CtrlHintApp:
             self.keyboard_listener.stop()
             
             # 隐藏所有窗口
+            self.hint_scheduler.hide_immediately()
             self._hide_all_windows()
             
             # 隐藏托盘图标
@@ -271,6 +368,8 @@ class CtrlHintApp:
         
         # 启动键盘监听器
         self.keyboard_listener.start()
+        self.modifier_reconciler.start()
+        self.config_watcher.start()
         
         # 显示启动消息
         self.tray_manager.show_message(
@@ -297,6 +396,15 @@ class CtrlHintApp:
     def _cleanup(self):
         """清理资源"""
         try:
+            # 停止修饰键校正器
+            if hasattr(self, 'modifier_reconciler'):
+                self.modifier_reconciler.stop()
+            
+            # 停止监视配置文件，不再接收配置变化
+            if hasattr(self, 'config_watcher'):
+                self.config_watcher.stop()
+            unsubscribe_config_changes(self._on_config_changed)
+                
             # 停止键盘监听器
             if hasattr(self, 'keyboard_listener'):
                 self.keyboard_listener.stop()
@@ -304,6 +412,9 @@ class CtrlHintApp:
             # 隐藏托盘图标
             if hasattr(self, 'tray_manager'):
                 self.tray_manager.hide()
+            
+            # 等待后台保存的配置写入完成
+            flush_config()
                 
         except Exception as e:
             print(f"清理资源时出错: {e}")
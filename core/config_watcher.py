@@ -0,0 +1,204 @@
+"""
+配置文件监视模块 - 配置文件被外部修改（如部署工具下发）时自动重新加载，只应用有变化的配置段
+
+使用 QFileSystemWatcher 监视配置文件及其所在目录，无法监视时改为定期检查文件的修改时间。
+文件在后台线程中读取和解析，解析结果通过信号回到界面线程再应用。
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal, Slot
+
+# 使用绝对导入避免相对导入问题
+import sys
+
+# 确保项目根目录在sys.path中
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.config import reload_config, is_config_write_pending
+from utils.constants import CONFIG_FILE
+
+# 文件签名: (修改时间纳秒, 文件大小)
+FileSignature = Tuple[int, int]
+
+
+class ConfigWatcher(QObject):
+    """配置文件监视器"""
+
+    # 内部信号，重新加载后的变化由配置管理器的事件通知订阅者
+    _parsed = Signal(object, object)    # 后台线程解析完成: (文件签名, 配置内容或None)
+
+    def __init__(self, path: str = CONFIG_FILE, debounce: int = 300,
+                 poll_interval: int = 2000, parent=None):
+        """
+        初始化配置文件监视器
+
+        Args:
+            path: 配置文件路径
+            debounce: 文件变化后等待多久再读取（毫秒），合并连续的写入
+            poll_interval: 无法使用文件监视时检查文件的间隔（毫秒）
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.path = os.path.abspath(path)
+        self.directory = os.path.dirname(self.path)
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self._on_path_changed)
+        self.watcher.directoryChanged.connect(self._on_path_changed)
+
+        # 连续的变化合并为一次读取
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(debounce)
+        self.debounce_timer.timeout.connect(self._start_parse)
+
+        # 轮询备用方案
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(poll_interval)
+        self.poll_timer.timeout.connect(self._poll)
+
+        self._parsed.connect(self._on_parsed)
+
+        # 最近一次读取的文件签名，签名未变化时不再读取
+        self._signature = self._file_signature()
+        self._parsing = False
+        self._reparse = False
+
+        # 统计信息
+        self.change_count = 0       # 检测到的文件变化次数
+        self.parse_count = 0        # 读取解析的次数
+        self.error_count = 0        # 解析失败的次数
+        self.applied_count = 0      # 有配置段变化并应用的次数
+
+    def _file_signature(self) -> Optional[FileSignature]:
+        """获取配置文件的签名，文件不存在时返回None"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def start(self):
+        """开始监视，文件监视不可用时改为定期检查"""
+        watched = False
+        # 原子替换会使文件监视失效，同时监视目录以便重新添加
+        if os.path.exists(self.path):
+            watched = self.watcher.addPath(self.path) or watched
+        if os.path.isdir(self.directory):
+            watched = self.watcher.addPath(self.directory) or watched
+
+        if not watched:
+            print("无法监视配置文件，改为定期检查")
+            self.poll_timer.start()
+
+    def stop(self):
+        """停止监视"""
+        self.debounce_timer.stop()
+        self.poll_timer.stop()
+        paths = self.watcher.files() + self.watcher.directories()
+        if paths:
+            self.watcher.removePaths(paths)
+
+    def is_polling(self) -> bool:
+        """
+        检查是否在使用定期检查
+
+        Returns:
+            bool: 使用定期检查返回True，使用文件监视返回False
+        """
+        return self.poll_timer.isActive()
+
+    @Slot(str)
+    def _on_path_changed(self, path: str):
+        """配置文件或所在目录发生变化"""
+        # 文件被替换后重新监视新文件
+        if os.path.exists(self.path) and self.path not in self.watcher.files():
+            self.watcher.addPath(self.path)
+
+        if self._file_signature() != self._signature:
+            self.change_count += 1
+            self.debounce_timer.start()
+
+    @Slot()
+    def _poll(self):
+        """定期检查文件签名"""
+        if self._file_signature() != self._signature:
+            self.change_count += 1
+            self.debounce_timer.start()
+
+    @Slot()
+    def _start_parse(self):
+        """在后台线程中读取配置文件，正在读取时读取完成后再读一次"""
+        if self._parsing:
+            self._reparse = True
+            return
+
+        # 本程序的保存还未写完时文件内容比内存中的旧，写完后再检查
+        if is_config_write_pending():
+            self.debounce_timer.start()
+            return
+
+        signature = self._file_signature()
+        if signature is None or signature == self._signature:
+            return
+
+        self._parsing = True
+        thread = threading.Thread(target=self._parse_file, args=(signature,),
+                                  name="ConfigWatcher", daemon=True)
+        thread.start()
+
+    def _parse_file(self, signature: FileSignature):
+        """后台线程：读取并解析配置文件"""
+        config: Optional[Dict[str, Any]] = None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            if not isinstance(config, dict):
+                raise ValueError("配置文件内容不是对象")
+        except Exception as e:
+            # 文件可能正在被写入，下次变化时再读取
+            print(f"重新加载配置文件时出错: {e}")
+            config = None
+        self._parsed.emit(signature, config)
+
+    @Slot(object, object)
+    def _on_parsed(self, signature: FileSignature, config: Optional[Dict[str, Any]]):
+        """界面线程：应用解析结果中有变化的配置段"""
+        self._parsing = False
+        self.parse_count += 1
+
+        if config is None:
+            self.error_count += 1
+        elif is_config_write_pending():
+            # 解析期间本程序保存了新的配置，读到的内容已过时，丢弃并在写完后重新检查
+            self.debounce_timer.start()
+        else:
+            self._signature = signature
+            changed: List[str] = reload_config(config)
+            if changed:
+                self.applied_count += 1
+                print(f"配置文件已重新加载: {', '.join(changed)}")
+
+        if self._reparse:
+            self._reparse = False
+            self._start_parse()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取监视统计信息
+
+        Returns:
+            Dict: 统计信息字典
+        """
+        return {
+            "changes": self.change_count,
+            "parses": self.parse_count,
+            "errors": self.error_count,
+            "applied": self.applied_count,
+            "polling": self.is_polling(),
+        }
@@ -0,0 +1,182 @@
+"""
+提示窗口调度模块 - 修饰键按住一段时间后才显示提示窗口，并合并快速的按下/释放
+"""
+
+from typing import Callable, Dict, Optional
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
+
+from .modifier_state import combination_group
+
+
+class HintScheduler(QObject):
+    """提示窗口显示/隐藏调度器"""
+
+    # 定义信号
+    show_requested = Signal(str)   # 请求显示提示窗口，参数为组合键类型
+    hide_requested = Signal()      # 请求隐藏所有提示窗口
+
+    def __init__(self, show_delay: int = 250, hide_grace: int = 80,
+                 can_show: Optional[Callable[[str], bool]] = None, parent=None):
+        """
+        初始化调度器
+
+        Args:
+            show_delay: 修饰键单独按住多久后显示提示窗口（毫秒），0表示立即显示
+            hide_grace: 修饰键释放后延迟隐藏的时间（毫秒），期间重新按下则保持显示
+            can_show: 判断组合键类型是否有对应提示窗口的函数
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.show_delay = max(0, show_delay)
+        self.hide_grace = max(0, hide_grace)
+        self.can_show = can_show or (lambda key_type: True)
+
+        # 当前状态
+        self.pending_type: Optional[str] = None   # 等待显示的组合键类型
+        self.visible_type: Optional[str] = None   # 已显示的组合键类型
+
+        self.show_timer = QTimer(self)
+        self.show_timer.setSingleShot(True)
+        self.show_timer.timeout.connect(self._on_show_timeout)
+
+        self.hide_timer = QTimer(self)
+        self.hide_timer.setSingleShot(True)
+        self.hide_timer.timeout.connect(self._on_hide_timeout)
+
+        # 统计信息
+        self.show_count = 0         # 实际显示的次数
+        self.suppressed_count = 0   # 因组合键或提前释放而取消的显示次数
+        self.coalesced_count = 0    # 释放后迅速重新按下而省去的隐藏/显示次数
+
+    def set_show_delay(self, show_delay: int):
+        """
+        设置显示延迟
+
+        Args:
+            show_delay: 显示延迟（毫秒）
+        """
+        self.show_delay = max(0, show_delay)
+
+    def modifier_pressed(self, key_type: str):
+        """
+        修饰键组合按下
+
+        Args:
+            key_type: 组合键类型
+        """
+        if self.hide_timer.isActive():
+            self.hide_timer.stop()
+            if key_type == self.visible_type:
+                # 释放后又立即按下，保持窗口显示
+                self.coalesced_count += 1
+                return
+
+        if key_type == self.visible_type:
+            return
+
+        if not self.can_show(key_type):
+            # 没有对应窗口的组合键，取消等待；已显示的窗口只在新组合键与其无关时隐藏，
+            # 在其基础上多按了修饰键（如Ctrl提示显示时再按Win）则保持显示
+            self._cancel_pending_show()
+            if self.visible_type and not self._is_extended(self.visible_type, key_type):
+                self._hide_now()
+            return
+
+        if self.visible_type or self.show_delay == 0:
+            # 已处于提示状态时直接切换，不再等待
+            self._cancel_pending_show()
+            self._show_now(key_type)
+            return
+
+        if self.pending_type and self.pending_type != key_type:
+            self.suppressed_count += 1
+
+        self.pending_type = key_type
+        self.show_timer.start(self.show_delay)
+
+    def modifier_released(self, key_type: str):
+        """
+        修饰键组合释放
+
+        Args:
+            key_type: 释放前的组合键类型
+        """
+        if self.pending_type and self._is_related(self.pending_type, key_type):
+            self._cancel_pending_show()
+
+        if self.visible_type and self._is_related(self.visible_type, key_type):
+            if self.hide_grace == 0:
+                self._hide_now()
+            else:
+                self.hide_timer.start(self.hide_grace)
+
+    def chord_key_pressed(self, modifier_type: str):
+        """
+        修饰键按下期间按下了其他按键（如Ctrl+C），取消等待中的显示
+
+        Args:
+            modifier_type: 组合键类型
+        """
+        if self.pending_type:
+            self._cancel_pending_show()
+
+    def hide_immediately(self):
+        """立即隐藏并取消所有等待中的操作"""
+        self.show_timer.stop()
+        self.hide_timer.stop()
+        self.pending_type = None
+        self.visible_type = None
+
+    def _cancel_pending_show(self):
+        """取消等待中的显示"""
+        if self.pending_type:
+            self.show_timer.stop()
+            self.pending_type = None
+            self.suppressed_count += 1
+
+    def _show_now(self, key_type: str):
+        """立即显示"""
+        self.visible_type = key_type
+        self.show_count += 1
+        self.show_requested.emit(key_type)
+
+    def _hide_now(self):
+        """立即隐藏"""
+        self.hide_timer.stop()
+        self.visible_type = None
+        self.hide_requested.emit()
+
+    @Slot()
+    def _on_show_timeout(self):
+        """显示延迟到期"""
+        key_type = self.pending_type
+        self.pending_type = None
+        if key_type:
+            self._show_now(key_type)
+
+    @Slot()
+    def _on_hide_timeout(self):
+        """隐藏宽限期到期"""
+        if self.visible_type:
+            self._hide_now()
+
+    def _is_related(self, window_type: str, key_type: str) -> bool:
+        """两个组合键包含相同的修饰键即视为相关"""
+        return bool(combination_group(window_type) & combination_group(key_type))
+
+    def _is_extended(self, window_type: str, key_type: str) -> bool:
+        """组合键包含窗口组合键的全部修饰键即视为在其基础上扩展"""
+        return not combination_group(window_type) & ~combination_group(key_type)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        获取调度统计信息
+
+        Returns:
+            Dict: 统计信息字典
+        """
+        return {
+            "shows": self.show_count,
+            "suppressed": self.suppressed_count,
+            "coalesced": self.coalesced_count
+        }
@@ -0,0 +1,165 @@
+"""
+按键分类模块 - 在导入时预先构建按键查找表，供键盘监听器逐键查询
+"""
+
+from typing import Dict, Optional, Tuple
+from pynput import keyboard
+
+# 按键类别
+KEY_CLASS_OTHER = 0   # 普通按键
+KEY_CLASS_CTRL = 1    # Ctrl键
+KEY_CLASS_ALT = 2     # Alt键
+KEY_CLASS_WIN = 3     # Win键
+KEY_CLASS_SHIFT = 4   # Shift键
+
+# 修饰键槽位（左右分开），即修饰键状态位掩码中的位序号
+MOD_SLOT_NONE = -1    # 非修饰键
+MOD_SLOT_CTRL_L = 0
+MOD_SLOT_CTRL_R = 1
+MOD_SLOT_ALT_L = 2
+MOD_SLOT_ALT_R = 3
+MOD_SLOT_SHIFT_L = 4
+MOD_SLOT_SHIFT_R = 5
+MOD_SLOT_WIN_L = 6
+MOD_SLOT_WIN_R = 7
+MOD_SLOT_COUNT = 8
+
+# 分类结果: (按键类别, 显示字符, 修饰键槽位)，显示字符为None表示不参与卡片匹配
+KeyClassification = Tuple[int, Optional[str], int]
+
+# 修饰键名称 -> (类别, 槽位)，不区分左右的按键按左侧处理
+_MODIFIER_KEY_NAMES = {
+    "ctrl": (KEY_CLASS_CTRL, MOD_SLOT_CTRL_L),
+    "ctrl_l": (KEY_CLASS_CTRL, MOD_SLOT_CTRL_L),
+    "ctrl_r": (KEY_CLASS_CTRL, MOD_SLOT_CTRL_R),
+    "alt": (KEY_CLASS_ALT, MOD_SLOT_ALT_L),
+    "alt_l": (KEY_CLASS_ALT, MOD_SLOT_ALT_L),
+    "alt_r": (KEY_CLASS_ALT, MOD_SLOT_ALT_R),
+    "cmd": (KEY_CLASS_WIN, MOD_SLOT_WIN_L),
+    "cmd_l": (KEY_CLASS_WIN, MOD_SLOT_WIN_L),
+    "cmd_r": (KEY_CLASS_WIN, MOD_SLOT_WIN_R),
+    "shift": (KEY_CLASS_SHIFT, MOD_SLOT_SHIFT_L),
+    "shift_l": (KEY_CLASS_SHIFT, MOD_SLOT_SHIFT_L),
+    "shift_r": (KEY_CLASS_SHIFT, MOD_SLOT_SHIFT_R),
+}
+
+# 特殊按键名称 -> 显示字符
+_SPECIAL_KEY_NAMES = {
+    "tab": "Tab",
+    "enter": "Enter",
+    "space": "Space",
+    "backspace": "Backspace",
+    "delete": "Del",
+    "esc": "Esc",
+    "f1": "F1",
+    "f2": "F2",
+    "f3": "F3",
+    "f4": "F4",
+    "f5": "F5",
+    "f6": "F6",
+    "f7": "F7",
+    "f8": "F8",
+    "f9": "F9",
+    "f10": "F10",
+    "f11": "F11",
+    "f12": "F12",
+    "left": "←",
+    "right": "→",
+    "up": "↑",
+    "down": "↓",
+    "home": "Home",
+    "end": "End",
+    "page_up": "PgUp",
+    "page_down": "PgDn",
+    "insert": "Ins",
+}
+
+_UNKNOWN_KEY: KeyClassification = (KEY_CLASS_OTHER, None, MOD_SLOT_NONE)
+
+
+def _build_key_tables() -> Tuple[Dict[keyboard.Key, KeyClassification], Dict[int, KeyClassification]]:
+    """
+    构建Key枚举与虚拟键码两张查找表
+
+    Returns:
+        Tuple: (Key枚举查找表, 虚拟键码查找表)
+    """
+    key_table: Dict[keyboard.Key, KeyClassification] = {}
+    vk_table: Dict[int, KeyClassification] = {}
+
+    entries = [(name, (key_class, None, slot)) for name, (key_class, slot) in _MODIFIER_KEY_NAMES.items()]
+    entries += [(name, (KEY_CLASS_OTHER, text, MOD_SLOT_NONE)) for name, text in _SPECIAL_KEY_NAMES.items()]
+
+    for name, entry in entries:
+        # 不同平台的Key枚举成员不同，缺失的直接跳过
+        member = getattr(keyboard.Key, name, None)
+        if member is None:
+            continue
+        key_table.setdefault(member, entry)
+
+        # 同时按虚拟键码登记，兼容以KeyCode形式上报的同一按键
+        vk = getattr(member.value, "vk", None)
+        if vk:
+            vk_table.setdefault(vk, entry)
+
+    # 以虚拟键码上报的字母和数字键（Windows VK码与X11 keysym在此区间一致）
+    for code in range(ord("0"), ord("9") + 1):
+        vk_table.setdefault(code, (KEY_CLASS_OTHER, chr(code), MOD_SLOT_NONE))
+    for code in range(ord("A"), ord("Z") + 1):
+        vk_table.setdefault(code, (KEY_CLASS_OTHER, chr(code), MOD_SLOT_NONE))
+
+    return key_table, vk_table
+
+
+def _build_char_table() -> Dict[str, KeyClassification]:
+    """
+    构建ASCII字符查找表
+
+    Returns:
+        Dict: 字符 -> 分类结果
+    """
+    char_table: Dict[str, KeyClassification] = {}
+
+    for code in range(1, 128):
+        char = chr(code)
+        if code <= 26:
+            # 处理Ctrl+字母键的控制字符: Ctrl+A=1, Ctrl+B=2, ..., Ctrl+Z=26
+            char_table[char] = (KEY_CLASS_OTHER, chr(code + ord("A") - 1), MOD_SLOT_NONE)
+        elif char.isprintable():
+            char_table[char] = (KEY_CLASS_OTHER, char.upper(), MOD_SLOT_NONE)
+        else:
+            char_table[char] = _UNKNOWN_KEY
+
+    return char_table
+
+
+# 导入时一次性构建查找表
+_KEY_TABLE, _VK_TABLE = _build_key_tables()
+_CHAR_TABLE = _build_char_table()
+_KEY_TYPE = keyboard.Key
+
+
+def classify_key(key) -> KeyClassification:
+    """
+    查询按键的类别、显示字符和修饰键槽位
+
+    Args:
+        key: pynput按键对象（Key或KeyCode）
+
+    Returns:
+        Tuple: (按键类别, 显示字符, 修饰键槽位)，无法识别时显示字符为None
+    """
+    if type(key) is _KEY_TYPE:
+        return _KEY_TABLE.get(key, _UNKNOWN_KEY)
+
+    char = getattr(key, "char", None)
+    if char:
+        entry = _CHAR_TABLE.get(char)
+        if entry is not None:
+            return entry
+        # 非ASCII字符不预先建表
+        if len(char) == 1 and char.isprintable():
+            return (KEY_CLASS_OTHER, char.upper(), MOD_SLOT_NONE)
+        return _UNKNOWN_KEY
+
+    return _VK_TABLE.get(getattr(key, "vk", None), _UNKNOWN_KEY)
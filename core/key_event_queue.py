@@ -0,0 +1,130 @@
+"""
+按键事件队列模块 - 在pynput钩子线程与Qt GUI线程之间传递按键事件
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# 按键事件记录: (时间戳, 按键, 是否按下)
+KeyEventRecord = Tuple[float, Any, bool]
+
+
+class KeyEventRingBuffer:
+    """
+    单生产者/单消费者的无锁环形缓冲区
+
+    生产者（钩子线程）只修改写指针，消费者（GUI线程）只修改读指针，
+    依靠GIL保证单次赋值的原子性，因此两端都不需要加锁。
+    缓冲区写满时事件进入溢出队列而不是被丢弃，并记录溢出次数。
+    """
+
+    def __init__(self, capacity: int = 256):
+        """
+        初始化环形缓冲区
+
+        Args:
+            capacity: 缓冲区容量（事件条数）
+        """
+        if capacity <= 0:
+            raise ValueError("缓冲区容量必须大于0")
+
+        self.capacity = capacity
+        self._slots: List[Optional[KeyEventRecord]] = [None] * capacity
+
+        # 读写指针单调递增，取模得到槽位，避免回绕判断
+        self._head = 0  # 写指针，仅生产者修改
+        self._tail = 0  # 读指针，仅消费者修改
+
+        # 溢出队列，只要其中还有事件，生产者就继续写入这里以保持顺序
+        self._overflow: Deque[KeyEventRecord] = deque()
+
+        # 统计信息
+        self.pushed_count = 0     # 写入的事件总数（仅生产者修改）
+        self.overflow_count = 0   # 进入溢出队列的事件数（仅生产者修改）
+        self.drained_count = 0    # 已取出的事件总数（仅消费者修改）
+        self.batch_count = 0      # 批量取出的次数（仅消费者修改）
+        self.max_depth = 0        # 取出时观察到的最大积压深度（仅消费者修改）
+
+    def push(self, timestamp: float, key: Any, pressed: bool):
+        """
+        写入一条按键事件（在钩子线程中调用）
+
+        Args:
+            timestamp: 事件时间戳
+            key: pynput按键对象
+            pressed: 按下为True，释放为False
+        """
+        record = (timestamp, key, pressed)
+        head = self._head
+
+        if self._overflow or head - self._tail >= self.capacity:
+            self._overflow.append(record)
+            self.overflow_count += 1
+        else:
+            self._slots[head % self.capacity] = record
+            self._head = head + 1
+
+        self.pushed_count += 1
+
+    def drain(self, max_items: Optional[int] = None) -> List[KeyEventRecord]:
+        """
+        按写入顺序批量取出事件（在GUI线程中调用）
+
+        Args:
+            max_items: 本次最多取出的事件数，None表示全部取出
+
+        Returns:
+            List: 事件记录列表
+        """
+        batch: List[KeyEventRecord] = []
+        tail = self._tail
+
+        depth = self._head - tail + len(self._overflow)
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+        while max_items is None or len(batch) < max_items:
+            head = self._head
+            if tail < head:
+                # 环形缓冲区中的事件总是早于溢出队列中的事件
+                index = tail % self.capacity
+                batch.append(self._slots[index])
+                self._slots[index] = None
+                tail += 1
+                self._tail = tail
+                continue
+
+            if not self._overflow:
+                break
+            batch.append(self._overflow.popleft())
+
+        if batch:
+            self.drained_count += len(batch)
+            self.batch_count += 1
+
+        return batch
+
+    def __len__(self) -> int:
+        """当前积压的事件数"""
+        return self._head - self._tail + len(self._overflow)
+
+    def clear(self):
+        """丢弃所有积压事件（在GUI线程中调用）"""
+        self.drain()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        获取队列统计信息
+
+        Returns:
+            Dict: 统计信息字典
+        """
+        return {
+            "capacity": self.capacity,
+            "pending": len(self),
+            "pushed": self.pushed_count,
+            "drained": self.drained_count,
+            "batches": self.batch_count,
+            "overflowed": self.overflow_count,
+            "max_depth": self.max_depth
+        }
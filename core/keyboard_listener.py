@@ -2,9 +2,16 @@
 键盘监听器模块 - 负责监听键盘事件并发出信号
 """
 
-from typing import Callable, Set
+import time
+from typing import Dict
 from pynput import keyboard
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Qt, Signal, Slot
+
+from .key_event_queue import KeyEventRingBuffer
+from .key_classifier import classify_key
+from .modifier_state import (
+    ModifierStateMachine, GROUP_CTRL, GROUP_ALT, GROUP_SHIFT, GROUP_WIN, SIGNAL_GROUPS
+)
 
 
 class KeyboardListener(QObject):
@@ -15,23 +22,19 @@ class KeyboardListener(QObject):
     key_released = Signal(str)   # 按键释放信号，参数为按键类型
     specific_key_pressed = Signal(str, str)  # 具体按键按下信号，参数为(修饰键类型, 按键字符)
     
-    def __init__(self):
+    # 内部信号：通知GUI线程取出事件队列
+    _drain_requested = Signal()
+    
+    def __init__(self, queue_capacity: int = 256):
         super().__init__()
         
-        # 跟踪按键状态
-        self.pressed_ctrl_keys: Set = set()
-        self.pressed_alt_keys: Set = set()
-        self.pressed_win_keys: Set = set()
-        
-        # 按键状态
-        self.key_states = {
-            "ctrl": False,
-            "alt": False, 
-            "win": False
-        }
+        # 修饰键状态（左右分开的位掩码）
+        self.modifier_state = ModifierStateMachine()
         
-        # 线程安全锁
-        self.key_lock = False
+        # 钩子线程只向队列写入事件，由GUI线程批量处理
+        self.event_queue = KeyEventRingBuffer(queue_capacity)
+        self._drain_pending = False
+        self._drain_requested.connect(self._drain_events, Qt.ConnectionType.QueuedConnection)
         
         # 创建pynput监听器
         self.listener = keyboard.Listener(
@@ -40,118 +43,117 @@ class KeyboardListener(QObject):
         )
 
     def _on_key_press(self, key):
+        """钩子线程回调：记录按键按下事件"""
+        try:
+            self.event_queue.push(time.perf_counter(), key, True)
+            self._request_drain()
+        except (KeyboardInterrupt, SystemExit):
+            # 允许正常的程序退出信号
+            raise
+        except Exception as e:
+            print(f"记录按键按下事件出错（已忽略）: {e}")
+
+    def _on_key_release(self, key):
+        """钩子线程回调：记录按键释放事件"""
+        try:
+            self.event_queue.push(time.perf_counter(), key, False)
+            self._request_drain()
+        except (KeyboardInterrupt, SystemExit):
+            # 允许正常的程序退出信号
+            raise
+        except Exception as e:
+            print(f"记录按键释放事件出错（已忽略）: {e}")
+
+    def _request_drain(self):
+        """请求GUI线程处理队列，已有待处理请求时不重复发送"""
+        if not self._drain_pending:
+            self._drain_pending = True
+            self._drain_requested.emit()
+
+    @Slot()
+    def _drain_events(self):
+        """在GUI线程中批量处理队列中的按键事件"""
+        # 先清除标记再取队列，保证取队列期间写入的事件会触发新的处理请求
+        self._drain_pending = False
+        
+        for _timestamp, key, pressed in self.event_queue.drain():
+            if pressed:
+                self._handle_key_press(key)
+            else:
+                self._handle_key_release(key)
+
+    def _handle_key_press(self, key):
         """处理按键按下事件"""
         try:
-            # 防止多线程冲突
-            if self.key_lock:
-                return
-            self.key_lock = True
+            _key_class, key_char, slot = classify_key(key)
             
-            # 检测Ctrl键按下
-            if key == keyboard.Key.ctrl_l or key == keyboard.Key.ctrl_r or key == keyboard.Key.ctrl:
-                is_first_ctrl = not self.pressed_ctrl_keys  # 第一次按下Ctrl键
-                self.pressed_ctrl_keys.add(key)
-                
-                if is_first_ctrl:
-                    self.key_states["ctrl"] = True
-                    # 检查是否已经处于Alt键按下状态
-                    if self.key_states["alt"]:
-                        # 发出Ctrl+Alt组合键信号
-                        self.key_pressed.emit("ctrl_alt")
-                    else:
-                        # 发出Ctrl信号
-                        self.key_pressed.emit("ctrl")
-                
-            # 检测Alt键按下
-            elif key == keyboard.Key.alt_l or key == keyboard.Key.alt_r or key == keyboard.Key.alt:
-                is_first_alt = not self.pressed_alt_keys  # 第一次按下Alt键
-                self.pressed_alt_keys.add(key)
-                
-                if is_first_alt:
-                    self.key_states["alt"] = True
-                    # 检查是否已经处于Ctrl键按下状态
-                    if self.key_states["ctrl"]:
-                        # 发出Ctrl+Alt组合键信号
-                        self.key_pressed.emit("ctrl_alt")
-                    else:
-                        # 发出Alt信号
-                        self.key_pressed.emit("alt")
+            # 修饰键：由状态机决定是否发出组合键信号
+            if slot >= 0:
+                pressed_combination = self.modifier_state.transition(slot, True)[1]
+                if pressed_combination:
+                    self.key_pressed.emit(pressed_combination)
             
-            # 检测Win键按下
-            elif key == keyboard.Key.cmd or key == keyboard.Key.cmd_r:
-                self.pressed_win_keys.add(key)
-                self.key_states["win"] = True
-                # 发出Win键信号
-                self.key_pressed.emit("win")
-            
-            # 检测其他按键（在修饰键按下时）
-            else:
-                # 获取按键字符
-                key_char = self._get_key_char(key)
-                
-                if key_char:
-                    # 检查当前按下的修饰键状态
-                    if self.key_states["ctrl"] and self.key_states["alt"]:
-                        self.specific_key_pressed.emit("ctrl_alt", key_char)
-                    elif self.key_states["ctrl"]:
-                        self.specific_key_pressed.emit("ctrl", key_char)
-                    elif self.key_states["alt"]:
-                        self.specific_key_pressed.emit("alt", key_char)
-                    elif self.key_states["win"]:
-                        self.specific_key_pressed.emit("win", key_char)
+            # 其他按键（在修饰键按下时，只按住Shift输入大写字母不算组合键）
+            elif key_char and self.modifier_state.group & SIGNAL_GROUPS:
+                self.specific_key_pressed.emit(self.modifier_state.combination, key_char)
         
         except (KeyboardInterrupt, SystemExit):
             # 允许正常的程序退出信号
             raise
         except Exception as e:
             print(f"键盘按下事件处理错误（已忽略）: {e}")
-        finally:
-            self.key_lock = False
 
-    def _on_key_release(self, key):
+    def _handle_key_release(self, key):
         """处理按键释放事件"""
         try:
-            # 防止多线程冲突
-            if self.key_lock:
-                return
-            self.key_lock = True
+            slot = classify_key(key)[2]
             
-            # 检测Ctrl键释放
-            if key == keyboard.Key.ctrl_l or key == keyboard.Key.ctrl_r or key == keyboard.Key.ctrl:
-                self.pressed_ctrl_keys.discard(key)
-                if not self.pressed_ctrl_keys:  # 所有Ctrl键都释放了
-                    self.key_states["ctrl"] = False
-                    # 发出释放信号
-                    if self.key_states["alt"]:
-                        self.key_released.emit("ctrl_alt")
-                    else:
-                        self.key_released.emit("ctrl")
-                        
-            # 检测Alt键释放
-            elif key == keyboard.Key.alt_l or key == keyboard.Key.alt_r or key == keyboard.Key.alt:
-                self.pressed_alt_keys.discard(key)
-                if not self.pressed_alt_keys:  # 所有Alt键都释放了
-                    self.key_states["alt"] = False
-                    # 发出释放信号
-                    if self.key_states["ctrl"]:
-                        self.key_released.emit("ctrl_alt")
-                    else:
-                        self.key_released.emit("alt")
-                        
-            # 检测Win键释放
-            elif key == keyboard.Key.cmd or key == keyboard.Key.cmd_r:
-                self.pressed_win_keys.discard(key)
-                if not self.pressed_win_keys:  # 所有Win键都释放了
-                    self.key_states["win"] = False
-                    self.key_released.emit("win")
+            # 只有修饰键释放需要处理，同一组的修饰键全部释放后才发出信号
+            if slot >= 0:
+                self._emit_release(slot)
                         
         except (KeyboardInterrupt, SystemExit):
             # 允许正常的程序退出信号
             raise
         except Exception as e:
             print(f"键盘释放事件处理错误（已忽略）: {e}")
-        finally:
-            self.key_lock = False
+
+    def release_modifier_slots(self, slot_mask: int) -> int:
+        """
+        补发指定修饰键槽位的释放事件（用于校正丢失的释放事件）
+        
+        Args:
+            slot_mask: 需要释放的修饰键槽位掩码，未按下的槽位被忽略
+            
+        Returns:
+            int: 实际释放的槽位数量
+        """
+        slot_mask &= self.modifier_state.mask
+        if slot_mask:
+            self._emit_transition(self.modifier_state.release_slots(slot_mask))
+        return bin(slot_mask).count("1")
+
+    def _emit_release(self, slot: int):
+        """
+        释放修饰键槽位并发出信号
+        
+        Args:
+            slot: 修饰键槽位
+        """
+        self._emit_transition(self.modifier_state.transition(slot, False))
+
+    def _emit_transition(self, result):
+        """
+        按状态机的释放结果发出信号：先释放原组合，仍有修饰键按住时再按下剩余组合
+        
+        Args:
+            result: 状态机的转移结果
+        """
+        _mask, pressed_combination, released_combination = result
+        if released_combination:
+            self.key_released.emit(released_combination)
+        if pressed_combination:
+            self.key_pressed.emit(pressed_combination)
 
     def start(self):
         """启动键盘监听"""
@@ -186,81 +188,23 @@ class KeyboardListener(QObject):
         Returns:
             dict: 按键状态字典
         """
+        group = self.modifier_state.group
         return {
-            "ctrl": bool(self.pressed_ctrl_keys),
-            "alt": bool(self.pressed_alt_keys),
-            "win": bool(self.pressed_win_keys)
+            "ctrl": bool(group & GROUP_CTRL),
+            "alt": bool(group & GROUP_ALT),
+            "shift": bool(group & GROUP_SHIFT),
+            "win": bool(group & GROUP_WIN)
         }
 
-    def _get_key_char(self, key) -> str:
+    def get_queue_stats(self) -> Dict[str, int]:
         """
-        获取按键字符
+        获取事件队列统计信息
         
-        Args:
-            key: pynput按键对象
-            
         Returns:
-            str: 按键字符，如果无法识别则返回None
+            Dict: 统计信息字典，其中overflowed为溢出到备用队列的事件数
         """
-        try:
-            # 处理字母和数字键
-            if hasattr(key, 'char') and key.char:
-                char_code = ord(key.char)
-                
-                # 处理Ctrl+字母键的控制字符
-                if char_code >= 1 and char_code <= 26:
-                    # Ctrl+A=1, Ctrl+B=2, ..., Ctrl+Z=26
-                    result = chr(char_code + ord('A') - 1)
-                    return result
-                # 处理正常的可打印字符
-                elif key.char.isprintable() and len(key.char) == 1:
-                    return key.char.upper()
-                else:
-                    return None
-            
-            # 处理特殊键
-            special_keys = {
-                keyboard.Key.tab: "Tab",
-                keyboard.Key.enter: "Enter",
-                keyboard.Key.space: "Space",
-                keyboard.Key.backspace: "Backspace",
-                keyboard.Key.delete: "Del",
-                keyboard.Key.esc: "Esc",
-                keyboard.Key.f1: "F1",
-                keyboard.Key.f2: "F2",
-                keyboard.Key.f3: "F3",
-                keyboard.Key.f4: "F4",
-                keyboard.Key.f5: "F5",
-                keyboard.Key.f6: "F6",
-                keyboard.Key.f7: "F7",
-                keyboard.Key.f8: "F8",
-                keyboard.Key.f9: "F9",
-                keyboard.Key.f10: "F10",
-                keyboard.Key.f11: "F11",
-                keyboard.Key.f12: "F12",
-                keyboard.Key.left: "←",
-                keyboard.Key.right: "→",
-                keyboard.Key.up: "↑",
-                keyboard.Key.down: "↓",
-                keyboard.Key.home: "Home",
-                keyboard.Key.end: "End",
-                keyboard.Key.page_up: "PgUp",
-                keyboard.Key.page_down: "PgDn",
-                keyboard.Key.insert: "Ins",
-            }
-            
-            return special_keys.get(key, None)
-            
-        except (KeyboardInterrupt, SystemExit):
-            # 允许正常的程序退出信号
-            raise
-        except Exception as e:
-            print(f"获取按键字符时出错（已忽略）: {e}")
-            return None
+        return self.event_queue.get_stats()
 
     def reset_state(self):
         """重置所有按键状态"""
-        self.pressed_ctrl_keys.clear()
-        self.pressed_alt_keys.clear()
-        self.pressed_win_keys.clear()
-        self.key_states = {"ctrl": False, "alt": False, "win": False} 
\ No newline at end of file
+        self.modifier_state.reset() 
\ No newline at end of file
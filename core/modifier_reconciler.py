@@ -0,0 +1,153 @@
+"""
+修饰键校正模块 - 定期将监听器记录的修饰键状态与系统真实按键状态对比，补发丢失的释放事件
+"""
+
+import sys
+from typing import Callable, Dict, Optional
+from PySide6.QtCore import QObject, QTimer, Slot
+
+from .key_classifier import (
+    MOD_SLOT_CTRL_L, MOD_SLOT_CTRL_R, MOD_SLOT_ALT_L, MOD_SLOT_ALT_R,
+    MOD_SLOT_SHIFT_L, MOD_SLOT_SHIFT_R, MOD_SLOT_WIN_L, MOD_SLOT_WIN_R
+)
+
+# 按键状态提供者: 传入待查询的槽位掩码，返回其中真实处于按下状态的槽位掩码
+KeyStateProvider = Callable[[int], int]
+
+# 槽位 -> Windows虚拟键码
+_WINDOWS_SLOT_VK = {
+    MOD_SLOT_CTRL_L: 0xA2,   # VK_LCONTROL
+    MOD_SLOT_CTRL_R: 0xA3,   # VK_RCONTROL
+    MOD_SLOT_ALT_L: 0xA4,    # VK_LMENU
+    MOD_SLOT_ALT_R: 0xA5,    # VK_RMENU
+    MOD_SLOT_SHIFT_L: 0xA0,  # VK_LSHIFT
+    MOD_SLOT_SHIFT_R: 0xA1,  # VK_RSHIFT
+    MOD_SLOT_WIN_L: 0x5B,    # VK_LWIN
+    MOD_SLOT_WIN_R: 0x5C,    # VK_RWIN
+}
+
+
+def _create_windows_provider() -> KeyStateProvider:
+    """创建基于GetAsyncKeyState的按键状态提供者"""
+    import ctypes
+    get_async_key_state = ctypes.windll.user32.GetAsyncKeyState
+    slot_vks = [(1 << slot, vk) for slot, vk in _WINDOWS_SLOT_VK.items()]
+
+    def provider(mask: int) -> int:
+        pressed = 0
+        for bit, vk in slot_vks:
+            # 最高位为1表示按键当前处于按下状态
+            if mask & bit and get_async_key_state(vk) & 0x8000:
+                pressed |= bit
+        return pressed
+
+    return provider
+
+
+def default_key_state_provider() -> Optional[KeyStateProvider]:
+    """
+    获取当前平台的按键状态提供者
+
+    Returns:
+        Callable: 按键状态提供者，当前平台不支持时返回None
+    """
+    if sys.platform != "win32":
+        return None
+    try:
+        return _create_windows_provider()
+    except Exception as e:
+        print(f"无法创建按键状态提供者: {e}")
+        return None
+
+
+class ModifierReconciler(QObject):
+    """修饰键状态校正器"""
+
+    def __init__(self, keyboard_listener, key_state_provider: Optional[KeyStateProvider] = None,
+                 interval: int = 500, parent=None):
+        """
+        初始化校正器
+
+        Args:
+            keyboard_listener: 键盘监听器
+            key_state_provider: 按键状态提供者，为None时使用当前平台的默认实现
+            interval: 校正间隔（毫秒）
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.keyboard_listener = keyboard_listener
+        self.key_state_provider = key_state_provider or default_key_state_provider()
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.reconcile)
+
+        # 统计信息
+        self.check_count = 0        # 实际查询系统状态的次数
+        self.correction_count = 0   # 补发释放事件的次数
+        self.ghost_modifier_count = 0  # 校正的幽灵修饰键数量
+
+    def start(self):
+        """启动定期校正"""
+        if self.key_state_provider is None:
+            print("当前平台不支持查询按键状态，修饰键校正已禁用")
+            return
+        self.timer.start()
+
+    def stop(self):
+        """停止定期校正"""
+        self.timer.stop()
+
+    def is_active(self) -> bool:
+        """
+        检查校正器是否正在运行
+
+        Returns:
+            bool: 正在运行返回True，否则返回False
+        """
+        return self.timer.isActive()
+
+    @Slot()
+    def reconcile(self) -> int:
+        """
+        执行一次校正
+
+        Returns:
+            int: 本次校正的幽灵修饰键数量
+        """
+        try:
+            mask = self.keyboard_listener.modifier_state.mask
+
+            # 没有修饰键按下，或仍有未处理的事件时无需查询系统状态
+            if not mask or self.key_state_provider is None or len(self.keyboard_listener.event_queue):
+                return 0
+
+            self.check_count += 1
+            ghost_mask = mask & ~self.key_state_provider(mask)
+            if not ghost_mask:
+                return 0
+
+            corrected = self.keyboard_listener.release_modifier_slots(ghost_mask)
+            self.correction_count += 1
+            self.ghost_modifier_count += corrected
+            print(f"已校正 {corrected} 个未释放的修饰键")
+            return corrected
+
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as e:
+            print(f"修饰键校正出错（已忽略）: {e}")
+            return 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        获取校正统计信息
+
+        Returns:
+            Dict: 统计信息字典
+        """
+        return {
+            "checks": self.check_count,
+            "corrections": self.correction_count,
+            "ghost_modifiers": self.ghost_modifier_count
+        }
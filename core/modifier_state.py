@@ -0,0 +1,179 @@
+"""
+修饰键状态机模块 - 以位掩码记录修饰键状态，通过预计算的转移表得到组合键
+"""
+
+from typing import List, Optional, Tuple
+
+from .key_classifier import MOD_SLOT_COUNT
+
+# 修饰键组（不区分左右），组合键名称按此顺序拼接，如 "ctrl_alt"、"ctrl_shift"
+GROUP_CTRL = 1 << 0
+GROUP_ALT = 1 << 1
+GROUP_SHIFT = 1 << 2
+GROUP_WIN = 1 << 3
+_GROUP_NAMES = (
+    (GROUP_CTRL, "ctrl"),
+    (GROUP_ALT, "alt"),
+    (GROUP_SHIFT, "shift"),
+    (GROUP_WIN, "win"),
+)
+_GROUP_COUNT = 1 << len(_GROUP_NAMES)
+_MASK_COUNT = 1 << MOD_SLOT_COUNT
+
+# Shift只作为组合键文本的一部分（如 "Shift+Tab"），不单独显示提示窗口，
+# 也不改变发出的组合键，Ctrl提示显示时按下Shift仍保持Ctrl提示
+SIGNAL_GROUPS = GROUP_CTRL | GROUP_ALT | GROUP_WIN
+
+# 转移结果: (新的位掩码, 需要发出的按下组合键, 需要发出的释放组合键)
+Transition = Tuple[int, Optional[str], Optional[str]]
+
+
+def combination_name(group: int) -> Optional[str]:
+    """
+    获取修饰键组对应的组合键名称
+
+    Args:
+        group: 修饰键组位掩码
+
+    Returns:
+        str: 组合键名称，没有修饰键时返回None
+    """
+    parts = [name for bit, name in _GROUP_NAMES if group & bit]
+    return "_".join(parts) if parts else None
+
+
+def combination_group(name: str) -> int:
+    """
+    解析组合键名称为修饰键组位掩码
+
+    Args:
+        name: 组合键名称，如 "ctrl_alt"
+
+    Returns:
+        int: 修饰键组位掩码，无法识别的部分被忽略
+    """
+    group = 0
+    for part in name.split("_"):
+        for bit, group_name in _GROUP_NAMES:
+            if part == group_name:
+                group |= bit
+    return group
+
+
+def _mask_to_group(mask: int) -> int:
+    """将左右分开的槽位掩码折叠为修饰键组掩码（每组占相邻两个槽位）"""
+    group = 0
+    for index in range(len(_GROUP_NAMES)):
+        if mask & (0b11 << (index * 2)):
+            group |= 1 << index
+    return group
+
+
+def _transition_index(mask: int, slot: int, pressed: bool) -> int:
+    """计算转移表下标"""
+    return ((mask * MOD_SLOT_COUNT + slot) << 1) | pressed
+
+
+def _build_transition_table() -> List[Transition]:
+    """
+    预计算所有 (位掩码, 槽位, 按下/释放) 组合的转移结果，按下或释放Shift不发出信号
+
+    Returns:
+        List: 以 _transition_index() 为下标的转移表
+    """
+    names = [combination_name(group) for group in range(_GROUP_COUNT)]
+    groups = [_mask_to_group(mask) & SIGNAL_GROUPS for mask in range(_MASK_COUNT)]
+    table: List[Transition] = [None] * (_MASK_COUNT * MOD_SLOT_COUNT * 2)
+
+    for mask in range(_MASK_COUNT):
+        old_group = groups[mask]
+        for slot in range(MOD_SLOT_COUNT):
+            bit = 1 << slot
+
+            # 按下: 修饰键组发生变化时发出新组合的按下信号
+            new_mask = mask | bit
+            pressed = names[groups[new_mask]] if groups[new_mask] != old_group else None
+            table[_transition_index(mask, slot, True)] = (new_mask, pressed, None)
+
+            # 释放: 修饰键组发生变化时发出原组合的释放信号，仍有修饰键按住时
+            # 再发出剩余组合的按下信号（如Ctrl+Win释放Win后恢复为Ctrl）
+            new_mask = mask & ~bit
+            if groups[new_mask] != old_group:
+                table[_transition_index(mask, slot, False)] = (
+                    new_mask, names[groups[new_mask]], names[old_group]
+                )
+            else:
+                table[_transition_index(mask, slot, False)] = (new_mask, None, None)
+
+    return table
+
+
+_TRANSITIONS = _build_transition_table()
+_GROUP_BY_MASK = [_mask_to_group(mask) for mask in range(_MASK_COUNT)]
+_NAME_BY_MASK = [combination_name(group) for group in _GROUP_BY_MASK]
+
+
+class ModifierStateMachine:
+    """修饰键状态机"""
+
+    def __init__(self):
+        # 每个槽位（左右分开的修饰键）占一位
+        self.mask = 0
+
+    def transition(self, slot: int, pressed: bool) -> Transition:
+        """
+        处理修饰键的按下或释放
+
+        Args:
+            slot: 修饰键槽位
+            pressed: 按下为True，释放为False
+
+        Returns:
+            Tuple: (新的位掩码, 需要发出的按下组合键, 需要发出的释放组合键)
+        """
+        result = _TRANSITIONS[((self.mask * MOD_SLOT_COUNT + slot) << 1) | pressed]
+        self.mask = result[0]
+        return result
+
+    def release_slots(self, slot_mask: int) -> Transition:
+        """
+        一次释放多个槽位的修饰键，只按释放前后的组合键发出一次信号
+
+        Args:
+            slot_mask: 需要释放的槽位掩码
+
+        Returns:
+            Tuple: (新的位掩码, 需要发出的按下组合键, 需要发出的释放组合键)
+        """
+        old_group = _GROUP_BY_MASK[self.mask] & SIGNAL_GROUPS
+        self.mask &= ~slot_mask
+        new_group = _GROUP_BY_MASK[self.mask] & SIGNAL_GROUPS
+        if new_group == old_group:
+            return self.mask, None, None
+        return self.mask, combination_name(new_group), combination_name(old_group)
+
+    @property
+    def group(self) -> int:
+        """当前按下的修饰键组位掩码"""
+        return _GROUP_BY_MASK[self.mask]
+
+    @property
+    def combination(self) -> Optional[str]:
+        """当前组合键名称，没有修饰键按下时为None"""
+        return _NAME_BY_MASK[self.mask]
+
+    def is_slot_pressed(self, slot: int) -> bool:
+        """
+        检查指定槽位的修饰键是否按下
+
+        Args:
+            slot: 修饰键槽位
+
+        Returns:
+            bool: 按下返回True，否则返回False
+        """
+        return bool(self.mask & (1 << slot))
+
+    def reset(self):
+        """清除所有修饰键状态"""
+        self.mask = 0
@@ -5,5 +5,6 @@ UI模块 - 包含所有用户界面组件
 from .hint_widget import HintWidget
 from .card_widget import ShortcutCardWidget
 from .settings_dialog import SettingsDialog
+from .hint_window_manager import HintWindowManager
 
-__all__ = ['HintWidget', 'ShortcutCardWidget', 'SettingsDialog'] 
\ No newline at end of file
+__all__ = ['HintWidget', 'ShortcutCardWidget', 'SettingsDialog', 'HintWindowManager'] 
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+动画时钟模块 - 所有卡片共用一个帧定时器，统一推进粒子等逐帧动画，空闲时自动停止
+"""
+
+import time
+from typing import Callable, Dict, Optional
+from PySide6.QtCore import QObject, QTimer, Qt, Slot
+
+# 帧回调: 参数为当前时间（毫秒），返回False表示动画已结束，取消订阅
+FrameCallback = Callable[[float], bool]
+
+
+class AnimationClock(QObject):
+    """共享动画时钟"""
+
+    def __init__(self, frame_interval: int = 33, parent=None):
+        """
+        初始化动画时钟
+
+        Args:
+            frame_interval: 帧间隔（毫秒），默认约30fps，与原有粒子动画的节奏一致
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.frame_interval = frame_interval
+
+        # 订阅的帧回调，按订阅顺序调用（dict用作有序集合）
+        self._callbacks: Dict[FrameCallback, None] = {}
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self._tick)
+
+        # 统计信息
+        self.frame_count = 0     # 定时器触发的帧数
+        self.start_count = 0     # 定时器从空闲到启动的次数
+        self.callback_count = 0  # 帧回调的调用次数
+
+    def now(self) -> float:
+        """
+        获取时钟时间
+
+        Returns:
+            float: 单调时间（毫秒）
+        """
+        return time.monotonic() * 1000
+
+    def subscribe(self, callback: FrameCallback):
+        """
+        订阅逐帧回调，时钟空闲时自动启动
+
+        Args:
+            callback: 帧回调，返回False时自动取消订阅
+        """
+        self._callbacks[callback] = None
+        if not self.timer.isActive():
+            self.timer.start(self.frame_interval)
+            self.start_count += 1
+
+    def unsubscribe(self, callback: FrameCallback):
+        """
+        取消订阅，没有订阅者时时钟停止
+
+        Args:
+            callback: 帧回调
+        """
+        self._callbacks.pop(callback, None)
+        if not self._callbacks:
+            self.timer.stop()
+
+    def is_subscribed(self, callback: FrameCallback) -> bool:
+        """
+        检查回调是否已订阅
+
+        Args:
+            callback: 帧回调
+
+        Returns:
+            bool: 已订阅返回True，否则返回False
+        """
+        return callback in self._callbacks
+
+    @Slot()
+    def _tick(self):
+        """推进一帧，依次调用所有订阅者"""
+        self.frame_count += 1
+        now = self.now()
+
+        for callback in list(self._callbacks):
+            self.callback_count += 1
+            try:
+                active = callback(now)
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except Exception as e:
+                # 订阅者出错（例如组件已被销毁）时取消订阅，不影响其他动画
+                print(f"动画帧回调错误（已忽略）: {e}")
+                active = False
+
+            if not active:
+                self._callbacks.pop(callback, None)
+
+        if not self._callbacks:
+            self.timer.stop()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        获取时钟统计信息
+
+        Returns:
+            Dict: 统计信息字典
+        """
+        return {
+            "subscribers": len(self._callbacks),
+            "frames": self.frame_count,
+            "starts": self.start_count,
+            "callbacks": self.callback_count,
+            "running": int(self.timer.isActive())
+        }
+
+
+# 全局共享的动画时钟，在第一次使用时创建（需要QApplication已存在）
+_shared_clock: Optional[AnimationClock] = None
+
+
+def get_animation_clock() -> AnimationClock:
+    """
+    获取全局共享的动画时钟
+
+    Returns:
+        AnimationClock: 动画时钟
+    """
+    global _shared_clock
+    if _shared_clock is None:
+        _shared_clock = AnimationClock()
+    return _shared_clock
@@ -0,0 +1,137 @@
+"""
+卡片背景缓存模块 - 将卡片的圆角渐变背景和阴影预渲染为一张图片，所有卡片共用
+"""
+
+from typing import Dict, Tuple
+from PySide6.QtWidgets import QGraphicsScene, QGraphicsPixmapItem, QGraphicsDropShadowEffect
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QColor, QPainter, QPainterPath, QPixmap, QPen, QBrush, QLinearGradient
+
+# 与卡片QSS样式一致的圆角和边框
+CORNER_RADIUS = 12
+BORDER_COLOR = QColor(255, 255, 255, 80)
+
+# 与原先每张卡片的 QGraphicsDropShadowEffect 相同的阴影参数
+SHADOW_BLUR_RADIUS = 10
+SHADOW_COLOR = QColor(0, 0, 0, 30)
+SHADOW_OFFSET = (0, 1)
+
+# 背景图片四周为阴影预留的边距（逻辑像素）
+SHADOW_PADDING = SHADOW_BLUR_RADIUS + 2
+
+# 缓存的背景数量上限，外观变化后旧的背景会被淘汰
+_CACHE_LIMIT = 8
+
+
+def _hex_to_color(hex_color: str, alpha: int) -> QColor:
+    """将十六进制颜色转换为带透明度的QColor"""
+    color = QColor(hex_color)
+    color.setAlpha(alpha)
+    return color
+
+
+def _render_background(width: int, height: int, bg_start: str, bg_end: str, alpha: int,
+                       device_pixel_ratio: float) -> QPixmap:
+    """渲染不含阴影的圆角渐变背景"""
+    pixmap = QPixmap(round(width * device_pixel_ratio), round(height * device_pixel_ratio))
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    gradient = QLinearGradient(0, 0, 0, height)
+    gradient.setColorAt(0, _hex_to_color(bg_start, alpha))
+    gradient.setColorAt(1, _hex_to_color(bg_end, alpha))
+
+    path = QPainterPath()
+    path.addRoundedRect(QRectF(0.5, 0.5, width - 1, height - 1), CORNER_RADIUS, CORNER_RADIUS)
+    painter.setBrush(QBrush(gradient))
+    painter.setPen(QPen(BORDER_COLOR, 1))
+    painter.drawPath(path)
+    painter.end()
+    return pixmap
+
+
+def _padded_pixmap(width: int, height: int, device_pixel_ratio: float) -> QPixmap:
+    """创建四周带阴影边距的透明图片"""
+    pixmap = QPixmap(round((width + 2 * SHADOW_PADDING) * device_pixel_ratio),
+                     round((height + 2 * SHADOW_PADDING) * device_pixel_ratio))
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    return pixmap
+
+
+def _render_with_shadow(background: QPixmap, width: int, height: int,
+                        device_pixel_ratio: float) -> QPixmap:
+    """
+    为背景添加阴影，使用与原先相同的 QGraphicsDropShadowEffect 只渲染一次
+    """
+    pixmap = _padded_pixmap(width, height, device_pixel_ratio)
+
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(background)
+    shadow = QGraphicsDropShadowEffect()
+    shadow.setBlurRadius(SHADOW_BLUR_RADIUS)
+    shadow.setColor(SHADOW_COLOR)
+    shadow.setOffset(*SHADOW_OFFSET)
+    item.setGraphicsEffect(shadow)
+    scene.addItem(item)
+
+    padded_width = width + 2 * SHADOW_PADDING
+    padded_height = height + 2 * SHADOW_PADDING
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    scene.render(painter, QRectF(0, 0, padded_width, padded_height),
+                 QRectF(-SHADOW_PADDING, -SHADOW_PADDING, padded_width, padded_height))
+    painter.end()
+    return pixmap
+
+
+# 背景缓存: (宽, 高, 起始颜色, 结束颜色, 透明度, 是否带阴影, 设备像素比) -> 背景图片
+_background_cache: Dict[Tuple, QPixmap] = {}
+
+
+def get_card_background(appearance: Dict, width: int, height: int, shadow: bool = True,
+                        device_pixel_ratio: float = 1.0) -> QPixmap:
+    """
+    获取（必要时渲染）卡片背景图片
+
+    图片四周包含 SHADOW_PADDING 像素的阴影边距，绘制时应向左上偏移该边距。
+    卡片尺寸和外观配置不变时所有卡片共用同一张图片
+
+    Args:
+        appearance: 外观配置
+        width: 卡片宽度（样式表的内边距会使卡片大于 card_size）
+        height: 卡片高度
+        shadow: 是否包含阴影
+        device_pixel_ratio: 设备像素比
+
+    Returns:
+        QPixmap: 背景图片
+    """
+    bg_start = appearance.get("card_bg_color_start", "#ffffff")
+    bg_end = appearance.get("card_bg_color_end", "#f0f0fa")
+    alpha = int(255 * appearance.get("background_opacity", 50) / 100)
+
+    key = (width, height, bg_start, bg_end, alpha, shadow, float(device_pixel_ratio))
+    pixmap = _background_cache.get(key)
+    if pixmap is None:
+        if len(_background_cache) >= _CACHE_LIMIT:
+            _background_cache.clear()
+        background = _render_background(width, height, bg_start, bg_end, alpha, device_pixel_ratio)
+        if shadow:
+            pixmap = _render_with_shadow(background, width, height, device_pixel_ratio)
+        else:
+            # 统一带上阴影边距，调用方无需区分
+            pixmap = _padded_pixmap(width, height, device_pixel_ratio)
+            painter = QPainter(pixmap)
+            painter.drawPixmap(SHADOW_PADDING, SHADOW_PADDING, background)
+            painter.end()
+        _background_cache[key] = pixmap
+    return pixmap
+
+
+def clear_card_background_cache():
+    """清除背景缓存，外观配置变化时调用"""
+    _background_cache.clear()
@@ -0,0 +1,129 @@
+"""
+流式布局模块 - 按固定列数换行排列尺寸相同的卡片，快捷键很多时窗口不会超出屏幕宽度
+"""
+
+from typing import List, Optional, Tuple
+from PySide6.QtWidgets import QLayout, QLayoutItem, QWidget, QWidgetItem
+from PySide6.QtCore import Qt, QRect, QSize
+
+
+class FlowLayout(QLayout):
+    """等大单元格的流式网格布局，隐藏的控件不占位置"""
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        """
+        初始化流式布局
+
+        Args:
+            parent: 父控件
+        """
+        super().__init__(parent)
+        self._items: List[QLayoutItem] = []
+
+        self.max_columns = 0      # 每行最多几个单元格，0表示不换行
+        self.reserved_cells = 0   # 至少为多少个单元格预留空间，分页时每页窗口大小相同
+
+    def set_grid(self, max_columns: int, reserved_cells: int = 0):
+        """
+        设置每行的单元格数和预留的单元格数
+
+        Args:
+            max_columns: 每行最多几个单元格，0表示不换行
+            reserved_cells: 至少为多少个单元格预留空间
+        """
+        if (max_columns, reserved_cells) != (self.max_columns, self.reserved_cells):
+            self.max_columns = max_columns
+            self.reserved_cells = reserved_cells
+            self.invalidate()
+
+    def addItem(self, item: QLayoutItem):
+        self._items.append(item)
+
+    def insertWidget(self, index: int, widget: QWidget):
+        """
+        在指定位置插入控件，与 QBoxLayout.insertWidget 相同
+
+        Args:
+            index: 插入位置，负数或超出范围时追加到末尾
+            widget: 控件
+        """
+        self.addChildWidget(widget)
+        item = QWidgetItem(widget)
+        if 0 <= index < len(self._items):
+            self._items.insert(index, item)
+        else:
+            self._items.append(item)
+        self.invalidate()
+
+    def count(self) -> int:
+        return len(self._items)
+
+    def itemAt(self, index: int) -> Optional[QLayoutItem]:
+        if 0 <= index < len(self._items):
+            return self._items[index]
+        return None
+
+    def takeAt(self, index: int) -> Optional[QLayoutItem]:
+        if 0 <= index < len(self._items):
+            item = self._items.pop(index)
+            self.invalidate()
+            return item
+        return None
+
+    def expandingDirections(self) -> Qt.Orientation:
+        return Qt.Orientation(0)
+
+    def _visible_items(self) -> List[QLayoutItem]:
+        """参与布局的（未隐藏的）项"""
+        return [item for item in self._items if not item.isEmpty()]
+
+    def _grid(self, cell_count: int) -> Tuple[int, int]:
+        """计算 (列数, 行数)"""
+        if cell_count <= 0:
+            return 0, 0
+        columns = cell_count if self.max_columns <= 0 else min(cell_count, self.max_columns)
+        rows = (cell_count + columns - 1) // columns
+        return columns, rows
+
+    @staticmethod
+    def _cell_size(items: List[QLayoutItem]) -> QSize:
+        """单元格大小取所有项建议尺寸的最大值"""
+        size = QSize(0, 0)
+        for item in items:
+            size = size.expandedTo(item.sizeHint())
+        return size
+
+    def sizeHint(self) -> QSize:
+        items = self._visible_items()
+        margins = self.contentsMargins()
+        columns, rows = self._grid(max(len(items), self.reserved_cells))
+        cell = self._cell_size(items)
+        spacing = max(0, self.spacing())
+
+        width = columns * cell.width() + max(0, columns - 1) * spacing
+        height = rows * cell.height() + max(0, rows - 1) * spacing
+        return QSize(width + margins.left() + margins.right(), height + margins.top() + margins.bottom())
+
+    def minimumSize(self) -> QSize:
+        return self.sizeHint()
+
+    def setGeometry(self, rect: QRect):
+        super().setGeometry(rect)
+
+        items = self._visible_items()
+        if not items:
+            return
+
+        area = self.contentsRect()
+        columns, _ = self._grid(len(items))
+        cell = self._cell_size(items)
+        spacing = max(0, self.spacing())
+
+        # 按行优先顺序放入单元格
+        for index, item in enumerate(items):
+            row, column = divmod(index, columns)
+            item.setGeometry(QRect(
+                area.x() + column * (cell.width() + spacing),
+                area.y() + row * (cell.height() + spacing),
+                cell.width(), cell.height()
+            ))
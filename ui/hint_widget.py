@@ -4,10 +4,11 @@
 
 import sys
 import os
-from typing import List, Dict
-from PySide6.QtWidgets import QWidget, QHBoxLayout
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QPoint
-from PySide6.QtGui import QGuiApplication
+from bisect import bisect_left
+from typing import List, Dict, Optional, Set
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QStackedLayout
+from PySide6.QtCore import Qt, QPoint, QSize
+from PySide6.QtGui import QPainter, QPixmap, QRegion
 
 # 使用绝对导入避免相对导入问题
 import sys
@@ -18,27 +19,98 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from ui.card_widget import ShortcutCardWidget
+from ui.card_widget import ShortcutCardWidget, normalize_key_text
+from ui.particle_layer import ParticleLayer
+from ui.card_background import get_card_background, clear_card_background_cache, SHADOW_PADDING
+from ui.stylesheet import get_overlay_stylesheet
+from ui.window_animator import WindowAnimator
+from ui.screen_placement import get_screen_placement, EDGE_MARGIN
+from ui.flow_layout import FlowLayout
+from utils.config import (
+    get_appearance, get_appearance_model, get_effects_model,
+    subscribe_config_changes, unsubscribe_config_changes
+)
+from utils.config_events import ConfigChange
+from utils.config_model import Appearance
+from utils.effects import animations_enabled, shadows_enabled
+
+
+def _longest_increasing_subsequence(values: List[int]) -> Set[int]:
+    """
+    求最长递增子序列
+
+    Args:
+        values: 整数序列
+
+    Returns:
+        Set: 最长递增子序列中元素的下标集合
+    """
+    tails: List[int] = []        # tails[k]: 长度为k+1的递增子序列的最小结尾值
+    tail_indices: List[int] = [] # 对应结尾元素的下标
+    previous = [-1] * len(values)
+
+    for index, value in enumerate(values):
+        position = bisect_left(tails, value)
+        if position > 0:
+            previous[index] = tail_indices[position - 1]
+        if position == len(tails):
+            tails.append(value)
+            tail_indices.append(index)
+        else:
+            tails[position] = value
+            tail_indices[position] = index
+
+    result: Set[int] = set()
+    index = tail_indices[-1] if tail_indices else -1
+    while index >= 0:
+        result.add(index)
+        index = previous[index]
+    return result
+
+
+# 只影响颜色的外观字段，变化时只需重新应用样式表
+COLOR_APPEARANCE_FIELDS = frozenset({
+    "key_color", "action_color", "card_bg_color_start", "card_bg_color_end", "background_opacity"
+})
+# 影响卡片尺寸的外观字段，变化时需要重新布局和分页
+SIZE_APPEARANCE_FIELDS = frozenset({"card_size", "key_font_size", "action_font_size"})
+# 影响卡片背景和阴影绘制方式的效果字段
+RENDER_EFFECT_FIELDS = frozenset({"cached_card_background", "enable_shadow", "enable_animation"})
+# 影响分页的效果字段
+PAGING_EFFECT_FIELDS = frozenset({"paginate", "max_rows", "placement_screen"})
+# 显示动画时长
+ANIMATION_EFFECT_FIELDS = frozenset({"fade_duration", "slide_duration"})
 
 
 class HintWidget(QWidget):
     """快捷键提示窗口"""
     
-    def __init__(self, shortcut_items: List[Dict] = None):
+    def __init__(self, shortcut_items: List[Dict] = None, appearance: Optional[Appearance] = None):
         """
         初始化提示窗口
         
         Args:
             shortcut_items: 快捷键列表，格式为 [{"key": "C", "action": "复制"}, ...]
+            appearance: 固定使用的外观配置（如设置对话框的样式预览），None表示使用当前配置
         """
         super().__init__()
         self.shortcut_items = shortcut_items or []
         
+        # 指定外观时不读取全局配置，预览样式不会影响其他提示窗口
+        self.appearance_override = appearance
+        self._override_values = appearance.to_dict() if appearance is not None else None
+        
         self._setup_window_properties()
         self._setup_layout()
         self._setup_animations()
         self._load_stylesheet()
         self._create_cards()
+        
+        # 覆盖在提示窗口之上的粒子层，烟花动画不会使卡片重绘；第一次播放烟花时才创建
+        self.particle_layer: Optional[ParticleLayer] = None
+        
+        # 外观和效果变化时按变化的字段更新，窗口释放时取消订阅
+        subscribe_config_changes(self._on_config_changed, ("appearance", "effects"))
 
     def _setup_window_properties(self):
         """设置窗口属性"""
@@ -59,110 +131,91 @@ class HintWidget(QWidget):
 
     def _setup_layout(self):
         """设置布局"""
-        # 主容器使用水平布局
-        self.layout = QHBoxLayout(self)
+        # 窗口在两页之间切换：实时的卡片条，或卡片条渲染成的快照图片
+        self.stack = QStackedLayout(self)
+        self.stack.setContentsMargins(0, 0, 0, 0)
+        
+        # 卡片条使用流式布局，超出屏幕宽度时换行；下方为页码
+        self.card_strip = QWidget()
+        self.strip_layout = QVBoxLayout(self.card_strip)
+        self.strip_layout.setContentsMargins(0, 0, 0, 0)
+        self.strip_layout.setSpacing(0)
+        self.layout = FlowLayout()
         self.layout.setContentsMargins(5, 5, 5, 5)  # 容器本身的边距
         self.layout.setSpacing(10)  # 卡片之间的间距
+        self.strip_layout.addLayout(self.layout)
+        self.page_label = QLabel()
+        self.page_label.setObjectName("pageLabel")
+        self.page_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.page_label.hide()
+        self.strip_layout.addWidget(self.page_label)
+        self.stack.addWidget(self.card_strip)
+        
+        # 分页状态：快捷键超过一页时只为当前页创建卡片
+        self.columns = 0     # 每行卡片数，0表示不换行
+        self.page_size = 0   # 每页卡片数，0表示不分页
+        self.page = 0
+        
+        # 快照页只显示一张图片，显示/隐藏时无需布局和绘制每张卡片
+        self.snapshot_view = QLabel()
+        self.snapshot_view.setObjectName("snapshotView")
+        self.snapshot_view.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self.stack.addWidget(self.snapshot_view)
+        
+        # 快照状态
+        self.snapshot: Optional[QPixmap] = None
+        self.snapshot_dirty = True
+        self.snapshot_render_count = 0
+        self.stack.setCurrentWidget(self.card_strip)
 
     def _setup_animations(self):
         """设置动画"""
-        # 淡入动画
-        self.fade_in_animation = QPropertyAnimation(self, b"windowOpacity")
-        self.fade_in_animation.setDuration(250)  # 增加持续时间
-        self.fade_in_animation.setStartValue(0.0)
-        self.fade_in_animation.setEndValue(1.0)
-        self.fade_in_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        
-        # 淡出动画
-        self.fade_out_animation = QPropertyAnimation(self, b"windowOpacity")
-        self.fade_out_animation.setDuration(180)  # 增加持续时间
-        self.fade_out_animation.setStartValue(1.0)
-        self.fade_out_animation.setEndValue(0.0)
-        self.fade_out_animation.setEasingCurve(QEasingCurve.Type.InCubic)
-
-        # 滑入动画
-        self.slide_in_animation = QPropertyAnimation(self, b"pos")
-        self.slide_in_animation.setDuration(300)  # 增加持续时间，更流畅
-        self.slide_in_animation.setEasingCurve(QEasingCurve.Type.OutBack)  # 使用弹性效果
-
-        # 滑出动画
-        self.slide_out_animation = QPropertyAnimation(self, b"pos")
-        self.slide_out_animation.setDuration(200)  # 增加持续时间
-        self.slide_out_animation.setEasingCurve(QEasingCurve.Type.InQuad)
+        # 淡入淡出和滑入滑出由一个动画控制器统一驱动，显示时长取自效果配置
+        effects = get_effects_model()
+        self.animator = WindowAnimator(
+            self,
+            fade_in_duration=effects.fade_duration,
+            slide_in_duration=effects.slide_duration,
+        )
+        self.animator.opacity_changed.connect(self._on_opacity_changed)
 
     def _load_stylesheet(self):
-        """加载样式表"""
-        try:
-            # 处理PyInstaller打包后的路径
-            if hasattr(sys, '_MEIPASS'):
-                # 在打包的exe中，资源文件在临时目录中
-                style_path = os.path.join(sys._MEIPASS, 'resources', 'styles.qss')
-            else:
-                # 在开发环境中，使用相对路径
-                style_path = os.path.join('resources', 'styles.qss')
-            
-            if os.path.exists(style_path):
-                with open(style_path, "r", encoding="utf-8") as f:
-                    style = f.read()
-                    self.setStyleSheet(style)
-            else:
-                print(f"警告: 样式文件 '{style_path}' 未找到，使用默认样式。")
-                self._apply_default_style()
-        except Exception as e:
-            print(f"加载样式文件时出错: {e}")
-            self._apply_default_style()
-
-    def _apply_default_style(self):
-        """应用默认样式，当样式文件不可用时使用"""
-        default_style = """
-        ShortcutCardWidget#ShortcutCard {
-            background-color: rgba(255, 255, 255, 120);
-            border-radius: 12px;
-            min-width: 90px;
-            max-width: 90px;
-            min-height: 90px;
-            max-height: 90px;
-            padding: 8px;
-            border: 1px solid rgba(255, 255, 255, 80);
-            background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                       stop: 0 rgba(255, 255, 255, 140),
-                                       stop: 0.5 rgba(250, 250, 255, 100),
-                                       stop: 1 rgba(240, 240, 250, 120));
-        }
-        
-        ShortcutCardWidget#ShortcutCard QLabel#keyLabel {
-            color: rgba(20, 20, 30, 255);
-            font-size: 24px;
-            font-weight: bold;
-            background-color: transparent;
-        }
-        
-        ShortcutCardWidget#ShortcutCard QLabel#actionLabel {
-            color: rgba(30, 30, 40, 240);
-            font-size: 10px;
-            background-color: transparent;
-        }
         """
-        self.setStyleSheet(default_style)
+        应用按当前外观配置生成的样式表，所有卡片共用窗口的样式表，只需一次样式计算
+        """
+        stylesheet = get_overlay_stylesheet(
+            self._appearance_values(), get_effects_model().cached_card_background
+        )
+        # 样式表内容未变化时（如缓存背景模式下只改了背景色）跳过重新应用
+        if stylesheet != getattr(self, '_applied_stylesheet', None):
+            self.setStyleSheet(stylesheet)
+            self._applied_stylesheet = stylesheet
 
+    def _appearance_model(self) -> Appearance:
+        """窗口使用的外观配置"""
+        return self.appearance_override or get_appearance_model()
+    
+    def _appearance_values(self) -> Dict:
+        """窗口使用的外观配置（字典形式，用于样式表和背景缓存）"""
+        return self._override_values or get_appearance()
+    
+    def _new_card(self, item_data: Dict) -> ShortcutCardWidget:
+        """按窗口使用的外观创建卡片"""
+        return ShortcutCardWidget(item_data["key"], item_data["action"], appearance=self.appearance_override)
+    
     def _create_cards(self):
-        """创建快捷键卡片"""
+        """创建快捷键卡片（分页时只创建当前页的卡片）"""
         self._clear_cards()
-        
-        # 存储卡片引用，用于动画触发
-        self.cards = []
-        
-        for item_data in self.shortcut_items:
-            card = ShortcutCardWidget(item_data["key"], item_data["action"])
-            self.layout.addWidget(card)
-            self.cards.append(card)
-        
-        self.adjustSize()  # 根据内容调整窗口大小
+        self.page = 0
+        self._update_paging()
+        self._bind_page()
 
     def _clear_cards(self):
         """清除所有卡片"""
         # 清空卡片引用
         self.cards = []
+        self.card_pool = []
+        self.card_index = {}
         
         for i in reversed(range(self.layout.count())): 
             item = self.layout.itemAt(i)
@@ -174,75 +227,291 @@ class HintWidget(QWidget):
 
     def update_shortcuts(self, shortcut_items: List[Dict]):
         """
-        更新快捷键列表
+        更新快捷键列表，按按键比较新旧列表，尽量复用现有卡片
         
         Args:
             shortcut_items: 新的快捷键列表
+            
+        Returns:
+            Dict: 本次更新创建、复用、更新内容、删除和移动的卡片数量
         """
         self.shortcut_items = shortcut_items
-        self._create_cards()
+        self._update_paging()
+        page_items = self._page_items()
+        
+        # 按按键分组现有的可见卡片，支持同一按键对应多张卡片
+        cards_by_key: Dict[str, List[ShortcutCardWidget]] = {}
+        for card in self.cards:
+            cards_by_key.setdefault(card.key_label.text(), []).append(card)
+        
+        new_cards: List[ShortcutCardWidget] = [None] * len(page_items)
+        created = reused = updated = 0
+        
+        # 第一轮：按按键匹配现有卡片，动作名称变化时才更新内容
+        for index, item_data in enumerate(page_items):
+            bucket = cards_by_key.get(item_data["key"])
+            if bucket:
+                card = bucket.pop(0)
+                if card.action_label.text() != item_data["action"]:
+                    card.update_content(item_data["key"], item_data["action"])
+                    updated += 1
+                new_cards[index] = card
+                reused += 1
+        
+        # 第二轮：未匹配的位置优先复用剩余卡片（含卡片池中隐藏的），不足时再创建
+        matched = set(card for card in new_cards if card is not None)
+        spare_cards = [card for card in self.card_pool if card not in matched]
+        for index, item_data in enumerate(page_items):
+            if new_cards[index] is None:
+                if spare_cards:
+                    card = spare_cards.pop(0)
+                    card.update_content(item_data["key"], item_data["action"])
+                    updated += 1
+                    reused += 1
+                else:
+                    card = self._new_card(item_data)
+                    created += 1
+                new_cards[index] = card
+        
+        # 删除多余的卡片
+        for card in spare_cards:
+            self.layout.removeWidget(card)
+            card.setParent(None)
+            card.deleteLater()
+        
+        moved = self._reorder_cards(new_cards)
+        for card in new_cards:
+            if card.isHidden():
+                card.show()
+        
+        self.cards = new_cards
+        self.card_pool = list(new_cards)
+        self._update_page_label()
+        self._rebuild_card_index()
+        self._invalidate_snapshot()
+        self._adjust_size()
+        
+        self.last_update_stats = {
+            "created": created,
+            "reused": reused,
+            "updated": updated,
+            "removed": len(spare_cards),
+            "moved": moved
+        }
+        return self.last_update_stats
 
-    def show_above_taskbar(self):
-        """在任务栏上方显示窗口"""
-        screen = QGuiApplication.primaryScreen()
-        if not screen:
-            print("错误: 未找到主屏幕。")
-            self.show()  # Fallback
+    def _reorder_cards(self, ordered_cards: List[ShortcutCardWidget]) -> int:
+        """
+        以最少的移动次数将布局中的卡片调整为指定顺序
+        
+        Args:
+            ordered_cards: 目标顺序的卡片列表
+            
+        Returns:
+            int: 移动（或新插入）的卡片数量
+        """
+        # 已在布局中且相对顺序正确的最长子序列保持不动
+        in_layout = [index for index, card in enumerate(ordered_cards) if self.layout.indexOf(card) >= 0]
+        positions = [self.layout.indexOf(ordered_cards[index]) for index in in_layout]
+        keep = set(ordered_cards[in_layout[i]] for i in _longest_increasing_subsequence(positions))
+        
+        for card in ordered_cards:
+            if card not in keep and self.layout.indexOf(card) >= 0:
+                self.layout.removeWidget(card)
+        
+        moved = 0
+        for index, card in enumerate(ordered_cards):
+            if card not in keep:
+                self.layout.insertWidget(index, card)
+                moved += 1
+        return moved
+
+    def bind_shortcuts(self, shortcut_items: List[Dict]):
+        """
+        按位置复用已有卡片显示另一组快捷键，只更新文字，多余的卡片隐藏留待复用
+        
+        Args:
+            shortcut_items: 要显示的快捷键列表
+        """
+        self.shortcut_items = shortcut_items
+        self.page = 0
+        self._update_paging()
+        self._bind_page()
+
+    def _bind_page(self):
+        """按位置将当前页的快捷键绑定到卡片池中的卡片，不足时创建，多余的隐藏留待复用"""
+        page_items = self._page_items()
+        created = False
+        
+        for index, item_data in enumerate(page_items):
+            if index < len(self.card_pool):
+                card = self.card_pool[index]
+                card.update_content(item_data["key"], item_data["action"])
+                card.show()
+            else:
+                card = self._new_card(item_data)
+                self.layout.addWidget(card)
+                self.card_pool.append(card)
+                created = True
+        
+        # 新创建的卡片可能比已有卡片大，按新的尺寸重新分页
+        if created and self._update_paging():
+            self._bind_page()
             return
+        
+        for card in self.card_pool[len(page_items):]:
+            card.hide()
+        
+        self.cards = self.card_pool[:len(page_items)]
+        self._update_page_label()
+        self._rebuild_card_index()
+        self._invalidate_snapshot()
+        self._adjust_size()
+
+    def _cell_size(self) -> QSize:
+        """
+        获取一张卡片占用的大小，用于计算每行和每页的卡片数
+        
+        还没有卡片时为第一个快捷键创建卡片，该卡片留在卡片池中随后被绑定复用
+        """
+        if not self.card_pool:
+            if not self.shortcut_items:
+                return QSize()
+            item_data = self.shortcut_items[0]
+            card = self._new_card(item_data)
+            self.layout.addWidget(card)
+            card.hide()
+            self.card_pool.append(card)
+        
+        # 取所有卡片中最大的尺寸，保证换行后不会超出屏幕
+        size = QSize(0, 0)
+        for card in self.card_pool:
+            card.ensurePolished()
+            size = size.expandedTo(card.sizeHint().expandedTo(card.minimumSize()).boundedTo(card.maximumSize()))
+        return size
 
-        available_geom = screen.availableGeometry()  # 可用桌面区域 (通常不包括任务栏)
-        full_geom = screen.geometry()  # 整个屏幕区域
+    def _update_paging(self) -> bool:
+        """
+        根据所在屏幕的可用区域计算每行卡片数和每页卡片数
+        
+        Returns:
+            bool: 每行或每页的卡片数变化返回True，否则返回False
+        """
+        effects = get_effects_model()
+        available = get_screen_placement().available_geometry(effects.placement_screen)
+        cell = self._cell_size()
+        columns = page_size = 0
         
-        # 水平居中
-        win_x = available_geom.left() + (available_geom.width() - self.width()) / 2
+        if available is not None and not cell.isEmpty():
+            spacing = self.layout.spacing()
+            margins = self.layout.contentsMargins()
+            
+            usable_width = available.width() - 2 * EDGE_MARGIN - margins.left() - margins.right()
+            columns = max(1, (usable_width + spacing) // (cell.width() + spacing))
+            
+            # 关闭分页时只在卡片超出屏幕高度时才分页，窗口不会高于屏幕
+            usable_height = (available.height() - 2 * EDGE_MARGIN - margins.top() - margins.bottom()
+                             - self.page_label.sizeHint().height())
+            rows = max(1, (usable_height + spacing) // (cell.height() + spacing))
+            if effects.paginate and effects.max_rows > 0:
+                rows = min(rows, effects.max_rows)
+            if len(self.shortcut_items) > columns * rows:
+                page_size = columns * rows
         
-        # 默认假设任务栏在底部
-        win_y = available_geom.bottom() - self.height() - 10  # 距离任务栏10像素
+        changed = (columns, page_size) != (self.columns, self.page_size)
+        self.columns, self.page_size = columns, page_size
+        # 分页时每页预留整页的位置，翻页时窗口大小不变
+        self.layout.set_grid(columns, page_size)
+        self.page = min(self.page, self.get_page_count() - 1)
+        return changed
+
+    def _page_items(self) -> List[Dict]:
+        """当前页的快捷键"""
+        if not self.page_size:
+            return self.shortcut_items
+        start = self.page * self.page_size
+        return self.shortcut_items[start:start + self.page_size]
 
-        # 检查任务栏是否在顶部
-        # 如果可用区域的顶部y坐标大于整个屏幕的顶部y坐标 (通常为0)，说明顶部有东西 (可能是任务栏)
-        if available_geom.y() > full_geom.y() and available_geom.height() < full_geom.height():
-            win_y = available_geom.top() + 10  # 距离顶部任务栏10像素
+    def _update_page_label(self):
+        """更新页码，不分页时隐藏"""
+        if self.page_size:
+            self.page_label.setText(f"{self.page + 1} / {self.get_page_count()}")
+            self.page_label.show()
+        else:
+            self.page_label.hide()
+
+    def get_page_count(self) -> int:
+        """
+        获取页数
         
-        # 对于左右任务栏的情况，此基本定位逻辑可能不完美，但会确保在可用区域内
+        Returns:
+            int: 页数，不分页时为1
+        """
+        if not self.page_size:
+            return 1
+        return max(1, (len(self.shortcut_items) + self.page_size - 1) // self.page_size)
+
+    def set_page(self, page: int):
+        """
+        切换到指定页，按位置复用卡片只更新文字
+        
+        Args:
+            page: 页码（从0开始），超出范围时取最近的有效页
+        """
+        page = max(0, min(page, self.get_page_count() - 1))
+        if page == self.page:
+            return
+        self.page = page
+        self._bind_page()
+        if self.isVisible():
+            self._ensure_snapshot()
+
+    def next_page(self):
+        """切换到下一页，最后一页时回到第一页"""
+        self.set_page((self.page + 1) % self.get_page_count())
 
-        final_pos = QPoint(int(win_x), int(win_y))
-        start_pos_slide = QPoint(int(win_x), int(win_y) + 30)  # 从下方30px处滑入，增加距离
+    def previous_page(self):
+        """切换到上一页，第一页时到最后一页"""
+        self.set_page((self.page - 1) % self.get_page_count())
 
-        self.move(start_pos_slide)  # 初始位置在目标位置下方
-        self.setWindowOpacity(0.0)  # 确保开始时是透明的
-        self.show()
+    def _adjust_size(self):
+        """根据卡片条的内容调整窗口大小"""
+        # 卡片条的布局嵌套在分页布局中，先立即更新两层布局（含窗口最小尺寸），窗口才能按新的卡片数量缩放
+        self.strip_layout.activate()
+        self.stack.invalidate()
+        self.stack.activate()
+        # 分页布局总是报告可扩展，adjustSize会给窗口加上最小宽度，直接使用建议尺寸
+        self.resize(self.sizeHint())
 
-        self.fade_in_animation.start()  # 开始淡入动画
+    def _rebuild_card_index(self):
+        """重建 规范化按键 -> 卡片列表 的索引，同一按键可对应多张卡片"""
+        card_index: Dict[str, List[ShortcutCardWidget]] = {}
+        for card in self.cards:
+            card_index.setdefault(normalize_key_text(card.key_label.text()), []).append(card)
+        self.card_index = card_index
 
-        self.slide_in_animation.setStartValue(start_pos_slide)
-        self.slide_in_animation.setEndValue(final_pos)
-        self.slide_in_animation.start()  # 开始滑入动画
+    def show_above_taskbar(self):
+        """在任务栏上方显示窗口，正在隐藏时从当前位置反转为显示"""
+        # 所在屏幕变化时按新的宽度重新分页
+        if self._update_paging():
+            self._bind_page()
+        self._ensure_snapshot()
+        
+        # 位置由共享的定位器按屏幕缓存，屏幕变化时才重新计算
+        final_pos = get_screen_placement().position_for(
+            self.size(), get_effects_model().placement_screen
+        )
+        if final_pos is None:
+            print("错误: 未找到可用屏幕。")
+            self.show()  # Fallback
+            return
+
+        # 从下方30px处滑入并淡入
+        self.animator.show_at(final_pos)
 
     def hide_with_animation(self):
-        """带动画地隐藏窗口"""
-        if self.isVisible() and self.fade_out_animation.state() != QPropertyAnimation.State.Running:
-            current_pos = self.pos()
-            end_pos_slide = QPoint(current_pos.x(), current_pos.y() + 30)  # 向下滑出30px
-
-            # 断开所有可能的连接
-            # 先检查是否有连接，避免无效断开导致的警告
-            connections = self.fade_out_animation.receivers("finished()")
-            if connections > 0:
-                try:
-                    # 既然有连接，就断开这个特定的连接，而不是空白的断开
-                    self.fade_out_animation.finished.disconnect(self.hide)
-                except Exception:
-                    pass  # 忽略断开连接错误
-
-            # 重新连接隐藏信号
-            self.fade_out_animation.finished.connect(self.hide)
-            
-            # 启动渐变和滑动动画
-            self.fade_out_animation.start()
-            self.slide_out_animation.setStartValue(current_pos)
-            self.slide_out_animation.setEndValue(end_pos_slide)
-            self.slide_out_animation.start()
+        """带动画地隐藏窗口，正在显示时从当前状态反转为隐藏"""
+        self.animator.hide()
 
     def get_card_count(self) -> int:
         """
@@ -253,31 +522,235 @@ class HintWidget(QWidget):
         """
         return len(self.shortcut_items)
     
-    def trigger_key_animation(self, key_char: str):
+    def trigger_key_animation(self, key_char: str) -> bool:
         """
         触发指定按键的动画效果
         
         Args:
-            key_char: 按键字符
+            key_char: 按键字符或组合键文本，如 "C"、"Shift+Tab"
+            
+        Returns:
+            bool: 有对应的卡片返回True，否则返回False
         """
-        if hasattr(self, 'cards'):
-            for card in self.cards:
-                if card.matches_key(key_char):
-                    card.trigger_animation()
-                    break
+        cards = self.card_index.get(normalize_key_text(key_char), ())
+        
+        # 关闭动画时不创建粒子层，也不订阅动画时钟
+        if not animations_enabled():
+            return bool(cards)
+        
+        for card in cards:
+            print(f"🎆 触发烟花动画: {card.key_label.text()} 键")
+            if self.particle_layer is None:
+                self.particle_layer = ParticleLayer(self)
+            self.particle_layer.trigger_fireworks(card.geometry().translated(self.card_strip.pos()))
+        return bool(cards)
+    
+    def _paint_card_backgrounds(self, painter: QPainter):
+        """使用缓存的背景图片为所有卡片绘制背景和阴影"""
+        offset = self.card_strip.pos()
+        for card in self.cards:
+            if not card.isHidden():
+                # 卡片尺寸相同，实际只渲染一次背景
+                geometry = card.geometry().translated(offset)
+                background = get_card_background(
+                    self._appearance_values(), geometry.width(), geometry.height(),
+                    shadow=shadows_enabled(),
+                    device_pixel_ratio=self.devicePixelRatioF()
+                )
+                painter.drawPixmap(geometry.x() - SHADOW_PADDING, geometry.y() - SHADOW_PADDING, background)
+    
+    def paintEvent(self, event):
+        """实时显示卡片时，在卡片下方绘制缓存的背景"""
+        try:
+            super().paintEvent(event)
+            
+            # 快照中已包含卡片背景
+            if self.stack.currentWidget() is not self.card_strip:
+                return
+            if not get_effects_model().cached_card_background:
+                return
+            
+            painter = QPainter(self)
+            self._paint_card_backgrounds(painter)
+            painter.end()
+            
+        except (KeyboardInterrupt, SystemExit):
+            # 允许正常的程序退出
+            raise
+        except Exception as e:
+            # 捕获所有其他异常，避免绘制错误导致程序崩溃
+            print(f"绘制错误（已忽略）: {e}")
+    
+    def _invalidate_snapshot(self):
+        """内容或外观变化后快照失效，切换回实时卡片，下次显示时重新渲染"""
+        self.snapshot_dirty = True
+        if self.stack.currentWidget() is not self.card_strip:
+            self.stack.setCurrentWidget(self.card_strip)
+        # 清除旧快照，避免其尺寸影响窗口大小
+        if self.snapshot is not None:
+            self.snapshot = None
+            self.snapshot_view.clear()
+    
+    def _ensure_snapshot(self):
+        """
+        快照模式下确保快照是最新的并切换到快照页，未启用快照模式时显示实时卡片
+        """
+        if not get_effects_model().snapshot_mode:
+            self._invalidate_snapshot()
+            return
+        
+        dpr = self.devicePixelRatioF()
+        if self.snapshot_dirty or self.snapshot is None or self.snapshot.devicePixelRatio() != dpr:
+            try:
+                self.snapshot = self._render_snapshot(dpr)
+                self.snapshot_dirty = False
+                self.snapshot_view.setPixmap(self.snapshot)
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except Exception as e:
+                # 渲染失败时继续使用实时卡片
+                print(f"渲染提示窗口快照时出错: {e}")
+                self._invalidate_snapshot()
+                return
+        
+        self.stack.setCurrentWidget(self.snapshot_view)
+    
+    def _render_snapshot(self, device_pixel_ratio: float) -> QPixmap:
+        """
+        将卡片条（含背景和阴影）渲染为图片
+        
+        Args:
+            device_pixel_ratio: 设备像素比，按物理像素渲染保证高DPI屏幕下清晰
+            
+        Returns:
+            QPixmap: 快照图片
+        """
+        # 确保卡片已按当前内容完成布局
+        self.stack.setCurrentWidget(self.card_strip)
+        self.card_strip.resize(self.card_strip.sizeHint())
+        self.strip_layout.activate()
+        size = self.card_strip.size()
+        
+        snapshot = QPixmap(round(size.width() * device_pixel_ratio), round(size.height() * device_pixel_ratio))
+        snapshot.setDevicePixelRatio(device_pixel_ratio)
+        snapshot.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(snapshot)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if get_effects_model().cached_card_background:
+            painter.translate(-self.card_strip.pos())
+            self._paint_card_backgrounds(painter)
+            painter.translate(self.card_strip.pos())
+        self.card_strip.render(painter, QPoint(), QRegion(), QWidget.RenderFlag.DrawChildren)
+        painter.end()
+        
+        self.snapshot_render_count += 1
+        return snapshot
+    
+    def wheelEvent(self, event):
+        """分页时滚动鼠标滚轮翻页"""
+        if self.page_size and event.angleDelta().y():
+            if event.angleDelta().y() < 0:
+                self.next_page()
+            else:
+                self.previous_page()
+            event.accept()
+        else:
+            super().wheelEvent(event)
+    
+    def moveEvent(self, event):
+        """窗口移动（如滑入滑出动画）时粒子层随之移动"""
+        super().moveEvent(event)
+        if self.particle_layer is not None and self.particle_layer.isVisible():
+            self.particle_layer.sync_geometry()
+    
+    def _on_opacity_changed(self, opacity: float):
+        """窗口淡入淡出时粒子层的不透明度随之变化"""
+        if self.particle_layer is not None and self.particle_layer.isVisible():
+            self.particle_layer.sync_opacity()
+    
+    def resizeEvent(self, event):
+        """窗口大小变化时粒子层随之覆盖整个窗口"""
+        super().resizeEvent(event)
+        if self.particle_layer is not None and self.particle_layer.isVisible():
+            self.particle_layer.sync_geometry()
+    
+    def hideEvent(self, event):
+        """窗口隐藏时停止烟花并隐藏粒子层"""
+        if self.particle_layer is not None:
+            self.particle_layer.hide()
+        if not self.animator.is_hiding():
+            # 窗口被直接隐藏（未经过隐藏动画）
+            self.animator.stop()
+        super().hideEvent(event)
+    
+    def _on_config_changed(self, changes: List[ConfigChange]):
+        """
+        外观或效果配置变化，只做变化的字段需要的更新
+        
+        Args:
+            changes: 外观和效果配置段的变化
+        """
+        changed = {change.section: change for change in changes}
+        appearance = changed.get("appearance", ConfigChange("appearance"))
+        effects = changed.get("effects", ConfigChange("effects"))
+        
+        if effects.touches(ANIMATION_EFFECT_FIELDS):
+            self._apply_animation_settings()
+        
+        # 卡片尺寸变化需要重新布局，其余更新都包含在内
+        if appearance.touches(SIZE_APPEARANCE_FIELDS):
+            self.update_appearance()
+            return
+        
+        if effects.touches(RENDER_EFFECT_FIELDS):
+            for card in self.card_pool:
+                card.update_render_mode()
+        if appearance.touches(COLOR_APPEARANCE_FIELDS) or effects.touches(RENDER_EFFECT_FIELDS):
+            self.restyle()
+        
+        if effects.touches(PAGING_EFFECT_FIELDS) and self._update_paging():
+            self._bind_page()
+        elif effects.touches(("snapshot_mode",)):
+            self._invalidate_snapshot()
+    
+    def _apply_animation_settings(self):
+        """按效果配置更新显示动画的时长"""
+        effects = get_effects_model()
+        show = self.animator.transitions["show"]
+        show.fade_duration = effects.fade_duration
+        show.slide_duration = effects.slide_duration
+    
+    def restyle(self):
+        """只重新应用样式表并重绘（颜色变化），不改变卡片尺寸，无需重新布局"""
+        self._load_stylesheet()
+        # 背景缓存按颜色区分，新颜色的背景在绘制时渲染
+        self._invalidate_snapshot()
+        self.update()
+    
+    def release(self):
+        """窗口不再使用时取消配置订阅并销毁窗口"""
+        unsubscribe_config_changes(self._on_config_changed)
+        self.hide()
+        self.deleteLater()
     
     def update_appearance(self):
-        """更新所有卡片的外观"""
+        """更新所有卡片的外观（含尺寸和字体），并重新分页"""
         try:
-            for i in range(self.layout.count()):
-                item = self.layout.itemAt(i)
-                if item and item.widget():
-                    widget = item.widget()
-                    if hasattr(widget, 'update_appearance'):
-                        widget.update_appearance()
+            # 外观变化后重新渲染卡片背景，并重新应用窗口样式表
+            clear_card_background_cache()
+            self._load_stylesheet()
+            
+            appearance = self._appearance_model()
+            for card in self.card_pool:
+                card.update_appearance(appearance)
             
-            # 重新调整窗口大小
-            self.adjustSize()
+            # 卡片尺寸可能变化，重新分页并调整窗口大小
+            if self._update_paging():
+                self._bind_page()
+            self._invalidate_snapshot()
+            self._adjust_size()
+            self.update()
             
         except Exception as e:
             print(f"更新提示窗口外观时出错: {e}") 
\ No newline at end of file
@@ -0,0 +1,259 @@
+"""
+提示窗口管理器 - 按需创建各组合键的提示窗口，并释放长时间未使用的窗口
+"""
+
+import time
+from typing import Dict, Iterable, List, Optional
+from PySide6.QtCore import QObject, QTimer, Slot
+
+# 使用绝对导入避免相对导入问题
+import sys
+import os
+
+# 确保项目根目录在sys.path中
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from ui.hint_widget import HintWidget
+
+# 共享窗口模式下唯一窗口的键
+SHARED_WINDOW_KEY = "shared"
+
+
+class HintWindowManager(QObject):
+    """提示窗口管理器"""
+
+    def __init__(self, shortcut_groups: Dict[str, List[Dict]], idle_release: int = 600,
+                 prewarm: bool = False, prewarm_delay: int = 3000,
+                 shared_window: bool = False, parent=None):
+        """
+        初始化提示窗口管理器
+
+        Args:
+            shortcut_groups: 组合键类型 -> 快捷键列表
+            idle_release: 窗口多久未使用后释放（秒），0表示从不释放
+            prewarm: 是否在启动后空闲时预先创建所有窗口
+            prewarm_delay: 启动后多久开始预创建（毫秒）
+            shared_window: 是否所有组合键共用一个窗口，切换时复用卡片只更新文字
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.shortcut_groups = dict(shortcut_groups)
+        self.idle_release = idle_release
+        self.shared_window = shared_window
+
+        # 已创建的窗口及其最近使用时间，共享模式下只有 SHARED_WINDOW_KEY 一项
+        self.windows: Dict[str, HintWidget] = {}
+        self.last_used: Dict[str, float] = {}
+
+        # 共享窗口当前显示的组合键类型
+        self.bound_type: Optional[str] = None
+
+        # 统计信息
+        self.created_count = 0
+        self.released_count = 0
+
+        # 定期释放空闲窗口
+        self.release_timer = QTimer(self)
+        self.release_timer.timeout.connect(self.release_idle_windows)
+        self.set_idle_release(idle_release)
+
+        # 空闲时预创建窗口，每次只创建一个以免阻塞界面
+        self._prewarm_queue: List[str] = []
+        self.set_prewarm(prewarm, prewarm_delay)
+
+    def set_idle_release(self, idle_release: int):
+        """
+        设置窗口空闲释放时间
+
+        Args:
+            idle_release: 窗口多久未使用后释放（秒），0表示从不释放
+        """
+        self.idle_release = idle_release
+        if idle_release > 0:
+            self.release_timer.start(min(idle_release, 60) * 1000)
+        else:
+            self.release_timer.stop()
+
+    def set_prewarm(self, prewarm: bool, prewarm_delay: int = 3000):
+        """
+        设置是否预创建窗口，开启时在指定延迟后逐个创建尚未创建的窗口
+
+        Args:
+            prewarm: 是否预创建窗口
+            prewarm_delay: 多久后开始预创建（毫秒）
+        """
+        if not prewarm:
+            self._prewarm_queue = []
+            return
+
+        was_idle = not self._prewarm_queue
+        self._prewarm_queue = list(self.shortcut_groups)[:1] if self.shared_window else list(self.shortcut_groups)
+        if was_idle:
+            QTimer.singleShot(prewarm_delay, self._prewarm_next)
+
+    def set_shared_window(self, shared_window: bool):
+        """
+        切换是否所有组合键共用一个窗口，已创建的窗口全部释放，之后按新的模式创建
+
+        Args:
+            shared_window: 是否共用一个窗口
+        """
+        if shared_window == self.shared_window:
+            return
+        for window_key in list(self.windows):
+            self._release_window(window_key)
+        self.shared_window = shared_window
+
+    def has_group(self, key_type: str) -> bool:
+        """
+        检查是否配置了指定组合键的快捷键组
+
+        Args:
+            key_type: 组合键类型
+
+        Returns:
+            bool: 已配置返回True，否则返回False
+        """
+        return key_type in self.shortcut_groups
+
+    def get_window(self, key_type: str) -> Optional[HintWidget]:
+        """
+        获取提示窗口，不存在时创建
+
+        Args:
+            key_type: 组合键类型
+
+        Returns:
+            HintWidget: 提示窗口，未配置该组合键时返回None
+        """
+        if key_type not in self.shortcut_groups:
+            return None
+
+        window_key = self._window_key(key_type)
+        window = self.windows.get(window_key)
+        if window is None:
+            window = HintWidget(self.shortcut_groups[key_type])
+            self.windows[window_key] = window
+            self.created_count += 1
+            if self.shared_window:
+                self.bound_type = key_type
+        elif self.shared_window and self.bound_type != key_type:
+            window.bind_shortcuts(self.shortcut_groups[key_type])
+            self.bound_type = key_type
+
+        self.last_used[window_key] = time.monotonic()
+        return window
+
+    def _window_key(self, key_type: str) -> str:
+        """获取组合键对应的窗口键"""
+        return SHARED_WINDOW_KEY if self.shared_window else key_type
+
+    def show(self, key_type: str):
+        """
+        隐藏其他窗口并显示指定组合键的提示窗口
+
+        Args:
+            key_type: 组合键类型
+        """
+        # 共享模式下只有一个窗口，直接换绑卡片即可
+        if not self.shared_window:
+            self.hide_all()
+        window = self.get_window(key_type)
+        if window is not None:
+            window.show_above_taskbar()
+
+    def hide_all(self):
+        """隐藏所有已创建的提示窗口"""
+        for window in self.windows.values():
+            if window.isVisible():
+                window.hide_with_animation()
+
+    def trigger_key_animation(self, key_type: str, key_char: str) -> bool:
+        """
+        触发指定窗口中对应按键的动画
+
+        Args:
+            key_type: 组合键类型
+            key_char: 按键字符
+
+        Returns:
+            bool: 窗口中有对应的卡片返回True，否则返回False
+        """
+        if self.shared_window and self.bound_type != key_type:
+            return False
+
+        window_key = self._window_key(key_type)
+        window = self.windows.get(window_key)
+        if window is None:
+            return False
+        self.last_used[window_key] = time.monotonic()
+        return window.trigger_key_animation(key_char)
+
+    def update_shortcuts(self, shortcut_groups: Dict[str, List[Dict]],
+                         key_types: Optional[Iterable[str]] = None):
+        """
+        更新快捷键组，只刷新已创建的窗口
+
+        Args:
+            shortcut_groups: 组合键类型 -> 快捷键列表
+            key_types: 内容有变化的组合键类型，None表示全部刷新
+        """
+        self.shortcut_groups = dict(shortcut_groups)
+        changed_types = None if key_types is None else set(key_types)
+        for window_key in list(self.windows):
+            key_type = self.bound_type if self.shared_window else window_key
+            if changed_types is not None and key_type in self.shortcut_groups and key_type not in changed_types:
+                continue
+            if key_type in self.shortcut_groups:
+                self.windows[window_key].update_shortcuts(self.shortcut_groups[key_type])
+            else:
+                self._release_window(window_key)
+
+    @Slot()
+    def release_idle_windows(self):
+        """释放超过空闲时间且未显示的窗口"""
+        if self.idle_release <= 0:
+            return
+
+        now = time.monotonic()
+        for window_key in list(self.windows):
+            window = self.windows[window_key]
+            if not window.isVisible() and now - self.last_used.get(window_key, now) >= self.idle_release:
+                self._release_window(window_key)
+
+    def _release_window(self, window_key: str):
+        """销毁指定窗口"""
+        window = self.windows.pop(window_key, None)
+        self.last_used.pop(window_key, None)
+        if window_key == SHARED_WINDOW_KEY:
+            self.bound_type = None
+        if window is not None:
+            window.release()
+            self.released_count += 1
+
+    @Slot()
+    def _prewarm_next(self):
+        """预创建下一个窗口"""
+        while self._prewarm_queue:
+            key_type = self._prewarm_queue.pop(0)
+            if self._window_key(key_type) not in self.windows and key_type in self.shortcut_groups:
+                self.get_window(key_type)
+                break
+
+        if self._prewarm_queue:
+            QTimer.singleShot(0, self._prewarm_next)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        获取窗口统计信息
+
+        Returns:
+            Dict: 统计信息字典
+        """
+        return {
+            "live": len(self.windows),
+            "created": self.created_count,
+            "released": self.released_count
+        }
@@ -0,0 +1,210 @@
+"""
+粒子层组件 - 覆盖在提示窗口之上的透明效果窗口，统一绘制所有卡片的烟花粒子
+
+粒子层是独立的无边框窗口而不是提示窗口的子控件：透明子控件重绘时Qt会连同下方的卡片
+一起重绘，而独立窗口由系统合成，烟花动画期间卡片及其阴影效果完全不需要重绘
+"""
+
+import random
+from typing import List, Tuple
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QRect
+from PySide6.QtGui import QColor, QPainter
+
+# 使用绝对导入避免相对导入问题
+import sys
+import os
+
+# 确保项目根目录在sys.path中
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from ui.particle_system import ParticleSystem
+from ui.particle_sprites import get_sprite_atlas, MAX_SIZE
+from ui.animation_clock import get_animation_clock
+
+# 烟花颜色列表 - 使用中国风配色
+FIREWORK_COLORS = [
+    QColor(255, 215, 0),    # 金色
+    QColor(255, 69, 0),     # 橙红色
+    QColor(255, 20, 147),   # 深粉色
+    QColor(138, 43, 226),   # 蓝紫色
+    QColor(0, 191, 255),    # 深天蓝
+    QColor(50, 205, 50),    # 酸橙绿
+    QColor(255, 105, 180),  # 热粉色
+    QColor(255, 140, 0),    # 深橙色
+]
+
+# 烟花爆炸点之间的间隔（毫秒），形成连续爆炸效果
+FIREWORK_BURST_INTERVAL = 150
+
+# 爆炸点相对卡片中心的偏移：中心、左上、右上、下方
+FIREWORK_OFFSETS = [(0, 0), (-20, -15), (20, -15), (0, 20)]
+
+
+class ParticleLayer(QWidget):
+    """烟花粒子效果层"""
+
+    def __init__(self, host: QWidget):
+        """
+        初始化粒子层
+
+        Args:
+            host: 提示窗口，粒子层覆盖其整个区域并随其移动
+        """
+        super().__init__(host)
+        self.host = host
+
+        # 透明、不接收输入、不获取焦点的置顶工具窗口，作为提示窗口的附属窗口保持在其上方
+        self.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint |
+            Qt.WindowType.WindowStaysOnTopHint |
+            Qt.WindowType.Tool |
+            Qt.WindowType.WindowTransparentForInput |
+            Qt.WindowType.NoDropShadowWindowHint
+        )
+        self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+
+        # 所有卡片的粒子共用一个粒子系统，坐标为提示窗口坐标
+        self.particles = ParticleSystem()
+        self.animation_clock = get_animation_clock()
+
+        # 等待爆炸的烟花: (到期时间毫秒, x, y, 颜色序号)
+        self.pending_bursts: List[Tuple[float, int, int, int]] = []
+
+        # 上一帧粒子覆盖的区域，重绘时与本帧区域合并以擦除旧粒子
+        self.dirty_rect = QRect()
+
+    def sync_geometry(self):
+        """与提示窗口的位置和大小保持一致"""
+        if self.geometry() != self.host.geometry():
+            self.setGeometry(self.host.geometry())
+
+    def sync_opacity(self):
+        """与提示窗口的不透明度保持一致，提示窗口淡入淡出时烟花随之淡入淡出"""
+        opacity = self.host.windowOpacity()
+        if self.windowOpacity() != opacity:
+            self.setWindowOpacity(opacity)
+
+    def trigger_fireworks(self, card_rect: QRect):
+        """
+        在卡片位置触发烟花，已有的粒子继续播放
+
+        Args:
+            card_rect: 卡片在提示窗口中的区域
+        """
+        # 只在播放烟花时显示粒子窗口
+        self.sync_geometry()
+        if not self.isVisible():
+            self.sync_opacity()
+            self.show()
+
+        center = card_rect.center()
+        now = self.animation_clock.now()
+        for i, (dx, dy) in enumerate(FIREWORK_OFFSETS):
+            x, y = center.x() + dx, center.y() + dy
+            color_index = i % len(FIREWORK_COLORS)
+            if i == 0:
+                self._create_firework(x, y, color_index)
+            else:
+                self.pending_bursts.append((now + i * FIREWORK_BURST_INTERVAL, x, y, color_index))
+        self.pending_bursts.sort()
+
+        # 订阅共享动画时钟
+        self.animation_clock.subscribe(self._on_animation_frame)
+
+    def _create_firework(self, x: int, y: int, color_index: int):
+        """创建烟花爆炸效果"""
+        particle_count = random.randint(15, 25)  # 随机粒子数量
+        self.particles.emit_burst(x, y, color_index, particle_count)
+
+    def _particle_rect(self) -> QRect:
+        """计算当前粒子覆盖的区域（包含精灵半径）"""
+        bounds = self.particles.bounds(margin=MAX_SIZE / 2 + 1)
+        if bounds is None:
+            return QRect()
+        return QRect(*bounds).intersected(self.rect())
+
+    def _on_animation_frame(self, now: float) -> bool:
+        """
+        动画时钟的帧回调：释放到期的烟花，推进粒子并重绘变化的区域
+
+        Args:
+            now: 当前时钟时间（毫秒）
+
+        Returns:
+            bool: 动画仍在进行返回True，结束返回False
+        """
+        try:
+            # 释放到期的烟花爆炸
+            while self.pending_bursts and self.pending_bursts[0][0] <= now:
+                _, x, y, color_index = self.pending_bursts.pop(0)
+                self._create_firework(x, y, color_index)
+
+            # 更新所有粒子
+            self.particles.step()
+
+            # 只重绘上一帧和本帧粒子覆盖的区域
+            current_rect = self._particle_rect()
+            dirty_rect = self.dirty_rect.united(current_rect)
+            self.dirty_rect = current_rect
+            if not dirty_rect.isEmpty():
+                self.update(dirty_rect)
+
+            # 如果没有粒子了，停止动画
+            if not self.particles and not self.pending_bursts:
+                print("✨ 烟花动画结束")
+                self.hide()
+                return False
+            return True
+
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as e:
+            print(f"粒子更新错误（已忽略）: {e}")
+            # 清理粒子，停止动画
+            self.hide()
+            return False
+
+    def clear(self):
+        """清除粒子和等待中的烟花，并取消动画时钟订阅"""
+        self.particles.clear()
+        self.pending_bursts = []
+        self.animation_clock.unsubscribe(self._on_animation_frame)
+        if not self.dirty_rect.isEmpty():
+            self.update(self.dirty_rect)
+            self.dirty_rect = QRect()
+
+    def is_animating(self) -> bool:
+        """
+        检查是否有烟花正在播放
+
+        Returns:
+            bool: 正在播放返回True，否则返回False
+        """
+        return bool(self.particles) or bool(self.pending_bursts)
+
+    def paintEvent(self, event):
+        """绘制粒子"""
+        try:
+            if self.particles:
+                painter = QPainter(self)
+                painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+                atlas = get_sprite_atlas(FIREWORK_COLORS, self.devicePixelRatioF())
+                self.particles.draw(painter, atlas)
+                painter.end()
+
+        except (KeyboardInterrupt, SystemExit):
+            # 允许正常的程序退出
+            raise
+        except Exception as e:
+            # 捕获所有其他异常，避免绘制错误导致程序崩溃
+            print(f"绘制错误（已忽略）: {e}")
+
+    def hideEvent(self, event):
+        """隐藏时停止动画"""
+        self.clear()
+        super().hideEvent(event)
@@ -0,0 +1,147 @@
+"""
+粒子精灵图集模块 - 将每种烟花颜色按量化的大小和透明度预渲染到一张图集中，绘制时直接贴图
+"""
+
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QColor, QPainter, QPixmap, QBrush, QRadialGradient
+
+# 量化参数
+SIZE_STEP = 0.5        # 粒子直径量化步长（像素）
+MAX_SIZE = 6.0         # 最大粒子直径（粒子大小上限5 × 生命值上限1.2）
+ALPHA_LEVELS = 16      # 透明度量化级数
+
+
+class ParticleSpriteAtlas:
+    """粒子精灵图集"""
+
+    def __init__(self, colors: List[QColor], device_pixel_ratio: float = 1.0):
+        """
+        预渲染图集
+
+        Args:
+            colors: 烟花颜色表
+            device_pixel_ratio: 设备像素比，高DPI屏幕上按物理像素渲染
+        """
+        self.color_count = len(colors)
+        self.size_levels = int(math.ceil(MAX_SIZE / SIZE_STEP))
+        self.cell = int(math.ceil(MAX_SIZE)) + 2  # 每个精灵格子的边长（逻辑像素）
+        self.device_pixel_ratio = device_pixel_ratio
+        self.pixmap = self._render(colors)
+
+        # 绘制时复用的目标矩形和源矩形（源矩形以图集的物理像素为单位），逐粒子只移动位置
+        self._target_rect = QRectF(0, 0, self.cell, self.cell)
+        self._source_rect = QRectF(0, 0, self.cell * device_pixel_ratio, self.cell * device_pixel_ratio)
+
+    def _render(self, colors: List[QColor]) -> QPixmap:
+        """渲染图集：每行为一种颜色的一个透明度级别，每列为一个大小级别"""
+        cell = self.cell
+        dpr = self.device_pixel_ratio
+        width = cell * self.size_levels
+        height = cell * self.color_count * ALPHA_LEVELS
+
+        pixmap = QPixmap(int(math.ceil(width * dpr)), int(math.ceil(height * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        for color_index, base_color in enumerate(colors):
+            for alpha_level in range(ALPHA_LEVELS):
+                alpha = int(round(255 * (alpha_level + 1) / ALPHA_LEVELS))
+                row = color_index * ALPHA_LEVELS + alpha_level
+                for size_level in range(self.size_levels):
+                    size = (size_level + 1) * SIZE_STEP
+                    center_x = size_level * cell + cell / 2
+                    center_y = row * cell + cell / 2
+
+                    # 与逐粒子绘制相同的径向渐变：中心不透明，半径处完全透明
+                    gradient = QRadialGradient(center_x, center_y, size)
+                    color_with_alpha = QColor(base_color)
+                    color_with_alpha.setAlpha(alpha)
+                    gradient.setColorAt(0, color_with_alpha)
+                    transparent = QColor(base_color)
+                    transparent.setAlpha(0)
+                    gradient.setColorAt(1, transparent)
+
+                    painter.setBrush(QBrush(gradient))
+                    painter.drawEllipse(QRectF(center_x - size / 2, center_y - size / 2, size, size))
+
+        painter.end()
+        return pixmap
+
+    def source_origins(self, size: np.ndarray, alpha: np.ndarray,
+                       color: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        计算每个粒子在图集中的源矩形左上角（逻辑像素）
+
+        Args:
+            size: 粒子直径
+            alpha: 粒子透明度（0-255）
+            color: 颜色序号
+
+        Returns:
+            Tuple: (源x坐标数组, 源y坐标数组)
+        """
+        size_level = np.clip(np.rint(size / SIZE_STEP).astype(np.int32) - 1, 0, self.size_levels - 1)
+        alpha_level = np.clip((alpha.astype(np.int32) * ALPHA_LEVELS + 254) // 255 - 1, 0, ALPHA_LEVELS - 1)
+        row = (color.astype(np.int32) % self.color_count) * ALPHA_LEVELS + alpha_level
+        return size_level * self.cell, row * self.cell
+
+    def draw(self, painter: QPainter, x: np.ndarray, y: np.ndarray, size: np.ndarray,
+             alpha: np.ndarray, color: np.ndarray):
+        """
+        将粒子绘制为图集中的精灵
+
+        Args:
+            painter: 绘制器
+            x: 粒子中心x坐标
+            y: 粒子中心y坐标
+            size: 粒子直径
+            alpha: 粒子透明度（0-255）
+            color: 颜色序号
+        """
+        half = self.cell / 2
+        dpr = self.device_pixel_ratio
+        source_x, source_y = self.source_origins(size, alpha, color)
+        target_x = (x - half).tolist()
+        target_y = (y - half).tolist()
+        source_x = (source_x * dpr).tolist()
+        source_y = (source_y * dpr).tolist()
+
+        # 逐个贴图，复用矩形对象，绘制过程中不创建新对象
+        pixmap = self.pixmap
+        target_rect = self._target_rect
+        source_rect = self._source_rect
+        for tx, ty, sx, sy in zip(target_x, target_y, source_x, source_y):
+            target_rect.moveTo(tx, ty)
+            source_rect.moveTo(sx, sy)
+            painter.drawPixmap(target_rect, pixmap, source_rect)
+
+
+# 图集缓存: (颜色表, 设备像素比) -> 图集
+_atlas_cache: Dict[Tuple[Tuple[int, ...], float], ParticleSpriteAtlas] = {}
+
+
+def get_sprite_atlas(colors: List[QColor], device_pixel_ratio: float = 1.0) -> ParticleSpriteAtlas:
+    """
+    获取（必要时创建）共享的粒子精灵图集
+
+    Args:
+        colors: 烟花颜色表
+        device_pixel_ratio: 设备像素比
+
+    Returns:
+        ParticleSpriteAtlas: 精灵图集
+    """
+    key = (tuple(color.rgba() for color in colors), float(device_pixel_ratio))
+    atlas = _atlas_cache.get(key)
+    if atlas is None:
+        atlas = ParticleSpriteAtlas(colors, device_pixel_ratio)
+        _atlas_cache[key] = atlas
+    return atlas
@@ -0,0 +1,178 @@
+"""
+粒子系统模块 - 以NumPy数组（结构数组）存储烟花粒子，整批向量化更新
+"""
+
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+from PySide6.QtGui import QPainter
+
+# 使用绝对导入避免相对导入问题
+import sys
+import os
+
+# 确保项目根目录在sys.path中
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from ui.particle_sprites import ParticleSpriteAtlas
+
+
+class ParticleSystem:
+    """烟花粒子系统"""
+
+    def __init__(self, capacity: int = 128, gravity: float = 0.3,
+                 fade_speed: float = 0.02, drag: float = 0.98):
+        """
+        初始化粒子系统
+
+        Args:
+            capacity: 初始容量（粒子数），不足时自动扩容
+            gravity: 重力加速度
+            fade_speed: 每帧减少的生命值
+            drag: 每帧的速度衰减系数（空气阻力）
+        """
+        self.gravity = gravity
+        self.fade_speed = fade_speed
+        self.drag = drag
+
+        self.count = 0  # 存活粒子数，数组前count个元素有效
+        self._allocate(capacity)
+
+        self._rng = np.random.default_rng()
+
+    def _allocate(self, capacity: int):
+        """分配（或扩容）粒子数组，保留现有粒子"""
+        old_count = self.count
+        fields = {
+            "x": np.float32, "y": np.float32,
+            "vx": np.float32, "vy": np.float32,
+            "life": np.float32,
+            "size": np.float32, "color": np.int16,
+        }
+        for name, dtype in fields.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if old_count:
+                array[:old_count] = getattr(self, name)[:old_count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def __len__(self) -> int:
+        """存活粒子数"""
+        return self.count
+
+    def clear(self):
+        """清除所有粒子"""
+        self.count = 0
+
+    def emit_burst(self, x: float, y: float, color_index: int, count: int):
+        """
+        在指定位置产生一次烟花爆炸
+
+        Args:
+            x: 爆炸中心x坐标
+            y: 爆炸中心y坐标
+            color_index: 颜色序号
+            count: 粒子数量
+        """
+        if count <= 0:
+            return
+
+        start = self.count
+        end = start + count
+        if end > self.capacity:
+            self._allocate(max(end, self.capacity * 2))
+
+        # 随机角度、速度、大小和生命值
+        angle = self._rng.uniform(0, 2 * math.pi, count)
+        speed = self._rng.uniform(3, 8, count)
+
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = np.cos(angle) * speed
+        self.vy[start:end] = np.sin(angle) * speed
+        self.size[start:end] = self._rng.uniform(2, 5, count)
+        self.life[start:end] = self._rng.uniform(0.8, 1.2, count)
+        self.color[start:end] = color_index
+
+        self.count = end
+
+    def step(self) -> int:
+        """
+        推进一帧并剔除已消亡的粒子
+
+        Returns:
+            int: 剩余的存活粒子数
+        """
+        n = self.count
+        if not n:
+            return 0
+
+        x, y = self.x[:n], self.y[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        life = self.life[:n]
+
+        # 更新位置，应用重力，减少生命值，减少速度（空气阻力）
+        x += vx
+        y += vy
+        vy += self.gravity
+        life -= self.fade_speed
+        vx *= self.drag
+        vy *= self.drag
+
+        # 剔除生命值耗尽的粒子：将存活粒子紧凑到数组前部
+        alive = life > 0
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count != n:
+            for name in ("x", "y", "vx", "vy", "life", "size", "color"):
+                array = getattr(self, name)
+                array[:alive_count] = array[:n][alive]
+            self.count = alive_count
+
+        return self.count
+
+    def bounds(self, margin: float = 0.0) -> Optional[Tuple[int, int, int, int]]:
+        """
+        计算所有粒子的包围盒，用于只重绘粒子覆盖的区域
+
+        Args:
+            margin: 向外扩展的边距（粒子精灵的半径）
+
+        Returns:
+            Tuple: (left, top, width, height)，没有粒子时返回None
+        """
+        n = self.count
+        if not n:
+            return None
+
+        x, y = self.x[:n], self.y[:n]
+        left = int(math.floor(float(x.min()) - margin))
+        top = int(math.floor(float(y.min()) - margin))
+        right = int(math.ceil(float(x.max()) + margin))
+        bottom = int(math.ceil(float(y.max()) + margin))
+        return left, top, right - left, bottom - top
+
+    def _current_appearance(self):
+        """根据生命值计算当前透明度和大小（向量化计算）"""
+        n = self.count
+        life = self.life[:n]
+        alpha = np.clip(255 * life, 0, 255).astype(np.int32)
+        current_size = np.maximum(0.1, self.size[:n] * life)
+        return alpha, current_size
+
+    def draw(self, painter: QPainter, atlas: ParticleSpriteAtlas):
+        """
+        以预渲染的精灵图集绘制所有粒子
+
+        Args:
+            painter: 绘制器
+            atlas: 粒子精灵图集
+        """
+        n = self.count
+        if not n:
+            return
+
+        alpha, current_size = self._current_appearance()
+        atlas.draw(painter, self.x[:n], self.y[:n], current_size, alpha, self.color[:n])
@@ -0,0 +1,216 @@
+"""
+窗口定位模块 - 缓存每个屏幕的可用区域和任务栏位置，显示提示窗口时只做简单的坐标计算
+
+屏幕增减、分辨率、可用区域（任务栏移动）或DPI变化时才重新读取屏幕信息
+"""
+
+from typing import Dict, Optional, Tuple
+from PySide6.QtCore import QObject, QPoint, QRect, QSize, Slot
+from PySide6.QtGui import QCursor, QGuiApplication, QScreen
+
+# 窗口与任务栏（或屏幕边缘）之间的距离（像素）
+EDGE_MARGIN = 10
+
+
+class ScreenAnchor:
+    """一个屏幕的定位信息"""
+
+    def __init__(self, available: QRect, taskbar_edge: str):
+        """
+        Args:
+            available: 可用桌面区域（不含任务栏）
+            taskbar_edge: 任务栏所在边: bottom, top, left, right
+        """
+        self.available = available
+        self.taskbar_edge = taskbar_edge
+
+
+def _detect_taskbar_edge(full: QRect, available: QRect) -> str:
+    """根据整个屏幕区域和可用区域的差异判断任务栏所在边，无法判断时按底部处理"""
+    insets = {
+        "bottom": full.bottom() - available.bottom(),
+        "top": available.top() - full.top(),
+        "left": available.left() - full.left(),
+        "right": full.right() - available.right(),
+    }
+    edge, inset = max(insets.items(), key=lambda item: item[1])
+    return edge if inset > 0 else "bottom"
+
+
+class ScreenPlacement(QObject):
+    """提示窗口定位器，所有提示窗口共用"""
+
+    def __init__(self, parent=None):
+        """
+        初始化定位器并监听屏幕变化
+
+        Args:
+            parent: 父对象
+        """
+        super().__init__(parent)
+
+        # 屏幕名称 -> 定位信息
+        self._anchors: Dict[str, ScreenAnchor] = {}
+        # (屏幕名称, 窗口宽, 窗口高) -> 窗口位置
+        self._positions: Dict[Tuple[str, int, int], QPoint] = {}
+        # 已连接信号的屏幕名称
+        self._watched_screens = set()
+
+        # 统计信息
+        self.hit_count = 0          # 直接使用缓存位置的次数
+        self.miss_count = 0         # 计算位置的次数
+        self.invalidate_count = 0   # 屏幕变化导致缓存失效的次数
+
+        app = QGuiApplication.instance()
+        if app is not None:
+            app.screenAdded.connect(self._on_screen_added)
+            app.screenRemoved.connect(self._on_screen_removed)
+            app.primaryScreenChanged.connect(self._on_screens_changed)
+            for screen in QGuiApplication.screens():
+                self._watch_screen(screen)
+
+    def _watch_screen(self, screen: QScreen):
+        """监听单个屏幕的几何和DPI变化"""
+        name = screen.name()
+        if name in self._watched_screens:
+            return
+        self._watched_screens.add(name)
+        screen.geometryChanged.connect(self._on_screens_changed)
+        screen.availableGeometryChanged.connect(self._on_screens_changed)
+        screen.logicalDotsPerInchChanged.connect(self._on_screens_changed)
+
+    @Slot(QScreen)
+    def _on_screen_added(self, screen: QScreen):
+        """新屏幕接入"""
+        self._watch_screen(screen)
+        self.invalidate()
+
+    @Slot(QScreen)
+    def _on_screen_removed(self, screen: QScreen):
+        """屏幕移除，同名屏幕重新接入时需要重新连接信号"""
+        self._watched_screens.discard(screen.name())
+        self.invalidate()
+
+    @Slot()
+    def _on_screens_changed(self, *args):
+        """主屏幕切换或屏幕几何/DPI变化"""
+        self.invalidate()
+
+    def invalidate(self):
+        """清除所有缓存的定位信息"""
+        self._anchors.clear()
+        self._positions.clear()
+        self.invalidate_count += 1
+
+    def target_screen(self, mode: str = "primary") -> Optional[QScreen]:
+        """
+        获取要显示提示窗口的屏幕
+
+        Args:
+            mode: cursor 为鼠标所在屏幕，primary 为主屏幕
+
+        Returns:
+            Optional[QScreen]: 屏幕，没有可用屏幕时返回None
+        """
+        if mode == "cursor":
+            screen = QGuiApplication.screenAt(QCursor.pos())
+            if screen is not None:
+                return screen
+        return QGuiApplication.primaryScreen()
+
+    def _anchor(self, screen: QScreen) -> ScreenAnchor:
+        """获取（必要时读取）屏幕的定位信息"""
+        name = screen.name()
+        anchor = self._anchors.get(name)
+        if anchor is None:
+            available = screen.availableGeometry()
+            anchor = ScreenAnchor(available, _detect_taskbar_edge(screen.geometry(), available))
+            self._anchors[name] = anchor
+        return anchor
+
+    def available_geometry(self, mode: str = "primary") -> Optional[QRect]:
+        """
+        获取提示窗口所在屏幕的可用区域（来自缓存）
+
+        Args:
+            mode: 定位屏幕，cursor 为鼠标所在屏幕，primary 为主屏幕
+
+        Returns:
+            Optional[QRect]: 可用区域，没有可用屏幕时返回None
+        """
+        screen = self.target_screen(mode)
+        if screen is None:
+            return None
+        return QRect(self._anchor(screen).available)
+
+    def position_for(self, size: QSize, mode: str = "primary") -> Optional[QPoint]:
+        """
+        计算提示窗口的位置：在可用区域内水平居中，贴近任务栏
+
+        任务栏在顶部时显示在顶部，其他情况（底部、左侧、右侧）显示在可用区域底部，
+        左右任务栏时居中位置已避开任务栏
+
+        Args:
+            size: 窗口大小
+            mode: 定位屏幕，cursor 为鼠标所在屏幕，primary 为主屏幕
+
+        Returns:
+            Optional[QPoint]: 窗口位置，没有可用屏幕时返回None
+        """
+        screen = self.target_screen(mode)
+        if screen is None:
+            return None
+
+        key = (screen.name(), size.width(), size.height())
+        position = self._positions.get(key)
+        if position is not None:
+            self.hit_count += 1
+            return QPoint(position)
+
+        self.miss_count += 1
+        anchor = self._anchor(screen)
+        available = anchor.available
+
+        # 水平居中，窗口比可用区域宽时靠左对齐
+        x = available.left() + max(0, (available.width() - size.width()) // 2)
+
+        if anchor.taskbar_edge == "top":
+            y = available.top() + EDGE_MARGIN
+        else:
+            y = available.bottom() - size.height() - EDGE_MARGIN
+        y = max(available.top(), y)
+
+        position = QPoint(x, y)
+        self._positions[key] = position
+        return QPoint(position)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        获取定位统计信息
+
+        Returns:
+            Dict: 统计信息字典，包含缓存命中/计算次数、失效次数和缓存的屏幕数
+        """
+        return {
+            "hits": self.hit_count,
+            "misses": self.miss_count,
+            "invalidations": self.invalidate_count,
+            "screens": len(self._anchors),
+        }
+
+
+# 全局共享的定位器，第一次使用时创建
+_shared_placement: Optional[ScreenPlacement] = None
+
+
+def get_screen_placement() -> ScreenPlacement:
+    """
+    获取全局共享的窗口定位器
+
+    Returns:
+        ScreenPlacement: 窗口定位器
+    """
+    global _shared_placement
+    if _shared_placement is None:
+        _shared_placement = ScreenPlacement()
+    return _shared_placement
@@ -21,9 +21,10 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from utils.config import (
-    SHORTCUT_ITEMS, ALT_SHORTCUT_ITEMS, CTRL_ALT_SHORTCUT_ITEMS,
-    WIN_SHORTCUT_ITEMS, APPEARANCE, EFFECTS
+    get_shortcut_items, get_alt_shortcut_items, get_ctrl_alt_shortcut_items,
+    get_win_shortcut_items, get_appearance, get_effects
 )
+from utils.effects import normalize_effects
 from utils.constants import STYLE_PRESETS
 from .color_button import ColorButton
 
@@ -39,13 +40,13 @@ class SettingsDialog(QDialog):
         
         # 存储当前设置
         self.current_shortcuts = {
-            "ctrl": SHORTCUT_ITEMS.copy(),
-            "alt": ALT_SHORTCUT_ITEMS.copy(),
-            "ctrl_alt": CTRL_ALT_SHORTCUT_ITEMS.copy(),
-            "win": WIN_SHORTCUT_ITEMS.copy()
+            "ctrl": get_shortcut_items().copy(),
+            "alt": get_alt_shortcut_items().copy(),
+            "ctrl_alt": get_ctrl_alt_shortcut_items().copy(),
+            "win": get_win_shortcut_items().copy()
         }
-        self.current_appearance = APPEARANCE.copy()
-        self.current_effects = EFFECTS.copy()
+        self.current_appearance = get_appearance().copy()
+        self.current_effects = normalize_effects(get_effects())
         
         self._setup_ui()
 
@@ -231,6 +232,13 @@ class SettingsDialog(QDialog):
         self.animation_speed_combo.setCurrentIndex(speed_mapping.get(current_speed, 1))
         effects_layout.addRow("动画速度:", self.animation_speed_combo)
         
+        self.show_delay_spin = QSpinBox()
+        self.show_delay_spin.setRange(0, 2000)
+        self.show_delay_spin.setSingleStep(50)
+        self.show_delay_spin.setValue(self.current_effects.get("show_delay", 250))
+        self.show_delay_spin.setSuffix(" ms")
+        effects_layout.addRow("按住多久后显示:", self.show_delay_spin)
+        
         scroll_layout.addWidget(effects_group)
         
         # 添加弹簧
@@ -345,6 +353,7 @@ class SettingsDialog(QDialog):
             speed_mapping = {"slow": 0, "medium": 1, "fast": 2}
             current_speed = self.current_effects.get("animation_speed", "medium")
             self.animation_speed_combo.setCurrentIndex(speed_mapping.get(current_speed, 1))
+            self.show_delay_spin.setValue(self.current_effects.get("show_delay", 250))
             
         except Exception as e:
             print(f"更新外观控件时出错: {e}")
@@ -383,10 +392,8 @@ class SettingsDialog(QDialog):
                 "card_bg_color_end": self.card_bg_end_btn.get_color()
             }
             
-            # 临时更新配置
-            from utils.config import _config_manager
-            old_appearance = _config_manager.appearance.copy()
-            _config_manager.appearance.update(temp_appearance)
+            # 预览窗口使用独立的外观配置，不修改当前配置，已显示的提示窗口不受影响
+            from utils.config_model import Appearance
             
             # 创建预览窗口
             preview_shortcuts = [
@@ -395,18 +402,15 @@ class SettingsDialog(QDialog):
                 {"key": "X", "action": "剪切"}
             ]
             
-            preview_window = HintWidget(preview_shortcuts)
+            preview_window = HintWidget(preview_shortcuts, appearance=Appearance.from_dict(temp_appearance))
             preview_window.setWindowTitle("样式预览")
             preview_window.show_above_taskbar()
             
-            # 3秒后自动关闭预览，并确保恢复配置
+            # 3秒后自动关闭预览
             from PySide6.QtCore import QTimer
             def cleanup_preview():
                 try:
-                    preview_window.hide()
-                    # 恢复原配置
-                    _config_manager.appearance.clear()
-                    _config_manager.appearance.update(old_appearance)
+                    preview_window.release()
                 except Exception as cleanup_error:
                     print(f"清理预览窗口时出错: {cleanup_error}")
             
@@ -451,9 +455,11 @@ class SettingsDialog(QDialog):
             # 获取效果设置
             speed_mapping = {0: "slow", 1: "medium", 2: "fast"}
             self.current_effects = {
+                **self.current_effects,  # 保留对话框中未提供编辑的效果设置
                 "enable_animation": self.enable_animation_cb.isChecked(),
                 "enable_blur": self.enable_blur_cb.isChecked(),
                 "animation_speed": speed_mapping.get(self.animation_speed_combo.currentIndex(), "medium"),
+                "show_delay": self.show_delay_spin.value(),
                 "show_on_press": True,  # 保持现有设置
                 "auto_hide": True       # 保持现有设置
             }
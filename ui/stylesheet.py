@@ -0,0 +1,185 @@
+"""
+样式表模块 - 按外观配置生成提示窗口的样式表并缓存，所有提示窗口共用同一份样式表
+"""
+
+import os
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# 样式文件不可用时使用的默认样式
+DEFAULT_STYLESHEET = """
+ShortcutCardWidget#ShortcutCard {
+    background-color: rgba(255, 255, 255, 120);
+    border-radius: 12px;
+    min-width: 90px;
+    max-width: 90px;
+    min-height: 90px;
+    max-height: 90px;
+    padding: 8px;
+    border: 1px solid rgba(255, 255, 255, 80);
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                               stop: 0 rgba(255, 255, 255, 140),
+                               stop: 0.5 rgba(250, 250, 255, 100),
+                               stop: 1 rgba(240, 240, 250, 120));
+}
+
+ShortcutCardWidget#ShortcutCard QLabel#keyLabel {
+    color: rgba(20, 20, 30, 255);
+    font-size: 24px;
+    font-weight: bold;
+    background-color: transparent;
+}
+
+ShortcutCardWidget#ShortcutCard QLabel#actionLabel {
+    color: rgba(30, 30, 40, 240);
+    font-size: 10px;
+    background-color: transparent;
+}
+"""
+
+# 外观规则的选择器同时覆盖悬停和激活状态，使其优先于样式文件中的同名规则
+_CARD_SELECTOR = (
+    'ShortcutCardWidget#ShortcutCard,\n'
+    'ShortcutCardWidget#ShortcutCard:hover,\n'
+    'ShortcutCardWidget#ShortcutCard[highlighted="true"]'
+)
+
+
+def _label_selector(label_name: str) -> str:
+    """获取卡片标签（含激活状态）的选择器"""
+    return (f'ShortcutCardWidget#ShortcutCard QLabel#{label_name},\n'
+            f'ShortcutCardWidget#ShortcutCard[highlighted="true"] QLabel#{label_name}')
+
+
+# 样式文件内容，只在第一次使用时读取
+_base_stylesheet: Optional[str] = None
+
+# 缓存的样式表数量上限，设置对话框的预览窗口和提示窗口使用不同外观时不会互相淘汰
+_CACHE_LIMIT = 4
+
+# 样式表缓存（按最近使用排序）: (排序后的外观配置项, 是否使用缓存背景) -> 完整样式表
+_stylesheet_cache: OrderedDict[Tuple[Tuple[Tuple[str, Any], ...], bool], str] = OrderedDict()
+
+
+def _hex_to_rgb(hex_color: str) -> str:
+    """将十六进制颜色转换为RGB字符串"""
+    hex_color = hex_color.lstrip('#')
+    r = int(hex_color[0:2], 16)
+    g = int(hex_color[2:4], 16)
+    b = int(hex_color[4:6], 16)
+    return f"{r}, {g}, {b}"
+
+
+def load_base_stylesheet() -> str:
+    """
+    读取样式文件，结果在进程内缓存，不再为每个提示窗口重复读取
+
+    Returns:
+        str: 样式文件内容，文件不可用时返回默认样式
+    """
+    global _base_stylesheet
+    if _base_stylesheet is not None:
+        return _base_stylesheet
+
+    try:
+        # 处理PyInstaller打包后的路径
+        if hasattr(sys, '_MEIPASS'):
+            # 在打包的exe中，资源文件在临时目录中
+            style_path = os.path.join(sys._MEIPASS, 'resources', 'styles.qss')
+        else:
+            # 在开发环境中，使用相对路径
+            style_path = os.path.join('resources', 'styles.qss')
+
+        if os.path.exists(style_path):
+            with open(style_path, "r", encoding="utf-8") as f:
+                _base_stylesheet = f.read()
+        else:
+            print(f"警告: 样式文件 '{style_path}' 未找到，使用默认样式。")
+            _base_stylesheet = DEFAULT_STYLESHEET
+    except Exception as e:
+        print(f"加载样式文件时出错: {e}")
+        _base_stylesheet = DEFAULT_STYLESHEET
+
+    return _base_stylesheet
+
+
+def build_appearance_stylesheet(appearance: Dict, cached_background: bool) -> str:
+    """
+    根据外观配置生成卡片样式规则
+
+    Args:
+        appearance: 外观配置
+        cached_background: 卡片背景是否由提示窗口绘制缓存图片
+
+    Returns:
+        str: 样式规则
+    """
+    # 获取颜色配置
+    key_color = appearance.get("key_color", "#1a1a1e")
+    action_color = appearance.get("action_color", "#1e1e28")
+    bg_start = appearance.get("card_bg_color_start", "#ffffff")
+    bg_end = appearance.get("card_bg_color_end", "#f0f0fa")
+    opacity = appearance.get("background_opacity", 50)
+
+    # 计算实际的透明度值
+    alpha = int(255 * opacity / 100)
+
+    # 背景由提示窗口统一绘制缓存的图片时，卡片本身保持透明（保留透明边框以保持尺寸不变）
+    if cached_background:
+        card_rules = """
+    background: transparent;
+    border-radius: 12px;
+    border: 1px solid transparent;"""
+    else:
+        card_rules = f"""
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                               stop: 0 rgba({_hex_to_rgb(bg_start)}, {alpha}),
+                               stop: 1 rgba({_hex_to_rgb(bg_end)}, {alpha}));
+    border-radius: 12px;
+    border: 1px solid rgba(255, 255, 255, 80);"""
+
+    return f"""
+/* 外观配置 */
+{_CARD_SELECTOR} {{{card_rules}
+}}
+
+{_label_selector("keyLabel")} {{
+    color: {key_color};
+    background-color: transparent;
+}}
+
+{_label_selector("actionLabel")} {{
+    color: {action_color};
+    background-color: transparent;
+}}
+
+QLabel#pageLabel {{
+    color: {action_color};
+    background-color: transparent;
+    font-size: 10px;
+}}
+"""
+
+
+def get_overlay_stylesheet(appearance: Dict, cached_background: bool = True) -> str:
+    """
+    获取提示窗口的完整样式表（样式文件 + 外观规则），相同外观配置返回同一个字符串对象
+
+    Args:
+        appearance: 外观配置
+        cached_background: 卡片背景是否由提示窗口绘制缓存图片
+
+    Returns:
+        str: 样式表
+    """
+    key = (tuple(sorted(appearance.items())), bool(cached_background))
+    stylesheet = _stylesheet_cache.get(key)
+    if stylesheet is None:
+        stylesheet = load_base_stylesheet() + build_appearance_stylesheet(appearance, cached_background)
+        _stylesheet_cache[key] = stylesheet
+        if len(_stylesheet_cache) > _CACHE_LIMIT:
+            _stylesheet_cache.popitem(last=False)  # 淘汰最久未使用的样式表
+    else:
+        _stylesheet_cache.move_to_end(key)
+    return stylesheet
@@ -0,0 +1,298 @@
+"""
+窗口动画控制器 - 用一个 QVariantAnimation 同时驱动窗口的不透明度和位置，支持显示/隐藏中途反转
+"""
+
+import time
+from typing import Dict, Optional
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import QObject, QPoint, QVariantAnimation, QEasingCurve, Signal, Slot
+
+# 使用绝对导入避免相对导入问题
+import sys
+import os
+
+# 确保项目根目录在sys.path中
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.effects import animations_enabled, scaled_duration
+
+# 反转时剩余行程很短也至少播放的时长（毫秒）
+MIN_TRANSITION_DURATION = 30
+
+
+class _Transition:
+    """一次显示或隐藏过程的参数"""
+
+    def __init__(self, name: str, fade_duration: int, slide_duration: int,
+                 fade_curve: QEasingCurve.Type, slide_curve: QEasingCurve.Type):
+        self.name = name
+        self.fade_duration = fade_duration
+        self.slide_duration = slide_duration
+        self.fade_curve = QEasingCurve(fade_curve)
+        self.slide_curve = QEasingCurve(slide_curve)
+
+    @property
+    def duration(self) -> int:
+        """整个过程的时长（毫秒）"""
+        return max(self.fade_duration, self.slide_duration)
+
+
+class WindowAnimator(QObject):
+    """窗口淡入淡出和滑入滑出动画控制器"""
+
+    # 定义信号
+    shown = Signal()    # 显示动画完成
+    hidden = Signal()   # 隐藏动画完成，窗口已隐藏
+    opacity_changed = Signal(float)  # 窗口不透明度变化（每个动画帧），参数为新的不透明度
+
+    def __init__(self, window: QWidget, fade_in_duration: int = 250, slide_in_duration: int = 300,
+                 fade_out_duration: int = 180, slide_out_duration: int = 200,
+                 slide_distance: int = 30, parent=None):
+        """
+        初始化动画控制器
+
+        Args:
+            window: 要控制的顶层窗口
+            fade_in_duration: 淡入时长（毫秒）
+            slide_in_duration: 滑入时长（毫秒）
+            fade_out_duration: 淡出时长（毫秒）
+            slide_out_duration: 滑出时长（毫秒）
+            slide_distance: 滑动距离（像素），窗口从目标位置下方滑入、向下滑出
+            parent: 父对象
+        """
+        super().__init__(parent or window)
+        self.window = window
+        self.slide_distance = slide_distance
+
+        # 显示用弹性滑入，隐藏用加速滑出，与原先的四个属性动画一致
+        self.transitions = {
+            "show": _Transition("show", fade_in_duration, slide_in_duration,
+                                QEasingCurve.Type.OutCubic, QEasingCurve.Type.OutBack),
+            "hide": _Transition("hide", fade_out_duration, slide_out_duration,
+                                QEasingCurve.Type.InCubic, QEasingCurve.Type.InQuad),
+        }
+
+        # 当前状态: hidden, showing, shown, hiding
+        self.state = "hidden"
+        self.target_pos = QPoint()
+        self.opacity = 0.0        # 当前不透明度
+        self.offset = float(slide_distance)  # 当前相对目标位置的向下偏移
+
+        # 当前过程的起点和终点
+        self._transition: Optional[_Transition] = None
+        self._start_opacity = 0.0
+        self._end_opacity = 0.0
+        self._start_offset = 0.0
+        self._end_offset = 0.0
+        self._time_scale = 1.0    # 反转时按剩余行程缩短的比例
+        self._started_at = 0.0
+        self._frames = 0
+
+        # 唯一的动画对象，第一次播放动画时才创建，关闭动画时始终不创建
+        self.animation: Optional[QVariantAnimation] = None
+
+        # 统计信息: 过程名称 -> 计数和耗时
+        self.stats: Dict[str, Dict[str, float]] = {
+            name: {"count": 0, "completed": 0, "total_ms": 0.0, "last_ms": 0.0, "frames": 0}
+            for name in self.transitions
+        }
+        self.reversed_count = 0   # 中途反转的次数
+        self.instant_count = 0    # 动画关闭时直接显示/隐藏的次数
+
+    def is_hiding(self) -> bool:
+        """
+        检查是否正在隐藏
+
+        Returns:
+            bool: 正在播放隐藏动画返回True，否则返回False
+        """
+        return self.state == "hiding"
+
+    def show_at(self, target_pos: QPoint):
+        """
+        显示窗口并滑入到目标位置，正在隐藏时从当前状态反转为显示
+
+        Args:
+            target_pos: 窗口最终位置
+        """
+        self.target_pos = QPoint(target_pos)
+
+        if not animations_enabled():
+            self._finish_instantly(visible=True)
+            return
+
+        if not self.window.isVisible():
+            # 窗口可能被直接隐藏过，按隐藏状态重新开始
+            self.stop()
+
+        if self.state in ("shown", "showing"):
+            # 已显示时只更新目标位置
+            self._apply()
+            return
+
+        if self.state == "hidden":
+            self.opacity = 0.0
+            self.offset = float(self.slide_distance)
+            self._apply()
+            self.window.show()
+
+        self._start("show", end_opacity=1.0, end_offset=0.0)
+
+    def hide(self):
+        """隐藏窗口并向下滑出，正在显示时从当前状态反转为隐藏"""
+        if self.state in ("hidden", "hiding") or not self.window.isVisible():
+            return
+
+        if not animations_enabled():
+            self._finish_instantly(visible=False)
+            return
+
+        self._start("hide", end_opacity=0.0, end_offset=float(self.slide_distance))
+
+    def stop(self):
+        """停止动画并重置为隐藏状态，窗口被直接隐藏时调用"""
+        if self.animation is not None:
+            self.animation.stop()
+        self.state = "hidden"
+        self.opacity = 0.0
+        self.offset = float(self.slide_distance)
+        self._transition = None
+
+    def _ensure_animation(self) -> QVariantAnimation:
+        """获取（必要时创建）动画对象，值为当前过程的线性进度 0-1"""
+        if self.animation is None:
+            self.animation = QVariantAnimation(self)
+            self.animation.setStartValue(0.0)
+            self.animation.setEndValue(1.0)
+            self.animation.valueChanged.connect(self._on_progress)
+            self.animation.finished.connect(self._on_finished)
+        return self.animation
+
+    def _start(self, name: str, end_opacity: float, end_offset: float):
+        """开始（或从当前状态反转为）指定的过程"""
+        transition = self.transitions[name]
+        animation = self._ensure_animation()
+
+        if animation.state() == QVariantAnimation.State.Running:
+            # 中途反转：从当前不透明度和位置继续，不重新开始
+            animation.stop()
+            self._record(self._transition, completed=False)
+            self.reversed_count += 1
+
+        # 剩余行程按不透明度的差值计算，完整过程为1
+        self._time_scale = abs(end_opacity - self.opacity)
+
+        self._transition = transition
+        self._start_opacity = self.opacity
+        self._end_opacity = end_opacity
+        self._start_offset = self.offset
+        self._end_offset = end_offset
+        self._started_at = time.perf_counter()
+        self._frames = 0
+        self.state = "showing" if name == "show" else "hiding"
+        self.stats[name]["count"] += 1
+
+        duration = scaled_duration(transition.duration * self._time_scale)
+        animation.setDuration(max(MIN_TRANSITION_DURATION, duration))
+        animation.start()
+
+    @Slot(object)
+    def _on_progress(self, value):
+        """动画帧：根据进度同时计算不透明度和位置"""
+        transition = self._transition
+        if transition is None:
+            return
+
+        progress = float(value)
+        self._frames += 1
+
+        # 淡入淡出和滑动的时长不同，各自按比例换算进度
+        total = transition.duration
+        fade_progress = min(1.0, progress * total / transition.fade_duration) if transition.fade_duration else 1.0
+        slide_progress = min(1.0, progress * total / transition.slide_duration) if transition.slide_duration else 1.0
+
+        fade = transition.fade_curve.valueForProgress(fade_progress)
+        slide = transition.slide_curve.valueForProgress(slide_progress)
+        self.opacity = self._start_opacity + (self._end_opacity - self._start_opacity) * fade
+        self.offset = self._start_offset + (self._end_offset - self._start_offset) * slide
+        self._apply()
+
+    @Slot()
+    def _on_finished(self):
+        """过程结束"""
+        transition = self._transition
+        if transition is None:
+            return
+
+        self.opacity = self._end_opacity
+        self.offset = self._end_offset
+        self._apply()
+        self._record(transition, completed=True)
+        self._transition = None
+
+        if transition.name == "hide":
+            self.state = "hidden"
+            self.window.hide()
+            self.hidden.emit()
+        else:
+            self.state = "shown"
+            self.shown.emit()
+
+    def _finish_instantly(self, visible: bool):
+        """动画关闭时直接显示或隐藏"""
+        if self.animation is not None:
+            self.animation.stop()
+        self._transition = None
+        self.instant_count += 1
+
+        if visible:
+            self.opacity = 1.0
+            self.offset = 0.0
+            self._apply()
+            self.state = "shown"
+            self.window.show()
+            self.shown.emit()
+        else:
+            self.opacity = 0.0
+            self.state = "hidden"
+            self.window.hide()
+            self.hidden.emit()
+
+    def _apply(self):
+        """将当前不透明度和位置应用到窗口"""
+        self.window.setWindowOpacity(self.opacity)
+        self.window.move(self.target_pos.x(), self.target_pos.y() + round(self.offset))
+        self.opacity_changed.emit(self.opacity)
+
+    def _record(self, transition: Optional[_Transition], completed: bool):
+        """记录一次过程的耗时"""
+        if transition is None:
+            return
+        elapsed = (time.perf_counter() - self._started_at) * 1000
+        stats = self.stats[transition.name]
+        stats["total_ms"] += elapsed
+        stats["last_ms"] = elapsed
+        stats["frames"] += self._frames
+        if completed:
+            stats["completed"] += 1
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        获取动画统计信息
+
+        Returns:
+            Dict: 统计信息字典，包含每种过程的次数、完成次数、平均和最近一次耗时（毫秒）及平均帧数
+        """
+        result: Dict[str, float] = {}
+        for name, stats in self.stats.items():
+            count = stats["count"]
+            result[f"{name}_count"] = count
+            result[f"{name}_completed"] = stats["completed"]
+            result[f"{name}_avg_ms"] = round(stats["total_ms"] / count, 1) if count else 0.0
+            result[f"{name}_last_ms"] = round(stats["last_ms"], 1)
+            result[f"{name}_avg_frames"] = round(stats["frames"] / count, 1) if count else 0.0
+        result["reversed"] = self.reversed_count
+        result["instant"] = self.instant_count
+        return result
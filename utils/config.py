@@ -4,45 +4,169 @@
 
 import json
 import os
-from typing import Dict, List, Any
-from .constants import (
-    DEFAULT_SHORTCUT_ITEMS, DEFAULT_ALT_SHORTCUT_ITEMS, 
-    DEFAULT_CTRL_ALT_SHORTCUT_ITEMS, DEFAULT_WIN_SHORTCUT_ITEMS,
-    DEFAULT_APPEARANCE, DEFAULT_EFFECTS, CONFIG_FILE
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+from .constants import CONFIG_FILE, CONFIG_CACHE_ENABLED
+from .config_model import (
+    AppConfig, Appearance, Effects, SCHEMA_VERSION, SECTION_NAMES, schema_version_of
 )
+from .config_events import ChangeCallback, ConfigChange, ConfigEvents, diff_configs
+from .config_cache import ConfigCache, FileSignature, file_digest, signature_of
+from .config_writer import ConfigWriter
 
 class ConfigManager:
     """配置管理器"""
     
-    def __init__(self):
+    # 配置段名称 -> 属性名
+    SECTION_ATTRIBUTES = {
+        'shortcuts': 'shortcut_items',
+        'alt_shortcuts': 'alt_shortcut_items',
+        'ctrl_alt_shortcuts': 'ctrl_alt_shortcut_items',
+        'win_shortcuts': 'win_shortcut_items',
+        'appearance': 'appearance',
+        'effects': 'effects',
+    }
+    
+    def __init__(self, path: str = CONFIG_FILE, use_cache: bool = CONFIG_CACHE_ENABLED):
+        """
+        初始化配置管理器
+        
+        Args:
+            path: 配置文件路径
+            use_cache: 是否使用配置缓存加速启动
+        """
+        self.path = path
+        
+        # 已校验的配置模型，各组件读取其中带类型的属性
+        self.model = AppConfig()
+        
+        # 配置模型的字典形式，供设置对话框等按字典读取的代码使用
         self.shortcut_items = []
         self.alt_shortcut_items = []
         self.ctrl_alt_shortcut_items = []
         self.win_shortcut_items = []
         self.appearance = {}
         self.effects = {}
+        self._update_views(SECTION_NAMES)
+        
+        # 配置变化时按配置段和字段通知订阅者
+        self.events = ConfigEvents()
+        
+        # 校验后配置的二进制缓存，配置文件未变化时启动不解析JSON
+        self.cache = ConfigCache(path, SCHEMA_VERSION, enabled=use_cache)
+        
+        # 后台写入器，保存不阻塞界面线程，写入后重新生成缓存
+        self.writer = ConfigWriter(path, cache=self.cache)
+    
+    def _read_config_file(self) -> Tuple[Dict[str, Any], Optional[FileSignature], bytes]:
+        """
+        读取配置文件，文件损坏时读取上一版的备份
+        
+        Returns:
+            Tuple: (配置字典, 配置文件的签名, 内容哈希)，读取的是备份文件时签名为None
+        """
+        try:
+            # 先取签名再读取，读取期间文件被修改时签名与缓存不符，下次启动重新读取
+            signature = signature_of(os.stat(self.path))
+            with open(self.path, 'rb') as f:
+                data = f.read()
+            return json.loads(data), signature, file_digest(data)
+        except (OSError, ValueError) as e:
+            if not os.path.exists(self.writer.backup_path):
+                raise
+            print(f"配置文件无法读取（{e}），使用备份文件")
+            with open(self.writer.backup_path, 'r', encoding='utf-8') as f:
+                return json.load(f), None, b""
+    
+    def _load_cached(self) -> bool:
+        """
+        配置文件未变化时从缓存加载校验后的配置
+        
+        Returns:
+            bool: 从缓存加载成功返回True，缓存不可用返回False
+        """
+        cached = self.cache.load()
+        if cached is None:
+            return False
+        try:
+            model = AppConfig.from_validated(cached)
+        except (KeyError, TypeError, AttributeError) as e:
+            print(f"配置缓存内容无效（{e}），改为读取配置文件")
+            return False
+        # 缓存内容就是各配置段的字典形式，直接用作字典视图
+        self._set_model(model, views=cached)
+        return True
+    
+    @staticmethod
+    def _build_model(config: Dict[str, Any]) -> AppConfig:
+        """
+        迁移并校验配置文件内容，校验发现的问题打印出来，不合法的值已替换为默认值
+        
+        Args:
+            config: 配置文件内容
+            
+        Returns:
+            AppConfig: 配置模型
+        """
+        if not isinstance(config, dict):
+            raise ValueError("配置文件内容不是对象")
+        problems: List[str] = []
+        model = AppConfig.from_dict(config, problems)
+        for problem in problems:
+            print(f"配置问题: {problem}")
+        return model
+    
+    def _update_views(self, sections: Iterable[str], views: Optional[Dict[str, Any]] = None):
+        """更新指定配置段的字典形式，views 中已有的直接使用"""
+        for name in sections:
+            value = views[name] if views is not None else self.model.section_dict(name)
+            setattr(self, self.SECTION_ATTRIBUTES[name], value)
+    
+    def _set_model(self, model: AppConfig, notify: bool = True,
+                   views: Optional[Dict[str, Any]] = None) -> List[ConfigChange]:
+        """
+        替换配置模型，只更新有变化的配置段的字典形式，并通知订阅者
+        
+        Args:
+            model: 新的配置模型
+            notify: 是否通知订阅者
+            views: 与模型一致的各配置段字典形式（如 model.to_dict() 的结果），None表示由模型生成
+            
+        Returns:
+            List: 各配置段的变化
+        """
+        changes = diff_configs(self.model, model)
+        self.model = model
+        self._update_views((change.section for change in changes), views)
+        if notify:
+            self.events.publish(changes)
+        return changes
     
     def load_config(self) -> bool:
         """
-        加载配置文件
+        加载配置文件，配置文件未变化时直接使用缓存；旧版本的配置迁移到当前版本后写回文件
         
         Returns:
             bool: 加载成功返回True，失败返回False
         """
         try:
-            if os.path.exists(CONFIG_FILE):
-                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+            if os.path.exists(self.path):
+                if self._load_cached():
+                    print("配置文件加载成功（使用缓存）")
+                    return True
                 
-                # 加载快捷键配置
-                self.shortcut_items = config.get('shortcuts', DEFAULT_SHORTCUT_ITEMS.copy())
-                self.alt_shortcut_items = config.get('alt_shortcuts', DEFAULT_ALT_SHORTCUT_ITEMS.copy())
-                self.ctrl_alt_shortcut_items = config.get('ctrl_alt_shortcuts', DEFAULT_CTRL_ALT_SHORTCUT_ITEMS.copy())
-                self.win_shortcut_items = config.get('win_shortcuts', DEFAULT_WIN_SHORTCUT_ITEMS.copy())
+                config, signature, digest = self._read_config_file()
+                self._set_model(self._build_model(config))
                 
-                # 加载外观和效果配置
-                self.appearance = config.get('appearance', DEFAULT_APPEARANCE.copy())
-                self.effects = config.get('effects', DEFAULT_EFFECTS.copy())
+                if signature is None:
+                    # 读取的是备份，用恢复的配置重写损坏的配置文件，下次启动无需再读备份
+                    print("已从备份恢复配置，正在重写配置文件")
+                    self.writer.schedule(self.model.to_dict())
+                elif schema_version_of(config) < SCHEMA_VERSION:
+                    # 写回文件后由写入器生成缓存
+                    print(f"配置文件已升级到版本 {SCHEMA_VERSION}")
+                    self.writer.schedule(self.model.to_dict())
+                elif signature is not None:
+                    self.cache.store(self.model.to_dict(), signature, digest)
                 
                 print("配置文件加载成功")
                 return True
@@ -60,6 +184,19 @@ class ConfigManager:
             self.reset_to_defaults()
             return False
     
+    def apply_config(self, config: Dict[str, Any]) -> List[str]:
+        """
+        应用新的配置文件内容（如文件被外部修改），只替换内容有变化的配置段，不写入文件
+        
+        Args:
+            config: 配置文件内容
+            
+        Returns:
+            List: 内容有变化的配置段名称
+        """
+        changes = self._set_model(self._build_model(config))
+        return [change.section for change in changes]
+    
     def save_config(self, shortcuts: List[Dict] = None, 
                     alt_shortcuts: List[Dict] = None,
                     ctrl_alt_shortcuts: List[Dict] = None,
@@ -67,7 +204,7 @@ class ConfigManager:
                     appearance: Dict = None,
                     effects: Dict = None) -> bool:
         """
-        保存配置到文件
+        保存配置到文件，文件由后台线程合并写入，调用立即返回
         
         Args:
             shortcuts: Ctrl快捷键列表
@@ -81,49 +218,48 @@ class ConfigManager:
             bool: 保存成功返回True，失败返回False
         """
         try:
-            # 更新配置
-            if shortcuts is not None:
-                self.shortcut_items = shortcuts
-            if alt_shortcuts is not None:
-                self.alt_shortcut_items = alt_shortcuts
-            if ctrl_alt_shortcuts is not None:
-                self.ctrl_alt_shortcut_items = ctrl_alt_shortcuts
-            if win_shortcuts is not None:
-                self.win_shortcut_items = win_shortcuts
-            if appearance is not None:
-                self.appearance = appearance
-            if effects is not None:
-                self.effects = effects
-                
-            # 构建配置字典
-            config = {
-                'shortcuts': self.shortcut_items,
-                'alt_shortcuts': self.alt_shortcut_items,
-                'ctrl_alt_shortcuts': self.ctrl_alt_shortcut_items,
-                'win_shortcuts': self.win_shortcut_items,
-                'appearance': self.appearance,
-                'effects': self.effects
+            # 在当前配置上应用修改，经过校验后得到新的配置模型
+            config = self.get_config()
+            updates = {
+                'shortcuts': shortcuts,
+                'alt_shortcuts': alt_shortcuts,
+                'ctrl_alt_shortcuts': ctrl_alt_shortcuts,
+                'win_shortcuts': win_shortcuts,
+                'appearance': appearance,
+                'effects': effects
             }
+            for name, value in updates.items():
+                if value is not None:
+                    config[name] = value
+            config['schema_version'] = SCHEMA_VERSION
+            
+            self._set_model(self._build_model(config))
             
-            # 保存到文件
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            # 交给后台线程写入
+            self.writer.schedule(self.model.to_dict())
                 
-            print("配置文件保存成功")
+            print("配置已保存")
             return True
             
         except Exception as e:
             print(f"保存配置文件时出错: {e}")
             return False
     
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        等待后台写入完成
+        
+        Args:
+            timeout: 最长等待时间（秒）
+            
+        Returns:
+            bool: 写入完成返回True，超时返回False
+        """
+        return self.writer.flush(timeout)
+    
     def reset_to_defaults(self):
         """重置所有配置为默认值"""
-        self.shortcut_items = DEFAULT_SHORTCUT_ITEMS.copy()
-        self.alt_shortcut_items = DEFAULT_ALT_SHORTCUT_ITEMS.copy()
-        self.ctrl_alt_shortcut_items = DEFAULT_CTRL_ALT_SHORTCUT_ITEMS.copy()
-        self.win_shortcut_items = DEFAULT_WIN_SHORTCUT_ITEMS.copy()
-        self.appearance = DEFAULT_APPEARANCE.copy()
-        self.effects = DEFAULT_EFFECTS.copy()
+        self._set_model(AppConfig.defaults())
     
     def get_config(self) -> Dict[str, Any]:
         """
@@ -144,35 +280,42 @@ class ConfigManager:
 # 创建全局配置管理器实例
 _config_manager = ConfigManager()
 
-# 为了向后兼容，创建全局变量
-SHORTCUT_ITEMS = []
-ALT_SHORTCUT_ITEMS = []
-CTRL_ALT_SHORTCUT_ITEMS = []
-WIN_SHORTCUT_ITEMS = []
-APPEARANCE = {}
-EFFECTS = {}
+# 为了向后兼容，创建全局变量（程序内部通过 get_* 函数和变更通知读取配置，不再使用这些变量）
+SHORTCUT_ITEMS = list(_config_manager.shortcut_items)
+ALT_SHORTCUT_ITEMS = list(_config_manager.alt_shortcut_items)
+CTRL_ALT_SHORTCUT_ITEMS = list(_config_manager.ctrl_alt_shortcut_items)
+WIN_SHORTCUT_ITEMS = list(_config_manager.win_shortcut_items)
+APPEARANCE = dict(_config_manager.appearance)
+EFFECTS = dict(_config_manager.effects)
 
-def _update_global_vars():
-    """更新全局变量"""
-    global SHORTCUT_ITEMS, ALT_SHORTCUT_ITEMS, CTRL_ALT_SHORTCUT_ITEMS
-    global WIN_SHORTCUT_ITEMS, APPEARANCE, EFFECTS
-    
-    SHORTCUT_ITEMS[:] = _config_manager.shortcut_items
-    ALT_SHORTCUT_ITEMS[:] = _config_manager.alt_shortcut_items
-    CTRL_ALT_SHORTCUT_ITEMS[:] = _config_manager.ctrl_alt_shortcut_items
-    WIN_SHORTCUT_ITEMS[:] = _config_manager.win_shortcut_items
-    APPEARANCE.clear()
-    APPEARANCE.update(_config_manager.appearance)
-    EFFECTS.clear()
-    EFFECTS.update(_config_manager.effects)
+# 配置段名称 -> 全局变量
+_GLOBAL_VARS = {
+    'shortcuts': SHORTCUT_ITEMS,
+    'alt_shortcuts': ALT_SHORTCUT_ITEMS,
+    'ctrl_alt_shortcuts': CTRL_ALT_SHORTCUT_ITEMS,
+    'win_shortcuts': WIN_SHORTCUT_ITEMS,
+    'appearance': APPEARANCE,
+    'effects': EFFECTS,
+}
+
+def _update_global_vars(changes: List[ConfigChange]):
+    """只更新有变化的配置段对应的全局变量（原地修改，已导入的引用保持有效）"""
+    for change in changes:
+        target = _GLOBAL_VARS[change.section]
+        value = getattr(_config_manager, ConfigManager.SECTION_ATTRIBUTES[change.section])
+        if isinstance(target, list):
+            target[:] = value
+        else:
+            target.clear()
+            target.update(value)
+
+# 最先订阅，其他订阅者收到通知时全局变量已是新值
+_config_manager.events.subscribe(_update_global_vars)
 
 # 为了向后兼容，提供函数接口
 def load_config() -> bool:
     """加载配置文件"""
-    result = _config_manager.load_config()
-    if result:
-        _update_global_vars()
-    return result
+    return _config_manager.load_config()
 
 def save_config(shortcuts: List[Dict] = None, 
                 alt_shortcuts: List[Dict] = None,
@@ -181,23 +324,51 @@ def save_config(shortcuts: List[Dict] = None,
                 appearance: Dict = None,
                 effects: Dict = None) -> bool:
     """保存配置到文件"""
-    result = _config_manager.save_config(
+    return _config_manager.save_config(
         shortcuts, alt_shortcuts, ctrl_alt_shortcuts, 
         win_shortcuts, appearance, effects
     )
-    if result:
-        _update_global_vars()
-    return result
 
 def reset_to_defaults():
     """重置所有配置为默认值"""
     _config_manager.reset_to_defaults()
-    _update_global_vars()
 
 def get_config() -> Dict[str, Any]:
     """获取当前配置"""
     return _config_manager.get_config()
 
+def reload_config(config: Dict[str, Any]) -> List[str]:
+    """应用新的配置文件内容，返回有变化的配置段名称"""
+    return _config_manager.apply_config(config)
+
+def subscribe_config_changes(callback: ChangeCallback, sections: Optional[Iterable[str]] = None):
+    """订阅配置变化，sections 为关心的配置段名称，None表示全部"""
+    _config_manager.events.subscribe(callback, sections)
+
+def unsubscribe_config_changes(callback: ChangeCallback):
+    """取消订阅配置变化"""
+    _config_manager.events.unsubscribe(callback)
+
+def get_config_event_stats() -> Dict[str, int]:
+    """获取配置变更通知统计信息"""
+    return _config_manager.events.get_stats()
+
+def flush_config(timeout: float = 5.0) -> bool:
+    """等待后台写入配置文件完成"""
+    return _config_manager.flush(timeout)
+
+def is_config_write_pending() -> bool:
+    """是否有尚未写入配置文件的保存"""
+    return _config_manager.writer.is_pending()
+
+def get_config_write_stats() -> Dict[str, Any]:
+    """获取配置文件写入统计信息"""
+    return _config_manager.writer.get_stats()
+
+def get_config_cache_stats() -> Dict[str, Any]:
+    """获取配置缓存统计信息"""
+    return _config_manager.cache.get_stats()
+
 
 
 # 为了向后兼容，也提供直接访问方式
@@ -219,9 +390,17 @@ def get_appearance():
 def get_effects():
     return _config_manager.effects
 
+def get_appearance_model() -> Appearance:
+    """获取已校验的外观配置"""
+    return _config_manager.model.appearance
+
+def get_effects_model() -> Effects:
+    """获取已校验的效果配置"""
+    return _config_manager.model.effects
+
 def validate_config(config: Dict[str, Any]) -> bool:
     """
-    验证配置的有效性
+    验证配置的有效性（加载时已由配置模型校验并纠正，这里只报告是否有问题）
     
     Args:
         config: 要验证的配置字典
@@ -231,27 +410,12 @@ def validate_config(config: Dict[str, Any]) -> bool:
     """
     try:
         # 检查必需的键
-        required_keys = ['shortcuts', 'alt_shortcuts', 'ctrl_alt_shortcuts', 
-                        'win_shortcuts', 'appearance', 'effects']
-        
-        for key in required_keys:
-            if key not in config:
-                return False
-                
-        # 检查快捷键列表格式
-        for shortcut_list in [config['shortcuts'], config['alt_shortcuts'], 
-                             config['ctrl_alt_shortcuts'], config['win_shortcuts']]:
-            if not isinstance(shortcut_list, list):
-                return False
-            for item in shortcut_list:
-                if not isinstance(item, dict) or 'key' not in item or 'action' not in item:
-                    return False
-                    
-        # 检查外观和效果配置
-        if not isinstance(config['appearance'], dict) or not isinstance(config['effects'], dict):
+        if not isinstance(config, dict) or any(name not in config for name in SECTION_NAMES):
             return False
-            
-        return True
+        
+        problems: List[str] = []
+        AppConfig.from_dict(config, problems)
+        return not problems
         
     except Exception:
-        return False 
\ No newline at end of file
+        return False
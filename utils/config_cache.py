@@ -0,0 +1,195 @@
+"""
+配置缓存模块 - 将校验后的配置以 marshal 格式保存在配置文件旁，启动时配置文件未变化则直接读取缓存
+
+缓存包含两部分：头部（格式版本、配置结构版本、Python版本、配置文件的修改时间、大小和内容哈希）
+和校验后的配置，头部前以4字节记录其长度，缓存失效时不必反序列化配置部分。
+配置文件的修改时间和大小与头部一致时直接使用缓存，不一致时计算配置文件的哈希，
+内容未变化（如复制或检出导致修改时间变化）仍使用缓存并更新头部，否则回退到读取JSON。
+缓存损坏或版本不符时同样回退，读取JSON后重新生成缓存。
+"""
+
+import hashlib
+import marshal
+import os
+import struct
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+# 缓存文件的后缀
+CACHE_SUFFIX = ".cache"
+TEMP_SUFFIX = ".tmp"
+
+# 缓存格式标识和版本，缓存内容的结构变化时增加版本
+CACHE_MAGIC = "ctrl-hint-config-cache"
+CACHE_FORMAT = 1
+
+# 头部长度的编码
+_LENGTH = struct.Struct("<I")
+
+# 配置文件的签名: (修改时间纳秒, 文件大小)
+FileSignature = Tuple[int, int]
+
+
+def file_digest(data: bytes) -> bytes:
+    """
+    计算配置文件内容的哈希
+
+    Args:
+        data: 配置文件内容
+
+    Returns:
+        bytes: 哈希值
+    """
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def signature_of(stat: os.stat_result) -> FileSignature:
+    """由文件状态得到签名"""
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ConfigCache:
+    """配置文件的二进制缓存"""
+
+    def __init__(self, path: str, schema_version: int, enabled: bool = True):
+        """
+        初始化缓存
+
+        Args:
+            path: 配置文件路径，缓存保存在同目录下加 .cache 后缀的文件中
+            schema_version: 当前配置结构版本，版本不同的缓存视为失效
+            enabled: 是否启用缓存，关闭时 load 总是返回None，store 不写入
+        """
+        self.path = path
+        self.schema_version = schema_version
+        self.enabled = enabled
+        # 加载时和后台写入器都可能保存缓存
+        self._lock = threading.Lock()
+
+        # 统计信息
+        self.hit_count = 0          # 直接使用缓存的次数
+        self.rehash_count = 0       # 修改时间变化但内容未变、仍使用缓存的次数
+        self.miss_count = 0         # 缓存不存在或已失效的次数
+        self.error_count = 0        # 缓存损坏无法读取的次数
+        self.store_count = 0        # 生成缓存的次数
+        self.last_load_ms = 0.0     # 最近一次读取缓存的耗时
+
+    @property
+    def cache_path(self) -> str:
+        """缓存文件路径"""
+        return self.path + CACHE_SUFFIX
+
+    def _header(self, signature: FileSignature, digest: bytes) -> tuple:
+        """生成缓存头部"""
+        return (CACHE_MAGIC, CACHE_FORMAT, self.schema_version, sys.version_info[:2]) + signature + (digest,)
+
+    def _is_compatible(self, header: Any) -> bool:
+        """检查缓存头部的格式、结构版本和Python版本是否与当前一致"""
+        return (isinstance(header, tuple) and len(header) == 7
+                and header[:4] == (CACHE_MAGIC, CACHE_FORMAT, self.schema_version, sys.version_info[:2]))
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        读取缓存的配置
+
+        Returns:
+            Optional[Dict]: 配置文件未变化时返回校验后的配置（AppConfig.to_dict 的结果），
+                否则返回None，调用方应读取配置文件并调用 store 重新生成缓存
+        """
+        if not self.enabled:
+            return None
+
+        started = time.perf_counter()
+        try:
+            stat = os.stat(self.path)
+            # 一次读入整个缓存再反序列化，marshal.load 直接读文件时逐段读取，反而比解析JSON慢
+            with open(self.cache_path, 'rb') as f:
+                data = memoryview(f.read())
+
+            (header_length,) = _LENGTH.unpack_from(data)
+            payload_start = _LENGTH.size + header_length
+            header = marshal.loads(data[_LENGTH.size:payload_start])
+            if not self._is_compatible(header):
+                self.miss_count += 1
+                return None
+
+            signature = signature_of(stat)
+            rehashed = False
+            if header[4:6] != signature:
+                # 修改时间或大小变化，比较内容哈希
+                with open(self.path, 'rb') as config_file:
+                    if file_digest(config_file.read()) != header[6]:
+                        self.miss_count += 1
+                        return None
+                rehashed = True
+
+            config = marshal.loads(data[payload_start:])
+            if not isinstance(config, dict):
+                raise ValueError("缓存内容不是对象")
+
+        except FileNotFoundError:
+            self.miss_count += 1
+            return None
+        except (OSError, EOFError, ValueError, TypeError, struct.error) as e:
+            self.error_count += 1
+            print(f"配置缓存无法读取（{e}），改为读取配置文件")
+            return None
+
+        if rehashed:
+            # 内容未变，按新的修改时间更新缓存头部
+            self.rehash_count += 1
+            self.store(config, signature, header[6])
+        else:
+            self.hit_count += 1
+        self.last_load_ms = (time.perf_counter() - started) * 1000
+        return config
+
+    def store(self, config: Dict[str, Any], signature: FileSignature, digest: bytes):
+        """
+        保存校验后的配置，以原子方式替换缓存文件，失败时只打印错误
+
+        Args:
+            config: 校验后的配置（AppConfig.to_dict 的结果）
+            signature: 生成该配置的配置文件的签名
+            digest: 生成该配置的配置文件内容的哈希
+        """
+        if not self.enabled:
+            return
+
+        temp_path = self.cache_path + TEMP_SUFFIX
+        with self._lock:
+            try:
+                header = marshal.dumps(self._header(signature, digest))
+                with open(temp_path, 'wb') as f:
+                    f.write(_LENGTH.pack(len(header)))
+                    f.write(header)
+                    f.write(marshal.dumps(config))
+                os.replace(temp_path, self.cache_path)
+                self.store_count += 1
+            except (OSError, ValueError) as e:
+                # 缓存只用于加速启动，写入失败不影响使用
+                print(f"保存配置缓存时出错: {e}")
+                try:
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+                except OSError:
+                    pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取缓存统计信息
+
+        Returns:
+            Dict: 统计信息字典
+        """
+        return {
+            "enabled": self.enabled,
+            "hits": self.hit_count,
+            "rehashes": self.rehash_count,
+            "misses": self.miss_count,
+            "errors": self.error_count,
+            "stores": self.store_count,
+            "last_load_ms": round(self.last_load_ms, 2),
+        }
@@ -0,0 +1,161 @@
+"""
+配置变更通知模块 - 配置模型被替换时比较新旧配置，按配置段和字段通知订阅者
+
+订阅者只接收关心的配置段的变化：只改了一个颜色时提示窗口只重新应用样式表，
+不重新布局卡片；修改Win组快捷键时不会刷新Ctrl组的窗口。
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from .config_model import AppConfig, SECTION_NAMES, SHORTCUT_SECTIONS
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigChange:
+    """一个配置段的变化"""
+    section: str
+    # 外观和效果段中变化的字段名称，快捷键段为空（整个列表视为一项）
+    fields: FrozenSet[str] = frozenset()
+
+    def touches(self, names: Iterable[str]) -> bool:
+        """
+        检查指定字段中是否有变化的字段
+
+        Args:
+            names: 字段名称
+
+        Returns:
+            bool: 任一字段变化返回True，否则返回False
+        """
+        return not self.fields.isdisjoint(names)
+
+
+# 订阅者回调，参数为订阅的配置段中发生的变化
+ChangeCallback = Callable[[List[ConfigChange]], None]
+
+
+def _changed_fields(before: Any, after: Any) -> FrozenSet[str]:
+    """比较外观或效果配置，返回值不同的字段名称（效果配置的附加键按键名比较）"""
+    changed = {
+        item.name for item in fields(before)
+        if item.name != "extra" and getattr(before, item.name) != getattr(after, item.name)
+    }
+    extra_before = getattr(before, "extra", {})
+    extra_after = getattr(after, "extra", {})
+    changed.update(
+        key for key in extra_before.keys() | extra_after.keys()
+        if extra_before.get(key) != extra_after.get(key)
+    )
+    return frozenset(changed)
+
+
+def diff_configs(old: AppConfig, new: AppConfig) -> List[ConfigChange]:
+    """
+    比较两份配置
+
+    Args:
+        old: 原配置
+        new: 新配置
+
+    Returns:
+        List: 各配置段的变化，按配置文件中的顺序，没有变化的配置段不包含在内
+    """
+    changes: List[ConfigChange] = []
+    for section in SECTION_NAMES:
+        before, after = getattr(old, section), getattr(new, section)
+        if section in SHORTCUT_SECTIONS:
+            if before != after:
+                changes.append(ConfigChange(section))
+        else:
+            changed = _changed_fields(before, after)
+            if changed:
+                changes.append(ConfigChange(section, changed))
+    return changes
+
+
+class ConfigEvents:
+    """配置变更通知，按订阅顺序在修改配置的线程（界面线程）中同步调用订阅者"""
+
+    def __init__(self):
+        # 回调 -> 订阅的配置段，None表示全部
+        self._subscribers: Dict[ChangeCallback, Optional[FrozenSet[str]]] = {}
+
+        # 统计信息
+        self.publish_count = 0    # 发布变化的次数
+        self.delivery_count = 0   # 调用订阅者的次数
+        self.error_count = 0      # 订阅者出错的次数
+
+    def subscribe(self, callback: ChangeCallback, sections: Optional[Iterable[str]] = None):
+        """
+        订阅配置变化
+
+        Args:
+            callback: 回调，参数为订阅的配置段中发生的变化
+            sections: 订阅的配置段名称，None表示全部
+        """
+        self._subscribers[callback] = None if sections is None else frozenset(sections)
+
+    def unsubscribe(self, callback: ChangeCallback):
+        """
+        取消订阅
+
+        Args:
+            callback: 订阅时传入的回调
+        """
+        self._subscribers.pop(callback, None)
+
+    def is_subscribed(self, callback: ChangeCallback) -> bool:
+        """
+        检查回调是否已订阅
+
+        Args:
+            callback: 回调
+
+        Returns:
+            bool: 已订阅返回True，否则返回False
+        """
+        return callback in self._subscribers
+
+    def publish(self, changes: List[ConfigChange]):
+        """
+        通知订阅者，没有订阅的配置段发生变化的订阅者不会被调用
+
+        Args:
+            changes: 各配置段的变化
+        """
+        if not changes:
+            return
+        self.publish_count += 1
+
+        for callback, sections in list(self._subscribers.items()):
+            # 前面的订阅者可能取消了后面的订阅
+            if callback not in self._subscribers:
+                continue
+            relevant = changes if sections is None else [change for change in changes if change.section in sections]
+            if not relevant:
+                continue
+
+            self.delivery_count += 1
+            try:
+                callback(relevant)
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except Exception as e:
+                # 一个订阅者出错不影响其他订阅者
+                self.error_count += 1
+                print(f"处理配置变化时出错: {e}")
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        获取通知统计信息
+
+        Returns:
+            Dict: 统计信息字典
+        """
+        return {
+            "subscribers": len(self._subscribers),
+            "published": self.publish_count,
+            "delivered": self.delivery_count,
+            "errors": self.error_count,
+        }
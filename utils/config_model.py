@@ -0,0 +1,402 @@
+"""
+配置模型模块 - 带类型的配置对象，加载时一次性完成版本迁移、类型纠正和取值校验
+
+组件直接读取已校验的属性（如 get_effects_model().snapshot_mode），不必每次 .get(key, default)。
+配置文件仍是原来的JSON结构，另加 schema_version 字段记录结构版本。
+"""
+
+import re
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .constants import (
+    DEFAULT_SHORTCUT_ITEMS, DEFAULT_ALT_SHORTCUT_ITEMS,
+    DEFAULT_CTRL_ALT_SHORTCUT_ITEMS, DEFAULT_WIN_SHORTCUT_ITEMS,
+    DEFAULT_APPEARANCE, DEFAULT_EFFECTS
+)
+
+# 当前配置结构版本
+# 1: 没有 schema_version 字段的原始结构，效果配置混用两套键名
+# 2: 效果配置统一使用 enable_* 键名
+SCHEMA_VERSION = 2
+
+# 快捷键配置段 -> 默认快捷键列表
+SHORTCUT_SECTIONS = {
+    "shortcuts": DEFAULT_SHORTCUT_ITEMS,
+    "alt_shortcuts": DEFAULT_ALT_SHORTCUT_ITEMS,
+    "ctrl_alt_shortcuts": DEFAULT_CTRL_ALT_SHORTCUT_ITEMS,
+    "win_shortcuts": DEFAULT_WIN_SHORTCUT_ITEMS,
+}
+
+# 旧的效果键名 -> 统一后的键名
+LEGACY_EFFECT_KEYS = {
+    "animation_enabled": "enable_animation",
+    "blur_enabled": "enable_blur",
+    "shadow_enabled": "enable_shadow",
+}
+
+# 可选值
+ANIMATION_SPEEDS = ("slow", "medium", "fast")
+PLACEMENT_SCREENS = ("cursor", "primary")
+
+# 整数设置的取值范围，与设置对话框的输入范围一致
+VALUE_RANGES = {
+    "card_size": (60, 150),
+    "key_font_size": (12, 48),
+    "action_font_size": (8, 24),
+    "background_opacity": (10, 100),
+    "fade_duration": (0, 5000),
+    "slide_duration": (0, 5000),
+    "show_delay": (0, 2000),
+    "window_idle_release": (0, 86400),
+    "max_rows": (0, 50),
+}
+
+# 取值只能是固定几项的设置
+VALUE_CHOICES = {
+    "animation_speed": ANIMATION_SPEEDS,
+    "placement_screen": PLACEMENT_SCREENS,
+}
+
+_COLOR_PATTERN = re.compile(r"^#[0-9a-fA-F]{6}$")
+
+
+def _coerce(name: str, value: Any, default: Any, problems: List[str]) -> Any:
+    """
+    按默认值的类型纠正一项设置，无法纠正时使用默认值并记录问题
+
+    Args:
+        name: 设置名称
+        value: 配置文件中的值
+        default: 默认值
+        problems: 问题列表
+
+    Returns:
+        Any: 纠正后的值
+    """
+    try:
+        if isinstance(default, bool):
+            if isinstance(value, bool):
+                return value
+            if isinstance(value, (int, float)) and value in (0, 1):
+                return bool(value)
+            raise ValueError(value)
+
+        if isinstance(default, int):
+            if isinstance(value, bool):
+                raise ValueError(value)
+            result = int(value)
+            low, high = VALUE_RANGES.get(name, (None, None))
+            if low is not None and not low <= result <= high:
+                problems.append(f"{name} 超出范围 {low}-{high}: {result}")
+                result = min(max(result, low), high)
+            return result
+
+        if isinstance(default, str):
+            if not isinstance(value, str):
+                raise ValueError(value)
+            choices = VALUE_CHOICES.get(name)
+            if choices is not None and value not in choices:
+                raise ValueError(value)
+            if name.endswith("_color") or name.startswith("card_bg_color"):
+                if not _COLOR_PATTERN.match(value):
+                    raise ValueError(value)
+            return value
+
+        return value
+
+    except (TypeError, ValueError):
+        problems.append(f"{name} 的值无效: {value!r}，使用默认值 {default!r}")
+        return default
+
+
+def _fields_from_dict(cls, data: Any, problems: List[str], section: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    按数据类的字段从字典中取值并纠正
+
+    Returns:
+        Tuple: (字段名 -> 值, 未知的键 -> 值)
+    """
+    if not isinstance(data, dict):
+        problems.append(f"{section} 不是对象，使用默认值")
+        data = {}
+
+    values: Dict[str, Any] = {}
+    defaults = cls()
+    for item in fields(cls):
+        if item.name == "extra":
+            continue
+        default = getattr(defaults, item.name)
+        if item.name in data:
+            values[item.name] = _coerce(item.name, data[item.name], default, problems)
+
+    known = {item.name for item in fields(cls)}
+    extra = {key: value for key, value in data.items() if key not in known}
+    return values, extra
+
+
+@dataclass(slots=True)
+class ShortcutItem:
+    """一条快捷键提示"""
+    key: str
+    action: str
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"key": self.key, "action": self.action}
+
+
+@dataclass(slots=True)
+class Appearance:
+    """外观配置"""
+    card_size: int = DEFAULT_APPEARANCE["card_size"]
+    key_font_size: int = DEFAULT_APPEARANCE["key_font_size"]
+    action_font_size: int = DEFAULT_APPEARANCE["action_font_size"]
+    background_opacity: int = DEFAULT_APPEARANCE["background_opacity"]
+    key_color: str = DEFAULT_APPEARANCE["key_color"]
+    action_color: str = DEFAULT_APPEARANCE["action_color"]
+    card_bg_color_start: str = DEFAULT_APPEARANCE["card_bg_color_start"]
+    card_bg_color_end: str = DEFAULT_APPEARANCE["card_bg_color_end"]
+
+    @classmethod
+    def from_dict(cls, data: Any, problems: Optional[List[str]] = None) -> "Appearance":
+        """
+        从字典创建外观配置，缺少的项使用默认值，未知的键忽略
+
+        Args:
+            data: 外观配置字典
+            problems: 用于收集校验问题的列表
+
+        Returns:
+            Appearance: 外观配置
+        """
+        values, _ = _fields_from_dict(cls, data, problems if problems is not None else [], "appearance")
+        return cls(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {item.name: getattr(self, item.name) for item in fields(self)}
+
+
+@dataclass(slots=True)
+class Effects:
+    """效果配置"""
+    enable_animation: bool = DEFAULT_EFFECTS["enable_animation"]
+    enable_shadow: bool = DEFAULT_EFFECTS["enable_shadow"]
+    enable_blur: bool = DEFAULT_EFFECTS["enable_blur"]
+    animation_speed: str = DEFAULT_EFFECTS["animation_speed"]
+    fade_duration: int = DEFAULT_EFFECTS["fade_duration"]
+    slide_duration: int = DEFAULT_EFFECTS["slide_duration"]
+    show_delay: int = DEFAULT_EFFECTS["show_delay"]
+    window_idle_release: int = DEFAULT_EFFECTS["window_idle_release"]
+    prewarm_windows: bool = DEFAULT_EFFECTS["prewarm_windows"]
+    shared_window: bool = DEFAULT_EFFECTS["shared_window"]
+    cached_card_background: bool = DEFAULT_EFFECTS["cached_card_background"]
+    snapshot_mode: bool = DEFAULT_EFFECTS["snapshot_mode"]
+    placement_screen: str = DEFAULT_EFFECTS["placement_screen"]
+    paginate: bool = DEFAULT_EFFECTS["paginate"]
+    max_rows: int = DEFAULT_EFFECTS["max_rows"]
+    # 模型之外的键（如设置对话框保存的 show_on_press）原样保留
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Any, problems: Optional[List[str]] = None) -> "Effects":
+        """
+        从字典创建效果配置，旧键名转换为统一键名（同时存在时以新键名为准），缺少的项使用默认值
+
+        Args:
+            data: 效果配置字典
+            problems: 用于收集校验问题的列表
+
+        Returns:
+            Effects: 效果配置
+        """
+        data = migrate_effect_keys(data) if isinstance(data, dict) else data
+        values, extra = _fields_from_dict(cls, data, problems if problems is not None else [], "effects")
+        return cls(extra=extra, **values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {item.name: getattr(self, item.name) for item in fields(self) if item.name != "extra"}
+        result.update(self.extra)
+        return result
+
+
+def _shortcuts_from_list(data: Any, default: List[Dict], problems: List[str], section: str) -> List[ShortcutItem]:
+    """从列表创建快捷键，格式错误的条目跳过"""
+    if not isinstance(data, list):
+        problems.append(f"{section} 不是列表，使用默认快捷键")
+        data = default
+
+    items = []
+    for entry in data:
+        if isinstance(entry, dict) and isinstance(entry.get("key"), str) and isinstance(entry.get("action"), str):
+            items.append(ShortcutItem(entry["key"], entry["action"]))
+        else:
+            problems.append(f"{section} 中的条目格式错误，已跳过: {entry!r}")
+    return items
+
+
+@dataclass(slots=True)
+class AppConfig:
+    """完整的应用配置"""
+    shortcuts: List[ShortcutItem] = field(default_factory=list)
+    alt_shortcuts: List[ShortcutItem] = field(default_factory=list)
+    ctrl_alt_shortcuts: List[ShortcutItem] = field(default_factory=list)
+    win_shortcuts: List[ShortcutItem] = field(default_factory=list)
+    appearance: Appearance = field(default_factory=Appearance)
+    effects: Effects = field(default_factory=Effects)
+    schema_version: int = SCHEMA_VERSION
+
+    @classmethod
+    def defaults(cls) -> "AppConfig":
+        """
+        获取默认配置
+
+        Returns:
+            AppConfig: 默认配置
+        """
+        return cls.from_dict({"schema_version": SCHEMA_VERSION})
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any], problems: Optional[List[str]] = None) -> "AppConfig":
+        """
+        从配置文件内容创建配置：先迁移到当前结构版本，再纠正各项的类型和取值
+
+        Args:
+            raw: 配置文件内容
+            problems: 用于收集校验问题的列表
+
+        Returns:
+            AppConfig: 配置
+        """
+        problems = problems if problems is not None else []
+        raw = migrate(raw)
+
+        config = cls(
+            appearance=Appearance.from_dict(raw.get("appearance", DEFAULT_APPEARANCE), problems),
+            effects=Effects.from_dict(raw.get("effects", DEFAULT_EFFECTS), problems),
+            schema_version=raw["schema_version"],
+        )
+        for section, default in SHORTCUT_SECTIONS.items():
+            setattr(config, section, _shortcuts_from_list(raw.get(section, default), default, problems, section))
+        return config
+
+    @classmethod
+    def from_validated(cls, data: Dict[str, Any]) -> "AppConfig":
+        """
+        从已校验配置的 to_dict 结果（如配置缓存）直接创建，跳过迁移和校验
+
+        Args:
+            data: to_dict 的结果
+
+        Returns:
+            AppConfig: 配置
+        """
+        effect_names = {item.name for item in fields(Effects)} - {"extra"}
+        effects = {key: value for key, value in data["effects"].items() if key in effect_names}
+        extra = {key: value for key, value in data["effects"].items() if key not in effect_names}
+
+        config = cls(
+            appearance=Appearance(**data["appearance"]),
+            effects=Effects(extra=extra, **effects),
+            schema_version=data["schema_version"],
+        )
+        for section in SHORTCUT_SECTIONS:
+            setattr(config, section, [ShortcutItem(item["key"], item["action"]) for item in data[section]])
+        return config
+
+    def section_dict(self, section: str) -> Any:
+        """
+        获取一个配置段的字典（或列表）形式
+
+        Args:
+            section: 配置段名称，如 "shortcuts"、"appearance"
+
+        Returns:
+            Any: 快捷键段为字典列表，外观和效果段为字典
+        """
+        value = getattr(self, section)
+        if isinstance(value, list):
+            return [item.to_dict() for item in value]
+        return value.to_dict()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        转换为配置文件内容
+
+        Returns:
+            Dict: 配置文件内容
+        """
+        result: Dict[str, Any] = {"schema_version": self.schema_version}
+        for section in SECTION_NAMES:
+            result[section] = self.section_dict(section)
+        return result
+
+
+# 配置段名称，按配置文件中的顺序
+SECTION_NAMES = tuple(SHORTCUT_SECTIONS) + ("appearance", "effects")
+
+
+def migrate_effect_keys(effects: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    将效果配置中的旧键名转换为统一键名，同时存在时以新键名为准
+
+    Args:
+        effects: 效果配置字典
+
+    Returns:
+        Dict: 转换后的新字典
+    """
+    result = {}
+    for key, value in effects.items():
+        canonical = LEGACY_EFFECT_KEYS.get(key)
+        if canonical is None:
+            result[key] = value
+        elif canonical not in effects:
+            result[canonical] = value
+    return result
+
+
+def _migrate_1_to_2(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """版本1 -> 2：效果配置统一为 enable_* 键名"""
+    effects = raw.get("effects")
+    if isinstance(effects, dict):
+        raw["effects"] = migrate_effect_keys(effects)
+    return raw
+
+
+# 迁移函数: 起始版本 -> 迁移到下一版本的函数
+MIGRATIONS: Dict[int, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    1: _migrate_1_to_2,
+}
+
+
+def schema_version_of(raw: Dict[str, Any]) -> int:
+    """
+    获取配置文件内容的结构版本
+
+    Args:
+        raw: 配置文件内容
+
+    Returns:
+        int: 结构版本，没有 schema_version 字段时为1
+    """
+    version = raw.get("schema_version", 1)
+    return version if isinstance(version, int) and not isinstance(version, bool) else 1
+
+
+def migrate(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    将配置文件内容逐版本迁移到当前结构版本
+
+    Args:
+        raw: 配置文件内容
+
+    Returns:
+        Dict: 迁移后的配置文件内容（新字典）
+    """
+    raw = dict(raw)
+    version = schema_version_of(raw)
+    while version < SCHEMA_VERSION:
+        raw = MIGRATIONS[version](raw)
+        version += 1
+    raw["schema_version"] = max(version, SCHEMA_VERSION)
+    return raw
@@ -0,0 +1,222 @@
+"""
+配置写入模块 - 在后台线程中保存配置文件，合并短时间内的多次保存，并以原子方式替换文件
+
+写入流程：序列化到同目录下的临时文件并刷新到磁盘，将当前配置文件（能正常解析时）复制为备份，
+再用 os.replace 原子替换。写入过程中程序崩溃时，配置文件要么是旧内容要么是新内容，
+不会出现写了一半的文件。替换完成后按新文件重新生成配置缓存，下次启动无需解析JSON。
+"""
+
+import atexit
+import copy
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .config_cache import ConfigCache, file_digest, signature_of
+
+# 备份文件和临时文件的后缀
+BACKUP_SUFFIX = ".bak"
+TEMP_SUFFIX = ".tmp"
+
+
+class ConfigWriter:
+    """配置文件的后台写入器"""
+
+    def __init__(self, path: str, debounce: float = 0.3, keep_backup: bool = True,
+                 cache: Optional[ConfigCache] = None):
+        """
+        初始化写入器
+
+        Args:
+            path: 配置文件路径
+            debounce: 合并保存的等待时间（秒），最后一次保存后等待这么久才写入
+            keep_backup: 是否在替换前保留上一版配置文件
+            cache: 配置缓存，写入后重新生成；保存的配置必须是校验后的配置
+        """
+        self.path = path
+        self.debounce = debounce
+        self.keep_backup = keep_backup
+        self.cache = cache
+
+        # 等待写入的配置，新的保存直接覆盖旧的
+        self._pending: Optional[Dict[str, Any]] = None
+        self._scheduled_at = 0.0
+        self._writing = False
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+        # 统计信息
+        self.scheduled_count = 0   # 请求保存的次数
+        self.write_count = 0       # 实际写入的次数
+        self.failure_count = 0     # 写入失败的次数
+        self.total_ms = 0.0        # 写入总耗时
+        self.last_ms = 0.0         # 最近一次写入耗时
+        self.max_ms = 0.0          # 最长写入耗时
+        self.last_error: Optional[str] = None
+
+        atexit.register(self.flush)
+
+    @property
+    def backup_path(self) -> str:
+        """备份文件路径"""
+        return self.path + BACKUP_SUFFIX
+
+    def schedule(self, config: Dict[str, Any]):
+        """
+        请求保存配置，立即返回，由后台线程在合并等待时间后写入
+
+        Args:
+            config: 要保存的配置，调用时复制一份，之后修改原对象不影响写入内容
+        """
+        snapshot = copy.deepcopy(config)
+        with self._condition:
+            self._pending = snapshot
+            self._scheduled_at = time.monotonic()
+            self.scheduled_count += 1
+            self._ensure_thread()
+            self._condition.notify_all()
+
+    def is_pending(self) -> bool:
+        """
+        检查是否有尚未写入完成的保存
+
+        Returns:
+            bool: 有等待或正在写入的配置返回True，否则返回False
+        """
+        with self._condition:
+            return self._pending is not None or self._writing
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        立即写入等待中的配置并等待写入完成，程序退出时调用
+
+        Args:
+            timeout: 最长等待时间（秒），None表示一直等待
+
+        Returns:
+            bool: 全部写入完成返回True，超时返回False
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            # 取消合并等待，让后台线程立即写入
+            self._scheduled_at = 0.0
+            self._condition.notify_all()
+            while self._pending is not None or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def _ensure_thread(self):
+        """启动后台写入线程（已持有锁）"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="ConfigWriter", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """后台线程：等待保存请求，合并等待结束后写入最新的配置"""
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+
+                # 合并等待时间内不断有新的保存时继续等待
+                while True:
+                    remaining = self._scheduled_at + self.debounce - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                config = self._pending
+                self._pending = None
+                self._writing = True
+
+            try:
+                self._write(config)
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def _write(self, config: Dict[str, Any]):
+        """序列化并以原子方式替换配置文件"""
+        started = time.perf_counter()
+        temp_path = self.path + TEMP_SUFFIX
+        try:
+            # 按字节写入，缓存中的哈希与磁盘上的内容一致
+            data = json.dumps(config, ensure_ascii=False, indent=2).encode('utf-8')
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            # 替换不改变修改时间和大小，临时文件的签名即新配置文件的签名
+            signature = signature_of(os.stat(temp_path))
+
+            # 保留上一版配置，新文件损坏时加载备份；当前文件已损坏时不覆盖原有的备份
+            if self.keep_backup and self._is_valid_config(self.path):
+                shutil.copyfile(self.path, self.backup_path)
+
+            os.replace(temp_path, self.path)
+            self.write_count += 1
+            self.last_error = None
+
+            if self.cache is not None:
+                self.cache.store(config, signature, file_digest(data))
+
+        except Exception as e:
+            self.failure_count += 1
+            self.last_error = str(e)
+            print(f"保存配置文件时出错: {e}")
+            try:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            except OSError:
+                pass
+            return
+
+        elapsed = (time.perf_counter() - started) * 1000
+        self.total_ms += elapsed
+        self.last_ms = elapsed
+        self.max_ms = max(self.max_ms, elapsed)
+
+    @staticmethod
+    def _is_valid_config(path: str) -> bool:
+        """
+        检查文件是否存在且能解析为JSON对象
+
+        Args:
+            path: 文件路径
+
+        Returns:
+            bool: 能解析返回True，否则返回False
+        """
+        try:
+            with open(path, 'rb') as f:
+                return isinstance(json.loads(f.read()), dict)
+        except (OSError, ValueError):
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取写入统计信息
+
+        Returns:
+            Dict: 统计信息字典，包含保存请求数、实际写入数、合并掉的保存数、失败数和写入耗时（毫秒）
+        """
+        writes = self.write_count
+        pending = self._pending is not None or self._writing
+        return {
+            "scheduled": self.scheduled_count,
+            "writes": writes,
+            "coalesced": max(0, self.scheduled_count - writes - self.failure_count - int(pending)),
+            "failures": self.failure_count,
+            "avg_ms": round(self.total_ms / writes, 2) if writes else 0.0,
+            "last_ms": round(self.last_ms, 2),
+            "max_ms": round(self.max_ms, 2),
+            "pending": pending,
+            "last_error": self.last_error,
+        }
@@ -143,16 +143,29 @@ STYLE_PRESETS = {
 
 # 默认效果配置
 DEFAULT_EFFECTS = {
-    "animation_enabled": True,
-    "shadow_enabled": True,
-    "blur_enabled": False,
+    "enable_animation": True,
+    "enable_shadow": True,
+    "enable_blur": False,
+    "animation_speed": "medium",
     "fade_duration": 250,
-    "slide_duration": 300
+    "slide_duration": 300,
+    "show_delay": 250,
+    "window_idle_release": 600,
+    "prewarm_windows": False,
+    "shared_window": False,
+    "cached_card_background": False,
+    "snapshot_mode": False,
+    "placement_screen": "primary",
+    "paginate": False,
+    "max_rows": 3
 }
 
 # 配置文件路径
 CONFIG_FILE = "config.json"
 
+# 是否使用配置缓存（config.json.cache），配置文件未变化时启动直接读取缓存，不解析JSON
+CONFIG_CACHE_ENABLED = True
+
 # 支持的键盘按键映射
 KEYBOARD_KEY_MAPPING = {
     "ctrl_l": "左Ctrl",
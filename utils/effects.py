@@ -0,0 +1,90 @@
+"""
+效果设置模块 - 提供各组件查询动画、阴影等开关的接口
+
+效果配置的键名统一和取值校验由配置模型（config_model.Effects）完成，
+这里的函数直接读取已校验的属性。
+"""
+
+from typing import Any, Dict, Optional
+
+from .config_model import Effects
+
+# 动画速度 -> 时长倍数
+ANIMATION_SPEED_FACTORS = {"slow": 1.5, "medium": 1.0, "fast": 0.6}
+
+
+def normalize_effects(effects: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    规范化效果配置：旧键名转换为统一键名，补全缺失的默认值并纠正取值
+
+    同时存在新旧键名时以新键名为准，未知的键原样保留
+
+    Args:
+        effects: 效果配置（可能使用旧键名）
+
+    Returns:
+        Dict: 规范化后的效果配置
+    """
+    return Effects.from_dict(effects or {}).to_dict()
+
+
+def _current_effects(effects: Optional[Effects]) -> Effects:
+    """未指定时使用当前加载的效果配置"""
+    if effects is not None:
+        return effects
+    from .config import get_effects_model
+    return get_effects_model()
+
+
+def animations_enabled(effects: Optional[Effects] = None) -> bool:
+    """
+    是否启用动画（窗口淡入滑入和烟花效果）
+
+    Args:
+        effects: 效果配置，默认为当前配置
+
+    Returns:
+        bool: 启用返回True，否则返回False
+    """
+    return _current_effects(effects).enable_animation
+
+
+def shadows_enabled(effects: Optional[Effects] = None) -> bool:
+    """
+    是否绘制卡片阴影，关闭动画时阴影也一并关闭以减少渲染开销
+
+    Args:
+        effects: 效果配置，默认为当前配置
+
+    Returns:
+        bool: 启用返回True，否则返回False
+    """
+    effects = _current_effects(effects)
+    return effects.enable_shadow and effects.enable_animation
+
+
+def animation_speed_factor(effects: Optional[Effects] = None) -> float:
+    """
+    获取动画时长倍数
+
+    Args:
+        effects: 效果配置，默认为当前配置
+
+    Returns:
+        float: 时长倍数，慢速大于1，快速小于1
+    """
+    return ANIMATION_SPEED_FACTORS.get(_current_effects(effects).animation_speed, 1.0)
+
+
+def scaled_duration(duration: float, effects: Optional[Effects] = None) -> int:
+    """
+    获取按动画速度缩放后的时长
+
+    Args:
+        duration: 正常速度下的时长（毫秒）
+        effects: 效果配置，默认为当前配置
+
+    Returns:
+        int: 时长（毫秒）
+    """
+    return int(duration * animation_speed_factor(effects))